@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+'''
+Measure how long it takes to import pynwb, and to set up the legacy (NWB 1.x) TypeMap on first use.
+
+Each measurement runs in a fresh interpreter, so modules imported by an earlier run are not reused.
+
+    python benchmarks/import_time.py --repeat 5 --budget 1.5
+
+exits with a non-zero status if the median time of `import pynwb` exceeds the budget (in seconds),
+or if importing pynwb imports any of the modules that should only be imported when they are needed.
+'''
+from __future__ import print_function
+
+import argparse
+import subprocess
+import sys
+
+# modules that are slow to import, and that pynwb only imports when they are needed
+LAZY_MODULES = ('pandas', 'pkg_resources', 'pynwb.legacy.io')
+
+IMPORT = '''
+import sys
+from timeit import default_timer
+start = default_timer()
+import pynwb
+elapsed = default_timer() - start
+print('imported: ' + ' '.join(m for m in %r if m in sys.modules))
+print(elapsed)
+''' % (LAZY_MODULES,)
+
+LEGACY = '''
+import pynwb
+from timeit import default_timer
+start = default_timer()
+pynwb.legacy.get_type_map()
+print(default_timer() - start)
+'''
+
+
+def run(code, env=None):
+    ''' Run the given code in a fresh interpreter, and return the number it prints last '''
+    out = subprocess.check_output([sys.executable, '-c', code], env=env)
+    return float(out.decode('utf-8').strip().splitlines()[-1])
+
+
+def imported_lazy_modules():
+    out = subprocess.check_output([sys.executable, '-c', IMPORT])
+    line = [x for x in out.decode('utf-8').splitlines() if x.startswith('imported:')][-1]
+    return line[len('imported:'):].split()
+
+
+def median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='measure the import time of pynwb')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='the number of times to run each measurement')
+    parser.add_argument('-b', '--budget', type=float, default=None,
+                        help='fail if the median time of importing pynwb exceeds this many seconds')
+    args = parser.parse_args()
+
+    run(IMPORT)     # warm up the OS file cache and the namespace cache
+    results = [('import pynwb', median([run(IMPORT) for i in range(args.repeat)])),
+               ('pynwb.legacy.get_type_map()', median([run(LEGACY) for i in range(args.repeat)]))]
+    for name, seconds in results:
+        print('%-30s %8.3f s' % (name, seconds))
+    failed = False
+    imported = imported_lazy_modules()
+    if imported:
+        print('import pynwb imported %s' % ', '.join(imported))
+        failed = True
+    if args.budget is not None and results[0][1] > args.budget:
+        print('import pynwb took %.3f s, exceeding the budget of %.3f s' % (results[0][1], args.budget))
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+'''
+Measure the startup costs of pynwb, i.e. the time short-lived scripts spend before doing any work:
+
+- importing pynwb, with and without the namespace cache (see the PYNWB_CACHE_DIR environment variable)
+- getting a BuildManager with pynwb.get_manager()
+- opening and closing a small and a large synthetic file with NWBHDF5IO, and reading them
+- loading an extension namespace
+- the time spent in each phase of importing pynwb and creating the legacy TypeMap
+
+First calls are timed in a fresh interpreter, so that nothing loaded by earlier runs gets reused.
+Repeated calls are timed in this interpreter. The phases are taken from a profile of a fresh
+interpreter, so they include the overhead of profiling, and they may be nested in one another,
+e.g. *legacy init* includes the YAML parsing and class registration it triggers.
+
+    python benchmarks/startup.py --repeat 5 --json startup.jsonl
+
+appends the results to startup.jsonl as one JSON record per run, so that they can be tracked over time.
+'''
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import pstats
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import OrderedDict
+from datetime import datetime
+from timeit import default_timer
+
+from import_time import IMPORT, median, run
+
+# the functions each phase is spent in, as (path suffix, function name)
+PHASES = (
+    ('import pynwb', (('/pynwb/__init__.py', '<module>'),)),
+    ('YAML parse', (('/form/spec/namespace.py', '_load'),)),
+    ('namespace cache load', (('/form/spec/namespace.py', '__load_cache'),)),
+    ('spec build', (('/form/spec/namespace.py', '__build_namespace'),)),
+    ('class registration', (('/form/build/map.py', '__register_container_type'),
+                            ('/form/build/map.py', 'register_map'))),
+    ('docval decoration', (('/form/utils.py', 'dec'),)),
+    ('legacy init', (('/pynwb/legacy/__init__.py', 'get_type_map'),)),
+)
+
+PROFILE = '''
+import cProfile
+import sys
+profile = cProfile.Profile()
+profile.enable()
+import pynwb
+pynwb.legacy.get_type_map()
+profile.disable()
+profile.dump_stats(sys.argv[1])
+'''
+
+GET_MANAGER = '''
+import pynwb
+from timeit import default_timer
+start = default_timer()
+pynwb.get_manager(%s)
+print(default_timer() - start)
+'''
+
+OPEN = '''
+import pynwb
+from timeit import default_timer
+start = default_timer()
+io = pynwb.NWBHDF5IO(%r, 'r')
+%s
+io.close()
+print(default_timer() - start)
+'''
+
+
+def get_phases(path, env=None):
+    ''' Profile importing pynwb and creating the legacy TypeMap, and return the time spent in each phase '''
+    subprocess.check_call([sys.executable, '-c', PROFILE, path], env=env)
+    stats = pstats.Stats(path).stats
+    ret = OrderedDict()
+    for phase, funcs in PHASES:
+        ret[phase] = 0.0
+        for (filename, lineno, funcname), (cc, nc, tt, ct, callers) in stats.items():
+            filename = filename.replace(os.sep, '/')
+            if any(funcname == name and filename.endswith(suffix) for suffix, name in funcs):
+                ret[phase] += ct
+    return ret
+
+
+def timed(func, repeat):
+    ''' Call func repeatedly in this interpreter, and return the median time it took '''
+    times = list()
+    for i in range(repeat):
+        start = default_timer()
+        func()
+        times.append(default_timer() - start)
+    return median(times)
+
+
+def write_file(path, n_series, n_samples, n_electrodes):
+    ''' Write a synthetic file with the given number of TimeSeries and electrodes '''
+    import numpy as np
+    from dateutil.tz import tzlocal
+    from pynwb import NWBFile, NWBHDF5IO, TimeSeries
+
+    nwbfile = NWBFile('a synthetic file for benchmarking', os.path.basename(path), datetime.now(tzlocal()))
+    device = nwbfile.create_device('device')
+    group = nwbfile.create_electrode_group('group', 'an electrode group', 'unknown', device)
+    for i in range(n_electrodes):
+        nwbfile.add_electrode(id=i, x=1.0, y=2.0, z=3.0, imp=float(i), location='unknown', filtering='none',
+                              group=group)
+    data = np.arange(n_samples, dtype=np.float64)
+    for i in range(n_series):
+        nwbfile.add_acquisition(TimeSeries('series%d' % i, data, 'unit', starting_time=0.0, rate=1.0))
+    with NWBHDF5IO(path, 'w') as io:
+        io.write(nwbfile)
+
+
+def write_extension(outdir):
+    ''' Write an extension namespace with a few types, and return the path to the namespace file '''
+    from pynwb.spec import NWBNamespaceBuilder, NWBGroupSpec, NWBAttributeSpec, NWBDatasetSpec
+
+    ns_builder = NWBNamespaceBuilder('an extension for benchmarking', 'benchmark')
+    ns_builder.add_spec('benchmark.extensions.yaml',
+                        NWBGroupSpec('an ElectricalSeries for tetrodes',
+                                     attributes=[NWBAttributeSpec('trode_id', 'the tetrode id', 'int')],
+                                     neurodata_type_inc='ElectricalSeries',
+                                     neurodata_type_def='TetrodeSeries'))
+    ns_builder.add_spec('benchmark.extensions.yaml',
+                        NWBGroupSpec('metadata about the lab',
+                                     datasets=[NWBDatasetSpec('the name of the rig', 'text', name='rig')],
+                                     neurodata_type_inc='LabMetaData',
+                                     neurodata_type_def='LabMetaDataExtension'))
+    ns_path = 'benchmark.namespace.yaml'
+    ns_builder.export(ns_path, outdir=outdir)
+    return os.path.join(outdir, ns_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='measure the startup costs of pynwb')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='the number of times to run each measurement')
+    parser.add_argument('-j', '--json', type=str, default=None,
+                        help='append the results to this file as a JSON record')
+    parser.add_argument('-n', '--series', type=int, default=500,
+                        help='the number of TimeSeries to write to the large synthetic file')
+    args = parser.parse_args()
+
+    no_cache_env = dict(os.environ, PYNWB_CACHE_DIR='')
+    results = OrderedDict()
+    phases = OrderedDict()
+    tmpdir = tempfile.mkdtemp()
+    try:
+        run(IMPORT)     # warm up the OS file cache and the namespace cache
+        results['import pynwb'] = median([run(IMPORT) for i in range(args.repeat)])
+        results['import pynwb (no namespace cache)'] = median([run(IMPORT, env=no_cache_env)
+                                                               for i in range(args.repeat)])
+        results['get_manager() (first)'] = median([run(GET_MANAGER % '') for i in range(args.repeat)])
+        phases['namespace cache'] = get_phases(os.path.join(tmpdir, 'cache.prof'))
+        phases['no namespace cache'] = get_phases(os.path.join(tmpdir, 'no_cache.prof'), env=no_cache_env)
+
+        import pynwb
+        small = os.path.join(tmpdir, 'small.nwb')
+        large = os.path.join(tmpdir, 'large.nwb')
+        write_file(small, 1, 1000, 4)
+        write_file(large, args.series, 1000, 1000)
+        ext = write_extension(tmpdir)
+
+        for name, path in (('small', small), ('large', large)):
+            results['NWBHDF5IO open/close, %s file (first)' % name] = median(
+                [run(OPEN % (path, '')) for i in range(args.repeat)])
+            results['NWBHDF5IO open/read/close, %s file (first)' % name] = median(
+                [run(OPEN % (path, 'io.read()')) for i in range(args.repeat)])
+        results['get_manager(extensions) (first)'] = median(
+            [run(GET_MANAGER % ('extensions=%r' % ext)) for i in range(args.repeat)])
+
+        def open_close(path, read):
+            io = pynwb.NWBHDF5IO(path, 'r')
+            if read:
+                io.read()
+            io.close()
+
+        results['get_manager() (repeated)'] = timed(pynwb.get_manager, args.repeat)
+        for name, path in (('small', small), ('large', large)):
+            results['NWBHDF5IO open/close, %s file (repeated)' % name] = timed(
+                lambda: open_close(path, False), args.repeat)
+            results['NWBHDF5IO open/read/close, %s file (repeated)' % name] = timed(
+                lambda: open_close(path, True), args.repeat)
+        results['get_manager(extensions) (repeated)'] = timed(lambda: pynwb.get_manager(extensions=ext), args.repeat)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    for name, seconds in results.items():
+        print('%-50s %8.4f s' % (name, seconds))
+    for name, timings in phases.items():
+        print()
+        print('phases, with %s (profiled)' % name)
+        for phase, seconds in timings.items():
+            print('    %-46s %8.4f s' % (phase, seconds))
+
+    if args.json is not None:
+        record = OrderedDict()
+        record['date'] = datetime.now().isoformat()
+        record['pynwb'] = pynwb.__version__
+        record['python'] = platform.python_version()
+        record['platform'] = platform.platform()
+        record['results'] = results
+        record['phases'] = phases
+        with open(args.json, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,8 @@
 for reading and writing data in NWB format
 '''
 import os.path
-from copy import deepcopy
+import threading
+from copy import copy
 from warnings import warn
 
 import h5py
@@ -10,7 +11,7 @@ import h5py
 CORE_NAMESPACE = 'core'
 
 from .form.spec import NamespaceCatalog  # noqa: E402
-from .form.utils import docval, getargs, popargs, call_docval_func  # noqa: E402
+from .form.utils import docval, getargs, popargs, call_docval_func, WeakIdentityMap  # noqa: E402
 from .form.backends.io import FORMIO  # noqa: E402
 from .form.backends.hdf5 import HDF5IO as _HDF5IO  # noqa: E402
 from .form.validate import ValidatorMap  # noqa: E402
@@ -22,10 +23,10 @@ __core_ns_file_name = 'nwb.namespace.yaml'
 
 
 def __get_resources():
-    from pkg_resources import resource_filename
-    from os.path import join
+    # pynwb is not zip safe, so the schema can be found next to this file. This avoids
+    # importing pkg_resources, which takes longer than loading the cached schema
     ret = dict()
-    ret['namespace_path'] = join(resource_filename(__name__, 'data'), __core_ns_file_name)
+    ret['namespace_path'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', __core_ns_file_name)
     return ret
 
 
@@ -34,6 +35,21 @@ def _get_resources():
     return __get_resources()
 
 
+def _get_cache_dir():
+    '''
+    Get the directory to cache the core namespace in. This is the directory given by the
+    PYNWB_CACHE_DIR environment variable, or a pynwb directory in the user cache directory
+    if it is not set. Returns None if PYNWB_CACHE_DIR is set to an empty string.
+    '''
+    ret = os.environ.get('PYNWB_CACHE_DIR')
+    if ret is None:
+        base = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+        if not base:
+            base = os.path.join(os.path.expanduser('~'), '.cache')
+        ret = os.path.join(base, 'pynwb')
+    return ret or None
+
+
 # a global namespace catalog
 global __NS_CATALOG
 global __TYPE_MAP
@@ -58,12 +74,12 @@ def get_type_map(**kwargs):
     extensions = getargs('extensions', kwargs)
     type_map = None
     if extensions is None:
-        type_map = deepcopy(__TYPE_MAP)
+        type_map = copy(__TYPE_MAP)
     else:
         if isinstance(extensions, TypeMap):
             type_map = extensions
         else:
-            type_map = deepcopy(__TYPE_MAP)
+            type_map = copy(__TYPE_MAP)
         if isinstance(extensions, list):
             for ext in extensions:
                 if isinstance(ext, str):
@@ -94,6 +110,75 @@ def get_manager(**kwargs):
     return BuildManager(type_map)
 
 
+class BuildManagerPool(object):
+    '''
+    A pool of BuildManagers for reading and writing many files with the same extensions.
+
+    The TypeMap for each set of extensions is only loaded once. Released BuildManagers are cleared
+    and handed out again, so that they do not keep the objects of the files they were used for alive
+    e.g.
+
+    .. code-block:: python
+
+        pool = BuildManagerPool()
+        for path in paths:
+            manager = pool.get_manager(extensions)
+            with NWBHDF5IO(path, 'r', manager=manager) as io:
+                ...
+            pool.release(manager)
+    '''
+
+    @docval({'name': 'size', 'type': int,
+             'doc': 'the maximum number of released BuildManagers to keep for each set of extensions', 'default': 4})
+    def __init__(self, **kwargs):
+        self.__size = getargs('size', kwargs)
+        self.__type_maps = dict()   # the TypeMap for each set of extensions
+        self.__idle = dict()        # the released BuildManagers for each set of extensions
+        self.__keys = WeakIdentityMap()    # the set of extensions each BuildManager was created for
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __get_key(extensions):
+        if extensions is None:
+            return tuple()
+        if isinstance(extensions, list):
+            return tuple(extensions)
+        return (extensions,)
+
+    @docval({'name': 'extensions', 'type': (str, TypeMap, list),
+             'doc': 'a path to a namespace, a TypeMap, or a list consisting paths to namespaces and TypeMaps',
+             'default': None},
+            returns='a BuildManager that uses the given extensions', rtype=BuildManager)
+    def get_manager(self, **kwargs):
+        ''' Get a BuildManager from the pool, or create one if none have been released '''
+        extensions = getargs('extensions', kwargs)
+        key = self.__get_key(extensions)
+        with self.__lock:
+            idle = self.__idle.get(key)
+            if idle:
+                return idle.pop()
+            type_map = self.__type_maps.get(key)
+            if type_map is None:
+                type_map = get_type_map(extensions=extensions)
+                self.__type_maps[key] = type_map
+            ret = BuildManager(copy(type_map))
+            self.__keys[ret] = key
+        return ret
+
+    @docval({'name': 'manager', 'type': BuildManager, 'doc': 'a BuildManager returned by get_manager'})
+    def release(self, **kwargs):
+        ''' Clear the given BuildManager and return it to the pool '''
+        manager = getargs('manager', kwargs)
+        with self.__lock:
+            key = self.__keys.get(manager)
+            if key is None:
+                raise ValueError('the BuildManager was not created by this pool')
+            manager.clear()
+            idle = self.__idle.setdefault(key, list())
+            if len(idle) < self.__size and not any(m is manager for m in idle):
+                idle.append(manager)
+
+
 @docval({'name': 'namespace_path', 'type': str,
          'doc': 'the path to the YAML with the namespace definition'},
         returns="the namespaces loaded from the given file", rtype=tuple,
@@ -109,7 +194,7 @@ def load_namespaces(**kwargs):
 # load the core namespace i.e. base NWB specification
 __resources = __get_resources()
 if os.path.exists(__resources['namespace_path']):
-    load_namespaces(__resources['namespace_path'])
+    __TYPE_MAP.load_namespaces(__resources['namespace_path'], cache_dir=_get_cache_dir())
 
 
 def available_namespaces():
@@ -216,7 +301,9 @@ class NWBHDF5IO(_HDF5IO):
             # tm.copy_mappers(get_type_map())
 
             tm = get_type_map()
-            super(NWBHDF5IO, self).load_namespaces(tm, path)
+            if file_obj is None:
+                file_obj = h5py.File(path, mode)
+            super(NWBHDF5IO, self).load_namespaces(tm, path, file=file_obj)
             manager = BuildManager(tm)
         else:
             if manager is not None and extensions is not None:
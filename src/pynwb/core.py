@@ -1,12 +1,16 @@
+from collections import OrderedDict
+from itertools import chain
+
 from h5py import RegionReference
 import numpy as np
-import pandas as pd
 
 from .form.utils import docval, getargs, ExtenderMeta, call_docval_func, popargs, get_docval, fmt_docval_args, pystr
 from .form import Container, Data, DataRegion, get_region_slicer
+from .form.data_utils import ArrayBuffer, DataIO
 
 from . import CORE_NAMESPACE, register_class
-from six import with_metaclass
+from .query import Predicate, HashIndex, SortedIndex, parse
+from six import with_metaclass, raise_from
 
 
 def _not_parent(arg):
@@ -309,23 +313,210 @@ class NWBData(NWBBaseType, Data):
         return self.data[args]
 
     def append(self, arg):
-        if isinstance(self.data, list):
+        if isinstance(self.data, (list, ArrayBuffer)):
             self.data.append(arg)
         elif isinstance(self.data, np.ndarray):
-            self.__data = np.append(self.__data, [arg])
+            self.__data = self.__to_buffer(self.__data)
+            self.__data.append(arg)
         else:
             msg = "NWBData cannot append to object of type '%s'" % type(self.__data)
             raise ValueError(msg)
 
     def extend(self, arg):
-        if isinstance(self.data, list):
+        if isinstance(self.data, (list, ArrayBuffer)):
             self.data.extend(arg)
         elif isinstance(self.data, np.ndarray):
-            self.__data = np.append(self.__data, [arg])
+            self.__data = self.__to_buffer(self.__data)
+            self.__data.extend(arg)
         else:
             msg = "NWBData cannot extend object of type '%s'" % type(self.__data)
             raise ValueError(msg)
 
+    @staticmethod
+    def __to_buffer(data):
+        # copy a 1D array into an ArrayBuffer once, instead of copying it every time a value is added
+        if data.ndim == 1:
+            return ArrayBuffer(data)
+        return ArrayBuffer(list(data))
+
+
+def _buffer_empty_data(kwargs):
+    ''' Store the rows of a new, empty column in an ArrayBuffer, so that adding rows does not copy the column '''
+    data = kwargs.get('data')
+    if isinstance(data, list) and len(data) == 0:
+        kwargs['data'] = ArrayBuffer()
+
+
+def _flatten_vectors(vectors):
+    '''
+    Concatenate a sequence of vectors, and get the end of each vector in the concatenated values.
+    NumPy arrays are concatenated into an array, other vectors into a list.
+    '''
+    ends = np.cumsum(np.fromiter((len(v) for v in vectors), dtype=np.int64, count=len(vectors)))
+    if len(vectors) > 0 and all(isinstance(v, np.ndarray) for v in vectors):
+        values = np.concatenate(vectors)
+    else:
+        values = list(chain.from_iterable(vectors))
+    return ends, values
+
+
+def _get_indices(arg, n):
+    ''' Get the non-negative indices of the rows selected by a slice, a list of indices or a boolean mask '''
+    if isinstance(arg, slice):
+        return np.arange(*arg.indices(n))
+    indices = np.asarray(arg)
+    if indices.dtype == np.bool_:
+        if len(indices) != n:
+            raise IndexError("boolean index of length %d does not match %d rows" % (len(indices), n))
+        return np.flatnonzero(indices)
+    if len(indices) == 0:
+        return indices.astype(np.int64)
+    if not np.issubdtype(indices.dtype, np.integer):
+        raise IndexError("rows can only be selected with integers, slices or boolean masks")
+    indices = np.where(indices < 0, indices + n, indices)
+    if indices.min() < 0 or indices.max() >= n:
+        raise IndexError("index out of range for %d rows" % n)
+    return indices
+
+
+# the number of rows, or bytes for datasets with a fixed-size dtype, between two selected rows of a dataset up to
+# which they are read in one go rather than apart, since each read has an overhead
+_MAX_GAP = 1024
+_MAX_GAP_BYTES = 1 << 20
+
+
+def _max_gap(data):
+    ''' Get the number of rows between two selected rows of a dataset up to which they are read in one go '''
+    dtype = getattr(data, 'dtype', None)
+    if not isinstance(dtype, np.dtype) or dtype.hasobject or dtype.itemsize == 0:
+        return _MAX_GAP
+    return max(_MAX_GAP, _MAX_GAP_BYTES // dtype.itemsize)
+
+
+def _get_rows(data, rows):
+    '''
+    Get the given rows of a dataset, as a slice or an array of indices. Rows of an h5py.Dataset are read in
+    order, and rows that are close together are read in one go, so that the dataset is read as few times
+    as possible without reading much more than is needed.
+    '''
+    if isinstance(rows, slice):
+        return data[rows]
+    if isinstance(data, ArrayBuffer):
+        data = data.data
+    if isinstance(data, (list, tuple)):
+        return [data[i] for i in rows]
+    if isinstance(data, np.ndarray):
+        return data[rows]
+    if len(rows) == 0:
+        return data[0:0]
+    uniq, inverse = np.unique(rows, return_inverse=True)
+    parts = list()
+    for cluster in np.split(uniq, np.flatnonzero(np.diff(uniq) > _max_gap(data)) + 1):
+        span = data[cluster[0]:cluster[-1] + 1]
+        if isinstance(span, list):
+            parts.extend(span[i] for i in cluster - cluster[0])
+        else:
+            parts.append(np.asarray(span)[cluster - cluster[0]])
+    if parts and isinstance(parts[0], np.ndarray):
+        return np.concatenate(parts)[inverse]
+    return [parts[i] for i in inverse]
+
+
+def _factorize(values):
+    ''' Get the distinct values of a column, and the position of the value of each row in them '''
+    if not isinstance(values, np.ndarray):
+        values = np.asarray(values)
+    if values.ndim == 1 and values.dtype.kind in 'iu' and len(values) > 0:
+        low = values.min()
+        offsets = (values - low).astype(np.int64)
+        if offsets.max() < 2 * len(values):
+            # count the values, rather than sort them, if they are integers in a small range
+            present = np.bincount(offsets) > 0
+            positions = np.cumsum(present) - 1
+            return (np.flatnonzero(present) + low).tolist(), positions[offsets]
+    if values.ndim == 1 and values.dtype.kind in 'biufSU':
+        uniques, inverse = np.unique(values, return_inverse=True)
+        return uniques.tolist(), inverse
+    positions = dict()
+    uniques = list()
+    inverse = np.zeros(len(values), dtype=np.int64)
+    for i, value in enumerate(values):
+        pos = positions.get(value)
+        if pos is None:
+            pos = positions[value] = len(uniques)
+            uniques.append(value)
+        inverse[i] = pos
+    return uniques, inverse
+
+
+def _group_rows(columns, groups):
+    '''
+    Get the group of each row, given the values of the columns the rows are grouped by. *groups* maps the key of
+    each group, i.e. the value of the column or the tuple of the values of the columns, to the number of the group,
+    and the groups of keys that are not in it yet are added to it.
+    '''
+    if len(columns) == 1:
+        keys, codes = _factorize(columns[0])
+    else:
+        codes = np.zeros(len(columns[0]), dtype=np.int64)
+        factors = list()
+        for values in columns:
+            uniques, inverse = _factorize(values)
+            factors.append((uniques, inverse))
+            # renumber the combinations of values so far, so that the codes stay small
+            _, first, codes = np.unique(codes * len(uniques) + inverse, return_index=True, return_inverse=True)
+        keys = list(zip(*[[uniques[i] for i in inverse[first]] for uniques, inverse in factors]))
+    numbers = np.array([groups.setdefault(key, len(groups)) for key in keys], dtype=np.int64)
+    return numbers[codes]
+
+
+def _split_groups(codes):
+    ''' Sort rows by their group, and get the start of each group in the sorted rows, and the group it is '''
+    order = np.argsort(codes, kind='mergesort')
+    codes = codes[order]
+    starts = np.flatnonzero(np.concatenate(([True], codes[1:] != codes[:-1])))
+    return order, starts, codes[starts]
+
+
+# the ufunc each function of DynamicTable.aggregate reduces the values of a group with
+_AGGREGATES = {'count': None, 'sum': np.add, 'mean': np.add, 'min': np.minimum, 'max': np.maximum}
+
+
+def _grow(result, n_groups, dtype):
+    ''' Extend the aggregates of the groups so far with zeros for the groups that have been added since '''
+    if result is None:
+        result = np.zeros(0, dtype=dtype)
+    return np.concatenate((result, np.zeros(n_groups - len(result), dtype=result.dtype)))
+
+
+def _reduce_groups(result, func, values, codes, n_groups, cache):
+    '''
+    Combine the aggregates of the groups so far with those of the next chunk of rows, given the values and the
+    groups of the rows. The rows are sorted by their group only if needed, and only once for all aggregates.
+    '''
+    if func == 'sum' and values.dtype.kind == 'f':
+        return _grow(result, n_groups, np.float64) + np.bincount(codes, weights=values, minlength=n_groups)
+    if 'split' not in cache:
+        cache['split'] = _split_groups(codes)
+    order, starts, present = cache['split']
+    ufunc = _AGGREGATES[func]
+    reduced = ufunc.reduceat(values[order], starts)
+    new = present >= (0 if result is None else len(result))   # the groups that start in this chunk
+    result = _grow(result, n_groups, reduced.dtype)
+    if func == 'sum':
+        result[present] += reduced
+    else:
+        result[present] = np.where(new, reduced, ufunc(result[present], reduced))
+    return result
+
+
+def _sorted_keys(keys):
+    ''' Get the positions of a list of group keys in sorted order, or in their order if they cannot be sorted '''
+    try:
+        return sorted(range(len(keys)), key=keys.__getitem__)
+    except TypeError:
+        return list(range(len(keys)))
+
 
 @register_class('Index', CORE_NAMESPACE)
 class Index(NWBData):
@@ -359,13 +550,14 @@ class VectorData(NWBData):
             {'name': 'container_source', 'type': object,
             'doc': 'the source of this Container e.g. file name', 'default': None})
     def __init__(self, **kwargs):
+        _buffer_empty_data(kwargs)
         call_docval_func(super(VectorData, self).__init__, kwargs)
         self.description = getargs('description', kwargs)
 
     @docval({'name': 'val', 'type': None, 'doc': 'the value to add to this column'})
     def add_row(self, **kwargs):
         val = getargs('val', kwargs)
-        self.data.append(val)
+        self.append(val)
 
 
 @register_class('VectorIndex', CORE_NAMESPACE)
@@ -381,12 +573,20 @@ class VectorIndex(Index):
             {'name': 'container_source', 'type': object,
             'doc': 'the source of this Container e.g. file name', 'default': None})
     def __init__(self, **kwargs):
+        _buffer_empty_data(kwargs)
         call_docval_func(super(VectorIndex, self).__init__, kwargs)
         self.target = getargs('target', kwargs)
 
     def add_vector(self, arg):
         self.target.extend(arg)
-        self.data.append(len(self.target))
+        self.append(len(self.target))
+
+    def add_vectors(self, arg):
+        ''' Add a vector for each element of the given sequence, extending the target and this index once '''
+        ends, values = _flatten_vectors(arg)
+        offset = len(self.target)
+        self.target.extend(values)
+        self.extend(ends + offset)
 
     def add_row(self, arg):
         self.add_vector(arg)
@@ -396,13 +596,77 @@ class VectorIndex(Index):
         end = self.data[arg]
         return self.target[start:end]
 
-    def __getitem__(self, arg):
-        if isinstance(arg, slice):
-            indices = list(range(*arg.indices(len(self.data))))
-            ret = list()
-            for i in indices:
-                ret.append(self.__getitem_helper(i))
+    def __get_bounds(self, indices):
+        ''' Get the start and end of each of the given vectors in the target, reading the index once '''
+        ends = np.asarray(_get_rows(self.data, np.concatenate((indices - 1, indices)).clip(0)), dtype=np.int64)
+        starts, ends = ends[:len(indices)], ends[len(indices):]
+        starts[indices == 0] = 0
+        return starts, ends
+
+    def __get_vectors(self, starts, ends):
+        '''
+        Get the vectors with the given starts and ends from the target. Vectors that are close together
+        in the target are read in one go, so that the target is read as few times as possible.
+        '''
+        ret = [None] * len(starts)
+        if len(starts) == 0:
             return ret
+        order = np.argsort(starts, kind='mergesort')
+        reach = np.maximum.accumulate(ends[order])
+        breaks = np.flatnonzero(starts[order][1:] > reach[:-1] + _max_gap(self.target.data)) + 1
+        for cluster in np.split(np.arange(len(order)), breaks):
+            first = starts[order[cluster[0]]]
+            values = self.target[first:reach[cluster[-1]]]
+            for i in order[cluster]:
+                ret[i] = values[starts[i] - first:ends[i] - first]
+        return ret
+
+    @docval({'name': 'arg', 'type': (slice, list, tuple, np.ndarray),
+             'doc': 'the vectors to get, as a slice, a list of indices or a boolean mask'},
+            returns='the start and the end of each selected vector in the target', rtype=tuple)
+    def get_bounds(self, **kwargs):
+        '''
+        Get the start and the end of each selected vector in the target, reading only the index.
+        Vector *i* is ``target[starts[i]:ends[i]]``.
+        '''
+        arg = getargs('arg', kwargs)
+        indices = _get_indices(arg, len(self.data))
+        if len(indices) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return self.__get_bounds(indices)
+
+    @docval({'name': 'arg', 'type': (slice, list, tuple, np.ndarray),
+             'doc': 'the vectors to get, as a slice, a list of indices or a boolean mask'},
+            returns='the offsets of the selected vectors in the values, and the values', rtype=tuple)
+    def get_ragged(self, **kwargs):
+        '''
+        Get the selected vectors as a pair of offsets and values, where vector *i* is
+        ``values[offsets[i]:offsets[i+1]]``.
+
+        If the selected vectors are contiguous and in order, the values are read directly from the target in
+        one go, otherwise they are concatenated into a new array. If the target is a DynamicTableRegion, the
+        values are the indices of the rows of its table.
+        '''
+        arg = getargs('arg', kwargs)
+        starts, ends = self.get_bounds(arg)
+        offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+        np.cumsum(ends - starts, out=offsets[1:])
+        if isinstance(self.target, DynamicTableRegion):
+            # read the indices of the region, rather than the rows of the table they refer to
+            elements = np.repeat(starts - offsets[:-1], ends - starts) + np.arange(offsets[-1])
+            return offsets, np.asarray(_get_rows(self.target.data, elements), dtype=np.int64)
+        if len(starts) == 0:
+            return offsets, self.target[0:0]
+        if np.array_equal(starts[1:], ends[:-1]):
+            return offsets, self.target[starts[0]:ends[-1]]
+        vectors = self.__get_vectors(starts, ends)
+        if isinstance(vectors[0], np.ndarray):
+            return offsets, np.concatenate(vectors)
+        return offsets, list(chain.from_iterable(vectors))
+
+    def __getitem__(self, arg):
+        if isinstance(arg, (slice, list, tuple, np.ndarray)):
+            return self.__get_vectors(*self.get_bounds(arg))
         else:
             return self.__getitem_helper(arg)
 
@@ -418,6 +682,7 @@ class ElementIdentifiers(NWBData):
             {'name': 'container_source', 'type': object,
             'doc': 'the source of this Container e.g. file name', 'default': None})
     def __init__(self, **kwargs):
+        _buffer_empty_data(kwargs)
         call_docval_func(super(ElementIdentifiers, self).__init__, kwargs)
 
 
@@ -547,12 +812,13 @@ class NWBTable(NWBData):
         '''Produce a pandas DataFrame containing this table's data.
         '''
 
+        import pandas as pd  # pandas is slow to import, so only import it when it is needed
         data = {colname: self[colname] for ii, colname in enumerate(self.columns)}
         return pd.DataFrame(data)
 
     @classmethod
     @docval(
-        {'name': 'df', 'type': pd.DataFrame, 'doc': 'input data'},
+        {'name': 'df', 'type': 'DataFrame', 'doc': 'input data'},
         {'name': 'name', 'type': str, 'doc': 'the name of this container', 'default': None},
         {
             'name': 'extra_ok',
@@ -952,7 +1218,7 @@ class DynamicTable(NWBDataInterface):
                     if len(id) > 0:
                         raise ValueError("must provide same number of ids as length of columns")
                     else:
-                        id.data.extend(range(lens[0]))
+                        id.extend(range(lens[0]))
         else:
             columns = list()
 
@@ -1009,6 +1275,7 @@ class DynamicTable(NWBDataInterface):
         # to make generating DataFrames and Series easier
         col_dict = dict()
         self.__indices = dict()
+        self.__lookups = dict()     # the HashIndex or SortedIndex of each column that has one
         for col in self.columns:
             if isinstance(col, VectorData):
                 existing = col_dict.get(col.name)
@@ -1043,19 +1310,14 @@ class DynamicTable(NWBDataInterface):
             desc = d.get('description', 'no description')
             data = None
             if df is not None:
-                data = list(df[name].values)
+                data = ArrayBuffer(df[name].values)
             if d.get('index', False):
                 index_data = None
                 if data is not None:
-                    index_data = [len(data[0])]
-                    for i in range(1, len(data)):
-                        index_data.append(len(data[i]) + index_data[i-1])
                     # assume data came in through a DataFrame, so we need
                     # to concatenate it
-                    tmp_data = list()
-                    for d in data:
-                        tmp_data.extend(d)
-                    data = tmp_data
+                    index_data, data = _flatten_vectors(data.data)
+                    index_data, data = ArrayBuffer(index_data), ArrayBuffer(data)
                 vdata = VectorData(name, desc, data=data)
                 vindex = VectorIndex("%s_index" % name, index_data, target=vdata)
                 tmp.append(vindex)
@@ -1081,7 +1343,27 @@ class DynamicTable(NWBDataInterface):
         '''
         data, row_id = popargs('data', 'id', kwargs)
         data = data if data is not None else kwargs
+        self.__check_columns(data)
+
+        if row_id is None:
+            row_id = data.pop('id', None)
+        if row_id is None:
+            row_id = len(self)
+        self.id.append(row_id)
+
+        for colname, colnum in self.__colids.items():
+            if colname not in data:
+                raise ValueError("column '%s' missing" % colname)
+            c = self.__df_cols[colnum]
+            if isinstance(c, VectorIndex):
+                c.add_vector(data[colname])
+            else:
+                c.add_row(data[colname])
+        for colname, lookup in self.__lookups.items():
+            lookup.add([row_id if colname == self.id.name else data[colname]])
 
+    def __check_columns(self, data):
+        ''' Check that the given data has a value for each column, adding optional columns that are given '''
         extra_columns = set(list(data.keys())) - set(list(self.__colids.keys()))
         missing_columns = set(list(self.__colids.keys())) - set(list(data.keys()))
 
@@ -1104,20 +1386,60 @@ class DynamicTable(NWBDataInterface):
                 ])
             )
 
-        if row_id is None:
-            row_id = data.pop('id', None)
-        if row_id is None:
-            row_id = len(self)
-        self.id.data.append(row_id)
+    @staticmethod
+    def _get_columns(rows):
+        ''' Get a dict with the values of each column from a dict of columns, a DataFrame or a structured array '''
+        if isinstance(rows, np.ndarray):
+            if rows.dtype.names is None:
+                raise ValueError("'data' must be a structured array with a field for each column")
+            return {name: rows[name] for name in rows.dtype.names}
+        if isinstance(rows, dict):
+            return dict(rows)
+        # a DataFrame
+        ret = {name: rows[name].values for name in rows.columns}
+        if rows.index.name is not None and rows.index.name not in ret:
+            ret[rows.index.name] = rows.index.values
+        return ret
+
+    @docval({'name': 'data', 'type': (dict, 'DataFrame', np.ndarray),
+             'doc': 'the rows to add, as a dict with the values of each column, a DataFrame or a structured array'},
+            {'name': 'id', 'type': 'array_data', 'doc': 'the IDs for the rows', 'default': None})
+    def add_rows(self, **kwargs):
+        '''
+        Add multiple rows to the table at once.
 
+        The columns are checked once for all rows, and the values of each column are added in one step. The values
+        of an indexed column are given as a sequence of values for each row. If *id* is not provided, and *data*
+        does not have an *id* column (or a DataFrame index named *id*), the IDs continue from the number of rows
+        already in the table.
+        '''
+        data, ids = getargs('data', 'id', kwargs)
+        data = self._get_columns(data)
+        if ids is None:
+            ids = data.pop(self.id.name, None)
+        else:
+            data.pop(self.id.name, None)
+        self.__check_columns(data)
+        lens = {len(data[name]) for name in self.__colids}
+        if ids is not None:
+            lens.add(len(ids))
+        if len(lens) > 1:
+            raise ValueError("all columns must have the same number of rows")
+        nrows = lens.pop() if lens else 0
+        if nrows == 0:
+            return
+        if ids is None:
+            ids = np.arange(len(self), len(self) + nrows)
+        self.id.extend(ids)
         for colname, colnum in self.__colids.items():
-            if colname not in data:
-                raise ValueError("column '%s' missing" % colname)
             c = self.__df_cols[colnum]
+            values = data[colname]
             if isinstance(c, VectorIndex):
-                c.add_vector(data[colname])
+                c.add_vectors(values)
             else:
-                c.add_row(data[colname])
+                c.extend(values)
+        for colname, lookup in self.__lookups.items():
+            lookup.add(ids if colname == self.id.name else data[colname])
 
     @docval({'name': 'name', 'type': str, 'doc': 'the name of this VectorData'},
             {'name': 'description', 'type': str, 'doc': 'a description for this column'},
@@ -1175,11 +1497,257 @@ class DynamicTable(NWBDataInterface):
         self.fields['columns'] = tuple(list(self.columns)+columns)
         self.__df_cols.append(col)
 
+    @docval({'name': 'expr', 'type': (str, Predicate),
+             'doc': 'the condition the rows must meet, e.g. "sweep_number == 3 and start_time > 10" or '
+                    '``(Column(\'sweep_number\') == 3) & (Column(\'start_time\') > 10)``'},
+            {'name': 'region', 'type': str,
+             'doc': 'the name of a DynamicTableRegion to return for the matching rows, instead of their indices',
+             'default': None},
+            {'name': 'chunk_size', 'type': int, 'doc': 'the number of rows to evaluate the condition for at once',
+             'default': 65536})
+    def query(self, **kwargs):
+        '''
+        Get the indices of the rows that meet a condition on the values of their columns.
+        See :py:mod:`pynwb.query` for the conditions that can be used.
+
+        The condition is evaluated for *chunk_size* rows at a time, and only the columns it refers to are read.
+        '''
+        expr, region, chunk_size = getargs('expr', 'region', 'chunk_size', kwargs)
+        if isinstance(expr, str):
+            expr = parse(expr)
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be positive")
+        data = {name: self.__get_data(name, 'query') for name in expr.columns}
+
+        ret = expr.lookup(self.__lookups) if self.__lookups else None
+        if ret is None:
+            ret = self.__evaluate(expr, data, chunk_size)
+        if region is not None:
+            return self.create_region(region, ret, 'rows where %r' % expr)
+        return ret
+
+    def __evaluate(self, expr, data, chunk_size):
+        ''' Evaluate a predicate over chunks of rows, given the data of the columns it refers to '''
+        matches = list()
+        for start in range(0, len(self), chunk_size):
+            chunk = slice(start, min(start + chunk_size, len(self)))
+            values = dict()
+
+            def read(name):
+                if name not in values:
+                    values[name] = data[name][chunk]
+                return values[name]
+
+            matches.append(np.flatnonzero(expr.evaluate(read)) + start)
+        return np.concatenate(matches) if matches else np.zeros(0, dtype=np.int64)
+
+    def __get_data(self, name, action):
+        ''' Get the data of a column that is not indexed, or of the ids, to *action* it by its values '''
+        if name == self.id.name:
+            return self.id.data
+        if name not in self.__colids:
+            raise KeyError("'%s' is not a column of this table" % name)
+        col = self.__df_cols[self.__colids[name]]
+        if isinstance(col, VectorIndex):
+            raise ValueError("cannot %s indexed column '%s'" % (action, name))
+        return col.data
+
+    @docval({'name': 'colname', 'type': str, 'doc': 'the name of the column to index'},
+            {'name': 'kind', 'type': str,
+             'doc': "'hash' for looking up rows by value, or 'sorted' for looking up rows by value or range",
+             'default': 'hash'})
+    def create_index(self, **kwargs):
+        '''
+        Index the rows of a column by their value, so that :py:meth:`query` can look up rows instead of
+        reading the column. The index is kept up to date as rows are added.
+        The index is not stored in the file, so it needs to be created again for a table that is read from a file.
+        '''
+        colname, kind = getargs('colname', 'kind', kwargs)
+        if kind == 'hash':
+            cls = HashIndex
+        elif kind == 'sorted':
+            cls = SortedIndex
+        else:
+            raise ValueError("'kind' must be 'hash' or 'sorted', not '%s'" % kind)
+        data = self.__get_data(colname, 'index')[:]  # read the column once
+        try:
+            self.__lookups[colname] = cls(data if isinstance(data, np.ndarray) else list(data))
+        except TypeError:
+            raise_from(ValueError("cannot create a '%s' index of column '%s'" % (kind, colname)), None)
+
+    @docval({'name': 'colname', 'type': str, 'doc': 'the name of the column to remove the index of'})
+    def drop_index(self, **kwargs):
+        ''' Remove the index of a column created with :py:meth:`create_index` '''
+        colname = getargs('colname', kwargs)
+        if colname not in self.__lookups:
+            raise KeyError("column '%s' has no index" % colname)
+        del self.__lookups[colname]
+
+    @docval({'name': 'colname', 'type': str,
+             'doc': 'the name of the DynamicTableRegion column, or of the indexed DynamicTableRegion column, '
+                    'to follow to the rows of the table it refers to'},
+            {'name': 'columns', 'type': (list, tuple),
+             'doc': 'the names of the columns of this table to include. All other columns are included by default',
+             'default': None},
+            {'name': 'other_columns', 'type': (list, tuple),
+             'doc': 'the names of the columns of the other table to include. All columns are included by default',
+             'default': None},
+            {'name': 'rows', 'type': (slice, list, tuple, np.ndarray),
+             'doc': 'the rows of this table to include, as a slice, a list of indices or a boolean mask. All rows '
+                    'are included by default', 'default': None})
+    def join(self, **kwargs):
+        '''
+        Join the rows of this table with the rows of the table that a DynamicTableRegion column refers to, and
+        return them as a pandas DataFrame with a row for each row of this table and each row it refers to.
+
+        The column *colname* has the index of the row of the other table, and each column of the other table
+        is included as *<colname>_<name>*. The indices are read in one step, and only the rows of the other
+        table that are referred to are read.
+        '''
+        colname, columns, other_columns, rows = getargs('colname', 'columns', 'other_columns', 'rows', kwargs)
+        if colname not in self.__colids:
+            raise KeyError("'%s' is not a column of this table" % colname)
+        col = self.__df_cols[self.__colids[colname]]
+        if isinstance(col, VectorIndex) and isinstance(col.target, DynamicTableRegion):
+            region = col.target
+        elif isinstance(col, DynamicTableRegion):
+            region = col
+        else:
+            raise ValueError("column '%s' is not a DynamicTableRegion" % colname)
+        if region.table is None:
+            raise ValueError("DynamicTableRegion '%s' does not refer to a table" % colname)
+        if columns is None:
+            columns = [name for name in self.colnames if name != colname]
+        if rows is None:
+            rows = slice(None)
+        elif not isinstance(rows, slice):
+            rows = _get_indices(rows, len(self))
+
+        left = self.to_dataframe(columns=columns, rows=rows)
+        if region is col:
+            targets = np.asarray(_get_rows(col.data, rows), dtype=np.int64)
+        else:
+            # each row refers to any number of rows, so repeat it for each of them
+            offsets, targets = col.get_ragged(rows)
+            left = left.iloc[np.repeat(np.arange(len(left)), np.diff(offsets))]
+        right = region.table.to_dataframe(columns=other_columns, rows=targets)
+
+        import pandas as pd
+        data = OrderedDict((name, left[name].values) for name in left.columns)
+        data[colname] = targets
+        for name in right.columns:
+            data['%s_%s' % (colname, name)] = right[name].values
+        return pd.DataFrame(data, index=left.index, columns=list(data.keys()))
+
+    def __iter_groups(self, by, columns, chunk_size, groups):
+        '''
+        Iterate over the chunks of rows of this table, and get the group of each row, given the columns the rows
+        are grouped by, and the values of the given columns
+        '''
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be positive")
+        by = [self.__get_data(name, 'group by') for name in by]
+        columns = [self.__get_data(name, 'aggregate') for name in columns]
+        for start in range(0, len(self), chunk_size):
+            chunk = slice(start, min(start + chunk_size, len(self)))
+            codes = _group_rows([data[chunk] for data in by], groups)
+            yield start, codes, [np.asarray(data[chunk]) for data in columns]
+
+    @docval({'name': 'by', 'type': (str, list, tuple), 'doc': 'the name of the column, or the names of the columns, '
+                                                              'to group the rows by'},
+            {'name': 'chunk_size', 'type': int, 'doc': 'the number of rows to group at once', 'default': 65536})
+    def groupby(self, **kwargs):
+        '''
+        Group the rows of this table by the values of one or more columns.
+
+        Returns an OrderedDict that maps the value of the column, or the tuple of the values of the columns,
+        to the indices of the rows with that value, in order of the values. The columns are read *chunk_size*
+        rows at a time.
+        '''
+        by, chunk_size = getargs('by', 'chunk_size', kwargs)
+        if isinstance(by, str):
+            by = [by]
+        groups = OrderedDict()
+        parts = list()
+        for start, codes, _ in self.__iter_groups(by, (), chunk_size, groups):
+            parts.extend(list() for i in range(len(groups) - len(parts)))
+            order, starts, present = _split_groups(codes)
+            for group, rows in zip(present.tolist(), np.split(order + start, starts[1:])):
+                parts[group].append(rows)
+        keys = list(groups.keys())
+        return OrderedDict((keys[i], np.concatenate(parts[i])) for i in _sorted_keys(keys))
+
+    @docval({'name': 'by', 'type': (str, list, tuple), 'doc': 'the name of the column, or the names of the columns, '
+                                                              'to group the rows by'},
+            {'name': 'aggs', 'type': dict,
+             'doc': "the aggregates to compute, as a dict that maps the name of each aggregate to a tuple "
+                    "(column name, function), where function is 'count', 'sum', 'mean', 'min' or 'max'"},
+            {'name': 'chunk_size', 'type': int, 'doc': 'the number of rows to aggregate at once', 'default': 65536})
+    def aggregate(self, **kwargs):
+        '''
+        Group the rows of this table by the values of one or more columns, and compute aggregates of the
+        values of numeric columns for each group.
+
+        Returns a pandas DataFrame with a row for each group, indexed by the values of the columns, and a column
+        for each aggregate. The columns are read *chunk_size* rows at a time, and the aggregates of each chunk
+        are combined with those of the previous chunks, so that no column is read all at once.
+        '''
+        by, aggs, chunk_size = getargs('by', 'aggs', 'chunk_size', kwargs)
+        if isinstance(by, str):
+            by = [by]
+        columns = list()
+        for name, agg in aggs.items():
+            if not isinstance(agg, (list, tuple)) or len(agg) != 2:
+                raise ValueError("aggregate '%s' must be a tuple (column name, function)" % name)
+            if agg[1] not in _AGGREGATES:
+                raise ValueError("unknown function '%s' for aggregate '%s'" % (agg[1], name))
+            if agg[0] not in columns:
+                columns.append(agg[0])
+        funcs = {col: set() for col in columns}    # the functions to compute for each column
+        for col, func in aggs.values():
+            funcs[col].add('sum' if func == 'mean' else func)
+
+        groups = OrderedDict()
+        counts = np.zeros(0, dtype=np.int64)
+        results = dict()    # the aggregate of each column and function so far
+        for start, codes, values in self.__iter_groups(by, columns, chunk_size, groups):
+            counts = _grow(counts, len(groups), np.int64) + np.bincount(codes, minlength=len(groups))
+            cache = dict()
+            for col, data in zip(columns, values):
+                if data.dtype.kind not in 'biuf':
+                    raise ValueError("cannot aggregate column '%s' of non-numeric values" % col)
+                if data.dtype.kind == 'b':
+                    data = data.astype(np.int64)
+                for func in funcs[col]:
+                    if func != 'count':
+                        results[(col, func)] = _reduce_groups(results.get((col, func)), func, data, codes,
+                                                              len(groups), cache)
+
+        import pandas as pd
+        keys = list(groups.keys())
+        order = _sorted_keys(keys)
+        keys = [keys[i] for i in order]
+        if len(by) == 1:
+            index = pd.Index(keys, name=by[0])
+        else:
+            index = pd.MultiIndex.from_arrays([list(values) for values in zip(*keys)] or [[]] * len(by), names=by)
+        data = OrderedDict()
+        for name, (col, func) in aggs.items():   # a table without rows has no results
+            if func == 'count':
+                data[name] = counts[order]
+            elif func == 'mean':
+                data[name] = results.get((col, 'sum'), counts)[order] / counts[order]
+            else:
+                data[name] = results.get((col, func), counts)[order]
+        return pd.DataFrame(data, index=index, columns=list(data.keys()))
+
     @docval({'name': 'name', 'type': str, 'doc': 'the name of the DynamicTableRegion object'},
-            {'name': 'region', 'type': (slice, list, tuple), 'doc': 'the indices of the table'},
+            {'name': 'region', 'type': (slice, list, tuple, np.ndarray), 'doc': 'the indices of the table'},
             {'name': 'description', 'type': str, 'doc': 'a brief description of what the region is'})
     def create_region(self, **kwargs):
         region = getargs('region', kwargs)
+        if isinstance(region, np.ndarray):
+            region = region.tolist()
         if isinstance(region, slice):
             if (region.start is not None and region.start < 0) or (region.stop is not None and region.stop > len(self)):
                 msg = 'region slice %s is out of range for this DynamicTable of length ' % (str(region), len(self))
@@ -1196,6 +1764,11 @@ class DynamicTable(NWBDataInterface):
         return DynamicTableRegion(name, region, desc, self)
 
     def __getitem__(self, key):
+        '''
+        Get a column by its name, a row as a tuple by its index, rows as a DataFrame by a slice, a list or an
+        array of indices or a boolean mask, or the values of a column by a tuple (rows, column). Selections of
+        rows used to return a list of tuples; use :py:meth:`to_dataframe` to also choose the columns.
+        '''
         ret = None
         if isinstance(key, tuple):
             # index by row and column, return specific cell
@@ -1203,7 +1776,10 @@ class DynamicTable(NWBDataInterface):
             arg2 = key[1]
             if isinstance(arg2, str):
                 arg2 = self.__colids[arg2]
-            ret = self.__df_cols[arg2][arg1]
+            if isinstance(arg1, (list, np.ndarray)):
+                ret = self.__get_column_rows(self.__df_cols[arg2], _get_indices(arg1, len(self)))
+            else:
+                ret = self.__df_cols[arg2][arg1]
         else:
             arg = key
             if isinstance(arg, str):
@@ -1217,14 +1793,22 @@ class DynamicTable(NWBDataInterface):
             elif isinstance(arg, (int, np.int8, np.int16, np.int32, np.int64)):
                 # index by int, return row
                 ret = tuple(col[arg] for col in self.__df_cols)
-            elif isinstance(arg, (tuple, list)):
-                # index by a list of ints, return multiple rows
-                ret = list()
-                for i in arg:
-                    ret.append(tuple(col[i] for col in self.__df_cols))
+            elif isinstance(arg, (slice, list, np.ndarray)):
+                # index by a slice, a list of ints or a boolean mask, return the rows as a DataFrame
+                ret = self.to_dataframe(rows=arg)
 
         return ret
 
+    @staticmethod
+    def __get_column_rows(col, rows):
+        ''' Get the values of a column for the given rows, reading the column once '''
+        if isinstance(col, VectorIndex):
+            return col[rows]
+        if isinstance(col, DynamicTableRegion):
+            # read the indices into the target table once, then select the rows of the target table at once
+            return col.table.to_dataframe(rows=np.asarray(_get_rows(col.data, rows), dtype=np.int64))
+        return _get_rows(col.data, rows)
+
     def __contains__(self, val):
         return val in self.__colids or val in self.__indices
 
@@ -1233,20 +1817,53 @@ class DynamicTable(NWBDataInterface):
             return self[key]
         return default
 
-    def to_dataframe(self):
-        '''Produce a pandas DataFrame containing this table's data.
+    @docval({'name': 'columns', 'type': (list, tuple),
+             'doc': 'the names of the columns to include, in order. All columns are included by default',
+             'default': None},
+            {'name': 'rows', 'type': (slice, list, tuple, np.ndarray),
+             'doc': 'the rows to include, as a slice, a list of indices or a boolean mask. All rows are included by '
+                    'default', 'default': None},
+            {'name': 'ragged', 'type': str,
+             'doc': "how to include indexed columns: 'list' for a column with the values of each row, or 'bounds' "
+                    "for columns *<name>_start* and *<name>_stop* with the range of each row in the values of the "
+                    "column (i.e. ``table[name].target``), without reading the values", 'default': 'list'})
+    def to_dataframe(self, **kwargs):
         '''
+        Produce a pandas DataFrame containing this table's data.
 
-        data = {}
-        for name in self.colnames:
+        Each column is read once, and only the selected rows of it are read. The values of an indexed column
+        are read in one step and each row gets a view of them.
+        '''
+        columns, rows, ragged = getargs('columns', 'rows', 'ragged', kwargs)
+        if ragged not in ('list', 'bounds'):
+            raise ValueError("'ragged' must be 'list' or 'bounds', not '%s'" % ragged)
+        if columns is None:
+            columns = self.colnames
+        if rows is None:
+            rows = slice(None)
+        elif not isinstance(rows, slice):
+            rows = _get_indices(rows, len(self))
+
+        import pandas as pd  # pandas is slow to import, so only import it when it is needed
+        data = OrderedDict()
+        for name in columns:
+            if name not in self.__colids:
+                raise KeyError("'%s' is not a column of this table" % name)
             col = self.__df_cols[self.__colids[name]]
-            data[name] = col[:]
+            if isinstance(col, VectorIndex):
+                if ragged == 'bounds':
+                    data[name + '_start'], data[name + '_stop'] = col.get_bounds(rows)
+                else:
+                    data[name] = col[rows]
+            else:
+                data[name] = _get_rows(col.data, rows)
 
-        return pd.DataFrame(data, index=pd.Index(name=self.id.name, data=self.id.data))
+        index = pd.Index(name=self.id.name, data=_get_rows(self.id.data, rows))
+        return pd.DataFrame(data, index=index, columns=list(data.keys()))
 
     @classmethod
     @docval(
-        {'name': 'df', 'type': pd.DataFrame, 'doc': 'source DataFrame'},
+        {'name': 'df', 'type': 'DataFrame', 'doc': 'source DataFrame'},
         {'name': 'name', 'type': str, 'doc': 'the name of this table'},
         {
             'name': 'index_column',
@@ -1292,10 +1909,10 @@ class DynamicTable(NWBDataInterface):
                     columns.append({'name': c})
 
         if index_column is not None:
-            ids = ElementIdentifiers(name=index_column, data=df[index_column].values.tolist())
+            ids = ElementIdentifiers(name=index_column, data=ArrayBuffer(df[index_column].values))
         else:
             index_name = df.index.name if df.index.name is not None else 'id'
-            ids = ElementIdentifiers(name=index_name, data=df.index.values.tolist())
+            ids = ElementIdentifiers(name=index_name, data=ArrayBuffer(df.index.values))
 
         columns = cls.__build_columns(columns, df=df)
 
@@ -1339,22 +1956,37 @@ class DynamicTableRegion(VectorData):
         if 'table' in self.fields:
             msg = "can't set attribute 'table' -- already set"
             raise AttributeError(msg)
-        for idx in self.data:
-            if idx < 0 or idx >= len(val):
-                raise IndexError('The index ' + str(idx) +
+        # check all indices at once, rather than one at a time
+        indices = self.data.data if isinstance(self.data, DataIO) else self.data
+        indices = np.asarray(indices if isinstance(indices, (list, tuple, np.ndarray)) else indices[:])
+        if len(indices) > 0:
+            bad = (indices < 0) | (indices >= len(val))
+            if bad.any():
+                raise IndexError('The index ' + str(indices[np.argmax(bad)]) +
                                  ' is out of range for this DynamicTable of length '
                                  + str(len(val)))
         self.fields['table'] = val
 
+    def __get_indices(self, key):
+        ''' Get the indices into the table selected by a slice, a list of indices or a boolean mask '''
+        if not isinstance(key, slice):
+            key = _get_indices(key, len(self.data))
+        return np.asarray(_get_rows(self.data, key), dtype=np.int64)
+
     def __getitem__(self, key):
         # treat the list of indices as data that can be indexed. then pass the
         # result to the table to get the data
         if isinstance(key, tuple):
             arg1 = key[0]
             arg2 = key[1]
+            if isinstance(arg1, (slice, list, np.ndarray)):
+                return self.table[self.__get_indices(arg1), arg2]
             return self.table[self.data[arg1], arg2]
         else:
-            if isinstance(key, int):
+            if isinstance(key, (int, np.integer)):
                 return self.table[self.data[key]]
+            elif isinstance(key, (slice, list, np.ndarray)):
+                # get the selected rows of the table as a DataFrame, reading each column once
+                return self.table.to_dataframe(rows=self.__get_indices(key))
             else:
                 raise ValueError("unrecognized argument: '%s'" % key)
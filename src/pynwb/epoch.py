@@ -1,5 +1,7 @@
 from bisect import bisect_left
 
+import numpy as np
+
 from .form.utils import docval, getargs, popargs, call_docval_func
 from .form.data_utils import DataIO
 
@@ -7,8 +9,6 @@ from . import register_class, CORE_NAMESPACE
 from .base import TimeSeries
 from .core import DynamicTable, ElementIdentifiers
 
-import pandas as pd
-
 
 @register_class('TimeIntervals', CORE_NAMESPACE)
 class TimeIntervals(DynamicTable):
@@ -62,6 +62,34 @@ class TimeIntervals(DynamicTable):
             rkwargs['timeseries'] = timeseries
         return super(TimeIntervals, self).add_row(**rkwargs)
 
+    @docval({'name': 'data', 'type': (dict, 'DataFrame', np.ndarray),
+             'doc': 'the intervals to add, as a dict with the values of each column, a DataFrame or a structured '
+                    'array'},
+            {'name': 'id', 'type': 'array_data', 'doc': 'the IDs for the intervals', 'default': None})
+    def add_intervals(self, **kwargs):
+        """
+        Add multiple intervals to this table at once. The *tags* and *timeseries* of each interval
+        can be given in the same forms as for :py:meth:`add_interval`.
+        See :py:meth:`~pynwb.core.DynamicTable.add_rows` for more details
+        """
+        data, ids = getargs('data', 'id', kwargs)
+        data = self._get_columns(data)
+        tags = data.get('tags')
+        if tags is not None:
+            data['tags'] = [[s.strip() for s in t.split(",") if not s.isspace()]
+                            if isinstance(t, str) else t for t in tags]
+        timeseries = data.get('timeseries')
+        if timeseries is not None:
+            rows = list()
+            for start_time, stop_time, ts_list in zip(data['start_time'], data['stop_time'], timeseries):
+                if ts_list is None:
+                    ts_list = list()
+                elif isinstance(ts_list, TimeSeries):
+                    ts_list = [ts_list]
+                rows.append([self.__calculate_idx_count(start_time, stop_time, ts) + (ts,) for ts in ts_list])
+            data['timeseries'] = rows
+        return super(TimeIntervals, self).add_rows(data, id=ids)
+
     def __calculate_idx_count(self, start_time, stop_time, ts_data):
         if isinstance(ts_data.timestamps, DataIO):
             ts_timestamps = ts_data.timestamps.data
@@ -87,7 +115,7 @@ class TimeIntervals(DynamicTable):
 
     @classmethod
     @docval(
-        {'name': 'df', 'type': pd.DataFrame, 'doc': 'source DataFrame'},
+        {'name': 'df', 'type': 'DataFrame', 'doc': 'source DataFrame'},
         {'name': 'name', 'type': str, 'doc': 'the name of this table'},
         {
             'name': 'index_column',
@@ -4,6 +4,8 @@ from collections import Iterable
 from warnings import warn
 import copy as _copy
 
+import numpy as np
+
 from .form.utils import docval, getargs, fmt_docval_args, call_docval_func, get_docval
 from .form import Container
 
@@ -469,6 +471,26 @@ class NWBFile(MultiContainerInterface):
             d['group_name'] = d['group'].name
         call_docval_func(self.electrodes.add_row, d)
 
+    @docval({'name': 'data', 'type': (dict, 'DataFrame', np.ndarray),
+             'doc': 'the electrodes to add, as a dict with the values of each column, a DataFrame or a structured '
+                    'array'},
+            {'name': 'id', 'type': 'array_data', 'doc': 'the IDs for the electrodes', 'default': None})
+    def add_electrodes(self, **kwargs):
+        """
+        Add multiple electrodes to the electrode table at once.
+        See :py:meth:`~pynwb.core.DynamicTable.add_rows` for more details.
+
+        Required fields are *x*, *y*, *z*, *imp*, *location*, *filtering*,
+        *group* and any columns that have been added
+        (through calls to `add_electrode_columns`).
+        """
+        data, ids = getargs('data', 'id', kwargs)
+        self.__check_electrodes()
+        data = self.electrodes._get_columns(data)
+        if data.get('group_name') is None and data.get('group') is not None:
+            data['group_name'] = [g.name for g in data['group']]
+        self.electrodes.add_rows(data, id=ids)
+
     @docval({'name': 'region', 'type': (slice, list, tuple), 'doc': 'the indices of the table'},
             {'name': 'description', 'type': str, 'doc': 'a brief description of what this electrode is'},
             {'name': 'name', 'type': str, 'doc': 'the name of this container', 'default': 'electrodes'})
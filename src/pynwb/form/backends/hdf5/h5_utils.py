@@ -3,6 +3,7 @@ from collections import Iterable
 from six import binary_type, text_type
 from h5py import Group, Dataset, RegionReference, Reference, special_dtype
 import json
+import hashlib
 import h5py
 import numpy as np
 import warnings
@@ -157,11 +158,30 @@ class H5SpecReader(SpecReader):
         self.__group = getargs('group', kwargs)
         super_kwargs = {'source': "%s:%s" % (os.path.abspath(self.__group.file.name), self.__group.name)}
         call_docval_func(super(H5SpecReader, self).__init__, super_kwargs)
+        self.__strings = dict()
+        self.__content_key = None
+
+    def __read_string(self, path):
+        s = self.__strings.get(path)
+        if s is None:
+            s = self.__group[path][()]
+            if isinstance(s, bytes):
+                s = s.decode('UTF-8')
+            self.__strings[path] = s
+        return s
+
+    def content_key(self):
+        ''' Get a hash of the JSON strings of all specifications in the group '''
+        if self.__content_key is None:
+            h = hashlib.sha1()
+            for name in sorted(self.__group.keys()):
+                h.update(name.encode('UTF-8'))
+                h.update(self.__read_string(name).encode('UTF-8'))
+            self.__content_key = h.hexdigest()
+        return self.__content_key
 
     def __read(self, path):
-        s = self.__group[path][()]
-        if isinstance(s, bytes):
-            s = s.decode('UTF-8')
+        s = self.__read_string(path)
         d = json.loads(s)
         return d
 
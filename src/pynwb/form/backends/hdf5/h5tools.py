@@ -1,13 +1,13 @@
 from collections import deque
 import numpy as np
 import os.path
-from functools import partial
-from h5py import File, Group, Dataset, special_dtype, SoftLink, ExternalLink, Reference, RegionReference, check_dtype
+from h5py import File, Group, Dataset, special_dtype, SoftLink, ExternalLink, HardLink, Reference, RegionReference,\
+    check_dtype
 from six import raise_from, text_type, string_types, binary_type
 import warnings
 from ...container import Container
 
-from ...utils import docval, getargs, popargs, call_docval_func
+from ...utils import docval, getargs, popargs, call_docval_func, walk_generators
 from ...data_utils import AbstractDataChunkIterator, get_shape
 from ...build import Builder, GroupBuilder, DatasetBuilder, LinkBuilder, BuildManager,\
                      RegionBuilder, ReferenceBuilder, TypeMap
@@ -70,12 +70,16 @@ class HDF5IO(FORMIO):
              'type': (NamespaceCatalog, TypeMap),
              'doc': 'the NamespaceCatalog or TypeMap to load namespaces into'},
             {'name': 'path', 'type': str, 'doc': 'the path to the HDF5 file'},
-            {'name': 'namespaces', 'type': list, 'doc': 'the namespaces to load', 'default': None})
-    def load_namespaces(cls, namespace_catalog, path, namespaces=None):
+            {'name': 'namespaces', 'type': list, 'doc': 'the namespaces to load', 'default': None},
+            {'name': 'file', 'type': File, 'doc': 'a pre-existing h5py.File object to read from', 'default': None})
+    def load_namespaces(cls, namespace_catalog, path, namespaces=None, file=None):
         '''
         Load cached namespaces from a file.
+
+        Namespaces already loaded from a file with identical cached specifications are reused
+        instead of being read again. If *file* is given, it is read from and left open.
         '''
-        f = File(path, 'r')
+        f = file if file is not None else File(path, 'r')
         if SPEC_LOC_ATTR not in f.attrs:
             msg = "No cached namespaces found in %s" % path
             warnings.warn(msg)
@@ -89,7 +93,8 @@ class HDF5IO(FORMIO):
                 ns_group = ns_group[latest_version]
                 reader = H5SpecReader(ns_group)
                 namespace_catalog.load_namespaces('namespace', reader=reader)
-        f.close()
+        if file is None:
+            f.close()
 
     @classmethod
     def __convert_namespace(cls, ns_catalog, namespace):
@@ -251,6 +256,15 @@ class HDF5IO(FORMIO):
         return container
 
     def __read_group(self, h5obj, name=None, ignore=set()):
+        result = [None]
+        walk_generators(self.__iter_read_group(h5obj, name, ignore, result))
+        return result[0]
+
+    def __iter_read_group(self, h5obj, name, ignore, result):
+        '''
+        Read a group, yielding a generator for each subgroup that has not been read yet.
+        Each generator stores the GroupBuilder it reads in result[0] before finishing.
+        '''
         kwargs = {
             "attributes": self.__read_attrs(h5obj),
             "groups": dict(),
@@ -262,53 +276,66 @@ class HDF5IO(FORMIO):
             if isinstance(val, bytes):
                 kwargs['attributes'][key] = val.decode('UTF-8')
 
+        profiler = self.manager.profiler
+        event = None if profiler is None else self.__start_read(profiler, kwargs['attributes'])
+        try:
+            yield self.__iter_build_group(h5obj, name, ignore, result, kwargs)
+        finally:
+            # also stop the event if reading the group failed, so that it does not stay open
+            if event is not None:
+                profiler.stop(event)
+
+    def __iter_build_group(self, h5obj, name, ignore, result, kwargs):
+        profiler = self.manager.profiler
         if name is None:
             name = str(os.path.basename(h5obj.name))
         for k in h5obj:
             sub_h5obj = h5obj.get(k)
+            if sub_h5obj is None:
+                warnings.warn('Broken Link: %s' % os.path.join(h5obj.name, k))
+                kwargs['datasets'][k] = None
+                continue
             if sub_h5obj.name in ignore:
                 continue
-            if not (sub_h5obj is None):
-                link_type = h5obj.get(k, getlink=True)
-                if isinstance(link_type, SoftLink) or isinstance(link_type, ExternalLink):
-                    # Reading links might be better suited in its own function
-                    # get path of link (the key used for tracking what's been built)
-                    target_path = link_type.path
-                    builder_name = os.path.basename(target_path)
-                    # get builder if already read, else build it
-                    builder = self.__get_built(sub_h5obj.file.filename, target_path)
-                    if builder is None:
-                        # NOTE: all links must have absolute paths
-                        if isinstance(sub_h5obj, Dataset):
-                            builder = self.__read_dataset(sub_h5obj, builder_name)
-                        else:
-                            builder = self.__read_group(sub_h5obj, builder_name, ignore=ignore)
-                        self.__set_built(sub_h5obj.file.filename, target_path, builder)
-                    link_builder = LinkBuilder(builder, k, source=self.__path)
-                    link_builder.written = True
-                    kwargs['links'][builder_name] = link_builder
-                else:
-                    builder = self.__get_built(sub_h5obj.file.filename, sub_h5obj.name)
-                    obj_type = None
-                    read_method = None
+            link_type = h5obj.get(k, getlink=True)
+            if isinstance(link_type, SoftLink) or isinstance(link_type, ExternalLink):
+                # Reading links might be better suited in its own function
+                # get path of link (the key used for tracking what's been built)
+                target_path = link_type.path
+                builder_name = os.path.basename(target_path)
+                # get builder if already read, else build it
+                builder = self.__get_built(sub_h5obj.file.filename, target_path)
+                if builder is None:
+                    # NOTE: all links must have absolute paths
                     if isinstance(sub_h5obj, Dataset):
-                        read_method = self.__read_dataset
-                        obj_type = kwargs['datasets']
+                        builder = self.__read_dataset(sub_h5obj, builder_name)
                     else:
-                        read_method = partial(self.__read_group, ignore=ignore)
-                        obj_type = kwargs['groups']
+                        yield self.__iter_read_group(sub_h5obj, builder_name, ignore, result)
+                        builder = result[0]
+                    self.__set_built(sub_h5obj.file.filename, target_path, builder)
+                link_builder = LinkBuilder(builder, k, source=self.__path)
+                link_builder.written = True
+                kwargs['links'][builder_name] = link_builder
+            else:
+                builder = self.__get_built(sub_h5obj.file.filename, sub_h5obj.name)
+                if isinstance(sub_h5obj, Dataset):
+                    obj_type = kwargs['datasets']
                     if builder is None:
-                        builder = read_method(sub_h5obj)
+                        builder = self.__read_dataset(sub_h5obj)
                         self.__set_built(sub_h5obj.file.filename, sub_h5obj.name, builder)
-                    obj_type[builder.name] = builder
-            else:
-                warnings.warn('Broken Link: %s' % os.path.join(h5obj.name, k))
-                kwargs['datasets'][k] = None
-                continue
+                else:
+                    obj_type = kwargs['groups']
+                    if builder is None:
+                        yield self.__iter_read_group(sub_h5obj, None, ignore, result)
+                        builder = result[0]
+                        self.__set_built(sub_h5obj.file.filename, sub_h5obj.name, builder)
+                obj_type[builder.name] = builder
         kwargs['source'] = self.__path
         ret = GroupBuilder(name, **kwargs)
         ret.written = True
-        return ret
+        if profiler is not None:
+            profiler.add_hdf5_calls(len(ret.groups) + len(ret.datasets) + len(ret.links))
+        result[0] = ret
 
     def __read_dataset(self, h5obj, name=None):
         kwargs = {
@@ -320,6 +347,19 @@ class HDF5IO(FORMIO):
             if isinstance(val, bytes):
                 kwargs['attributes'][key] = val.decode('UTF-8')
 
+        profiler = self.manager.profiler
+        if profiler is None:
+            return self.__build_dataset(h5obj, name, kwargs)
+        event = self.__start_read(profiler, kwargs['attributes'])
+        nbytes = 0
+        try:
+            ret = self.__build_dataset(h5obj, name, kwargs)
+            nbytes = h5obj.id.get_storage_size()
+        finally:
+            profiler.stop(event, nbytes)
+        return ret
+
+    def __build_dataset(self, h5obj, name, kwargs):
         if name is None:
             name = str(os.path.basename(h5obj.name))
         kwargs['source'] = self.__path
@@ -363,6 +403,12 @@ class HDF5IO(FORMIO):
         ret.written = True
         return ret
 
+    def __start_read(self, profiler, attributes):
+        data_type = attributes.get(self.manager.namespace_catalog.group_spec_cls.type_key())
+        event = profiler.start('read', data_type)
+        profiler.add_hdf5_calls(len(attributes) + 1)
+        return event
+
     def __read_attrs(self, h5obj):
         ret = dict()
         for k, v in h5obj.attrs.items():
@@ -408,7 +454,16 @@ class HDF5IO(FORMIO):
         for name, dbldr in f_builder.datasets.items():
             self.write_dataset(self.__file, dbldr, link_data)
         self.set_attributes(self.__file, f_builder.attributes)
-        self.__add_refs()
+        profiler = self.manager.profiler
+        if profiler is None:
+            self.__add_refs()
+        else:
+            event = profiler.start('write_references', None)
+            profiler.add_hdf5_calls(len(self.__ref_queue))
+            try:
+                self.__add_refs()
+            finally:
+                profiler.stop(event)
 
     def __add_refs(self):
         '''
@@ -500,6 +555,8 @@ class HDF5IO(FORMIO):
              'doc': 'a dict containing the attributes on the Group or Dataset, indexed by attribute name'})
     def set_attributes(self, **kwargs):
         obj, attributes = getargs('obj', 'attributes', kwargs)
+        if self.manager.profiler is not None:
+            self.manager.profiler.add_hdf5_calls(len(attributes))
         for key, value in attributes.items():
             if isinstance(value, (set, list, tuple)):
                 tmp = tuple(value)
@@ -538,6 +595,17 @@ class HDF5IO(FORMIO):
     def write_group(self, **kwargs):
 
         parent, builder = getargs('parent', 'builder', kwargs)
+        profiler = self.manager.profiler
+        if profiler is None:
+            return self.__write_group(parent, builder)
+        event = profiler.start('write', self.manager.get_builder_ns_dt(builder)[1])
+        profiler.add_hdf5_calls()
+        try:
+            return self.__write_group(parent, builder)
+        finally:
+            profiler.stop(event)
+
+    def __write_group(self, parent, builder):
         if builder.written:
             group = parent[builder.name]
         else:
@@ -580,6 +648,17 @@ class HDF5IO(FORMIO):
         parent, builder = getargs('parent', 'builder', kwargs)
         if builder.written:
             return None
+        profiler = self.manager.profiler
+        if profiler is None:
+            return self.__write_link(parent, builder)
+        event = profiler.start('write', self.manager.get_builder_ns_dt(builder)[1])
+        profiler.add_hdf5_calls()
+        try:
+            return self.__write_link(parent, builder)
+        finally:
+            profiler.stop(event)
+
+    def __write_link(self, parent, builder):
         name = builder.name
         target_builder = builder.builder
         path = self.__get_path(target_builder)
@@ -609,6 +688,21 @@ class HDF5IO(FORMIO):
         parent, builder, link_data = getargs('parent', 'builder', 'link_data', kwargs)
         if builder.written:
             return None
+        profiler = self.manager.profiler
+        if profiler is None:
+            return self.__write_dataset(parent, builder, link_data)
+        event = profiler.start('write', self.manager.get_builder_ns_dt(builder)[1])
+        profiler.add_hdf5_calls()
+        nbytes = 0
+        try:
+            ret = self.__write_dataset(parent, builder, link_data)
+            if isinstance(parent.get(builder.name, getlink=True), HardLink):
+                nbytes = parent[builder.name].id.get_storage_size()
+        finally:
+            profiler.stop(event, nbytes)
+        return ret
+
+    def __write_dataset(self, parent, builder, link_data):  # noqa: C901
         name = builder.name
         data = builder.data
         options = dict()   # dict with additional
@@ -27,17 +27,25 @@ class FORMIO(with_metaclass(ABCMeta, object)):
         '''The source of the container being read/written i.e. file path'''
         return self.__source
 
-    @docval(returns='the Container object that was read in', rtype=Container)
+    @docval({'name': 'max_workers', 'type': int,
+             'doc': 'the number of threads to use for constructing independent parts of the file concurrently',
+             'default': None},
+            returns='the Container object that was read in', rtype=Container)
     def read(self, **kwargs):
+        max_workers = getargs('max_workers', kwargs)
         f_builder = self.read_builder()
-        container = self.__manager.construct(f_builder)
+        container = self.__manager.construct(f_builder, max_workers=max_workers)
         return container
 
     @docval({'name': 'container', 'type': Container, 'doc': 'the Container object to write'})
     def write(self, **kwargs):
         container = popargs('container', kwargs)
-        f_builder = self.__manager.build(container, source=self.__source)
-        self.write_builder(f_builder, **kwargs)
+        self.__manager.pin()
+        try:
+            f_builder = self.__manager.build(container, source=self.__source)
+            self.write_builder(f_builder, **kwargs)
+        finally:
+            self.__manager.unpin()
 
     @abstractmethod
     @docval(returns='a GroupBuilder representing the read data', rtype='GroupBuilder')
@@ -9,3 +9,5 @@ from .builders import LinkBuilder
 from .map import ObjectMapper
 from .map import BuildManager
 from .map import TypeMap
+
+from .profile import Profiler
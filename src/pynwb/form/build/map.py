@@ -1,17 +1,20 @@
 from __future__ import absolute_import
 import re
+import threading
 import numpy as np
 import warnings
 from collections import OrderedDict
 from copy import copy
 from datetime import datetime
+from itertools import chain
 from six import with_metaclass, raise_from, text_type, binary_type, integer_types
 
-from ..utils import docval, getargs, ExtenderMeta, get_docval, fmt_docval_args, call_docval_func
+from ..utils import docval, getargs, ExtenderMeta, get_docval, fmt_docval_args, call_docval_func, walk_generators, \
+                    WeakIdentityMap
 from ..container import Container, Data, DataRegion
 from ..spec import Spec, AttributeSpec, DatasetSpec, GroupSpec, LinkSpec, NAME_WILDCARD, NamespaceCatalog, RefSpec,\
                    SpecReader
-from ..data_utils import DataIO, AbstractDataChunkIterator
+from ..data_utils import DataIO, AbstractDataChunkIterator, ArrayBuffer
 from ..spec.spec import BaseStorageSpec
 from .builders import DatasetBuilder, GroupBuilder, LinkBuilder, Builder, ReferenceBuilder, RegionBuilder, BaseBuilder
 from .warnings import OrphanContainerWarning, MissingRequiredWarning
@@ -94,18 +97,65 @@ class BuildManager(object):
     """
 
     def __init__(self, type_map):
-        self.__builders = dict()
-        self.__containers = dict()
+        # Builders and Containers are only kept alive by the objects they are built from, and by the
+        # objects pinned while writing, so that memory tracks the Containers held by the caller
+        self.__builders = WeakIdentityMap()                    # the Builder for each Container
+        self.__containers = WeakIdentityMap(weak_values=True)  # the Container for each Builder
+        self.__pinned = None    # the Containers and Builders kept alive while pinned
+        self.__pin_count = 0
         self.__type_map = type_map
+        self.__builder_types = WeakIdentityMap()   # the namespace and data_type of each typed builder
+        self.__typed_parents = WeakIdentityMap()   # the closest ancestor with a data_type for each builder
+        self.__construct_lock = None    # set while constructing subtrees concurrently
+        self.__constructing = dict()    # the thread constructing each builder, while constructing concurrently
+        self.__waiting = dict()         # the builder each thread is waiting for, while constructing concurrently
+        self.__profiler = None
 
     @property
     def namespace_catalog(self):
         return self.__type_map.namespace_catalog
 
+    @property
+    def profiler(self):
+        ''' The Profiler to record building, construction and I/O with, or None if profiling is off '''
+        return self.__profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        self.__profiler = profiler
+
     @property
     def type_map(self):
         return self.__type_map
 
+    def clear(self):
+        '''
+        Forget the Builders and Containers built and constructed so far, so that this BuildManager
+        can be reused for another file without holding on to the objects of the previous one
+        '''
+        self.__builders.clear()
+        self.__containers.clear()
+        self.__builder_types.clear()
+        self.__typed_parents.clear()
+
+    def pin(self):
+        '''
+        Keep the Containers and Builders built or constructed from now on alive until unpin is called,
+        e.g. while writing a file, so that Builders of temporary Containers are not built twice.
+        Calls can be nested, and each call must be matched by a call to unpin.
+        '''
+        if self.__pin_count == 0:
+            self.__pinned = list()
+        self.__pin_count += 1
+
+    def unpin(self):
+        ''' Stop keeping the objects pinned since the matching call to pin alive '''
+        if self.__pin_count == 0:
+            raise ValueError('BuildManager is not pinned')
+        self.__pin_count -= 1
+        if self.__pin_count == 0:
+            self.__pinned = None
+
     @docval({"name": "object", "type": (BaseBuilder, Container), "doc": "the container or builder to get a proxy for"},
             {"name": "source", "type": str,
              "doc": "the source of container being built i.e. file path", 'default': None})
@@ -117,8 +167,10 @@ class BuildManager(object):
             return self.__get_proxy_container(obj)
 
     def __get_proxy_builder(self, builder):
-        dt = self.__type_map.get_builder_dt(builder)
-        ns = self.__type_map.get_builder_ns(builder)
+        ns, dt = self.get_builder_ns_dt(builder)
+        if dt is None:
+            msg = "builder '%s' does not have a data_type" % builder.name
+            raise ValueError(msg)
         stack = list()
         tmp = builder
         while tmp is not None:
@@ -147,22 +199,28 @@ class BuildManager(object):
     def build(self, **kwargs):
         """ Build the GroupBuilder for the given Container"""
         container = getargs('container', kwargs)
-        container_id = self.__conthash__(container)
-        result = self.__builders.get(container_id)
+        result = self.__builders.get(container)
         source = getargs('source', kwargs)
-        if result is None:
-            if container.container_source is None:
-                container.container_source = source
-            else:
-                if container.container_source != source:
-                    raise ValueError("Can't change container_source once set")
-            result = self.__type_map.build(container, self, source=source)
-            self.prebuilt(container, result)
-        elif container.modified:
-            if isinstance(result, GroupBuilder):
-                # TODO: if Datasets attributes are allowed to be modified, we need to
-                # figure out how to handle that starting here.
-                result = self.__type_map.build(container, self, builder=result, source=source)
+        event = None
+        if self.__profiler is not None and (result is None or container.modified):
+            event = self.__profiler.start('build', self.__type_map.get_container_ns_dt(container)[1])
+        try:
+            if result is None:
+                if container.container_source is None:
+                    container.container_source = source
+                else:
+                    if container.container_source != source:
+                        raise ValueError("Can't change container_source once set")
+                result = self.__type_map.build(container, self, source=source)
+                self.prebuilt(container, result)
+            elif container.modified:
+                if isinstance(result, GroupBuilder):
+                    # TODO: if Datasets attributes are allowed to be modified, we need to
+                    # figure out how to handle that starting here.
+                    result = self.__type_map.build(container, self, builder=result, source=source)
+        finally:
+            if event is not None:
+                self.__profiler.stop(event)
         return result
 
     @docval({"name": "container", "type": Container, "doc": "the Container to save as prebuilt"},
@@ -171,27 +229,102 @@ class BuildManager(object):
     def prebuilt(self, **kwargs):
         ''' Save the Builder for a given Container for future use '''
         container, builder = getargs('container', 'builder', kwargs)
-        container_id = self.__conthash__(container)
-        self.__builders[container_id] = builder
-        builder_id = self.__bldrhash__(builder)
-        self.__containers[builder_id] = container
+        lock = self.__construct_lock
+        if lock is None:
+            self.__set_prebuilt(container, builder)
+        else:
+            with lock:
+                self.__set_prebuilt(container, builder)
 
-    def __conthash__(self, obj):
-        return id(obj)
+    def __set_prebuilt(self, container, builder):
+        self.__builders[container] = builder
+        self.__containers[builder] = container
+        pinned = self.__pinned
+        if pinned is not None:
+            pinned.append((container, builder))
 
     def __bldrhash__(self, obj):
         return id(obj)
 
     @docval({'name': 'builder', 'type': (DatasetBuilder, GroupBuilder),
-             'doc': 'the builder to construct the Container from'})
+             'doc': 'the builder to construct the Container from'},
+            {'name': 'max_workers', 'type': int,
+             'doc': 'the number of threads to use for constructing independent subtrees of the given builder',
+             'default': None})
     def construct(self, **kwargs):
-        """ Construct the Container represented by the given builder """
-        builder = getargs('builder', kwargs)
+        """ Construct the Container represented by the given builder
+
+        If *max_workers* is greater than one, the typed children of the builder (e.g. each ProcessingModule
+        of a file) are constructed concurrently in a thread pool before the builder itself is constructed.
+        """
+        builder, max_workers = getargs('builder', 'max_workers', kwargs)
         if isinstance(builder, LinkBuilder):
             builder = builder.target
-        builder_id = self.__bldrhash__(builder)
-        result = self.__containers.get(builder_id)
+        result = self.__containers.get(builder)
         if result is None:
+            subtrees = None
+            if max_workers is not None and max_workers > 1 and self.__construct_lock is None:
+                # keep the subtrees alive until they are added to the Container of the builder
+                subtrees = self.__construct_subtrees(builder, max_workers)  # noqa: F841
+            if self.__construct_lock is None:
+                result = self.__construct(builder)
+            else:
+                result = self.__construct_shared(builder)
+        result.set_modified(False)
+        return result
+
+    def __construct_shared(self, builder):
+        '''
+        Construct the given builder while other threads are constructing, so that it is only constructed once.
+
+        If another thread is constructing the builder, wait for it to finish, unless that thread is itself
+        waiting for this one. Builders depending on each other cannot be constructed either way, so then
+        the builder is constructed inline, as it would be without threads, rather than deadlocking.
+        '''
+        lock = self.__construct_lock
+        builder_id = self.__bldrhash__(builder)
+        thread_id = threading.current_thread().ident
+        owner = None
+        with lock:
+            while True:
+                result = self.__containers.get(builder)
+                if result is not None:
+                    return result
+                owner = self.__constructing.get(builder_id)
+                if owner is None:
+                    self.__constructing[builder_id] = thread_id
+                    break
+                if self.__waits_for(owner, thread_id):
+                    break
+                self.__waiting[thread_id] = builder_id
+                try:
+                    lock.wait()
+                finally:
+                    del self.__waiting[thread_id]
+        try:
+            result = self.__construct(builder)
+        finally:
+            with lock:
+                if owner is None:
+                    del self.__constructing[builder_id]
+                lock.notify_all()
+        return result
+
+    def __waits_for(self, thread_id, other_id):
+        ''' Return True if *thread_id* is, or is waiting on a chain of threads that ends in, *other_id* '''
+        seen = set()
+        while thread_id is not None and thread_id not in seen:
+            if thread_id == other_id:
+                return True
+            seen.add(thread_id)
+            builder_id = self.__waiting.get(thread_id)
+            thread_id = None if builder_id is None else self.__constructing.get(builder_id)
+        return False
+
+    def __construct(self, builder):
+        profiler = self.__profiler
+        event = None if profiler is None else profiler.start('construct', self.get_builder_ns_dt(builder)[1])
+        try:
             result = self.__type_map.construct(builder, self)
             parent_builder = self.__get_parent_dt_builder(builder)
             if parent_builder is not None:
@@ -201,9 +334,48 @@ class BuildManager(object):
                 # so it must be time to resolve parents
                 self.__resolve_parents(result)
             self.prebuilt(result, builder)
-        result.set_modified(False)
+        finally:
+            if event is not None:
+                profiler.stop(event)
         return result
 
+    def __get_typed_subtrees(self, builder):
+        ''' Get the builders with a data_type whose closest typed ancestor is the given builder '''
+        ret = list()
+        if not isinstance(builder, GroupBuilder):
+            return ret
+        stack = [builder]
+        while len(stack) > 0:
+            tmp = stack.pop()
+            for sub_builder in chain(tmp.groups.values(), tmp.datasets.values()):
+                if sub_builder is None:     # broken links are read as None
+                    continue
+                if self.get_builder_ns_dt(sub_builder)[1] is not None:
+                    ret.append(sub_builder)
+                elif isinstance(sub_builder, GroupBuilder):
+                    stack.append(sub_builder)
+        return ret
+
+    def __construct_subtrees(self, builder, max_workers):
+        '''
+        Construct the independent subtrees below the given builder in a thread pool.
+
+        The constructed Containers get a Proxy for their parent, which gets resolved
+        once the top-level Container is constructed. Returns the constructed Containers.
+        '''
+        subtrees = [b for b in self.__get_typed_subtrees(builder) if b not in self.__containers]
+        if len(subtrees) < 2:
+            return None
+        from multiprocessing.pool import ThreadPool
+        self.__construct_lock = threading.Condition()
+        pool = ThreadPool(min(max_workers, len(subtrees)))
+        try:
+            return pool.map(self.construct, subtrees)
+        finally:
+            pool.close()
+            pool.join()
+            self.__construct_lock = None
+
     def __resolve_parents(self, container):
         stack = [container]
         while len(stack) > 0:
@@ -216,17 +388,22 @@ class BuildManager(object):
     def __get_parent_dt_builder(self, builder):
         '''
         Get the next builder above the given builder
-        that has a data_type
+        that has a data_type. If no ancestor has a data_type,
+        the top-most ancestor is returned.
         '''
-        tmp = builder.parent
-        ret = None
-        while tmp is not None:
-            try:
-                ret = tmp
-                self.__type_map.get_builder_dt(tmp)
-                break
-            except Exception:
-                tmp = tmp.parent
+        parent = builder.parent
+        if parent is None:
+            return None
+        cached = self.__typed_parents.get(builder)
+        if cached is not None:
+            return cached
+        if self.get_builder_ns_dt(parent)[1] is not None:
+            ret = parent
+        else:
+            ret = self.__get_parent_dt_builder(parent)
+            if ret is None:
+                ret = parent
+        self.__typed_parents[builder] = ret
         return ret
 
     @docval({'name': 'builder', 'type': Builder, 'doc': 'the Builder to get the class object for'})
@@ -259,7 +436,11 @@ class BuildManager(object):
         Get the namespace of a builder
         '''
         builder = getargs('builder', kwargs)
-        return self.__type_map.get_builder_ns(builder)
+        ret = self.get_builder_ns_dt(builder)[0]
+        if ret is None:
+            msg = "builder '%s' does not have a namespace" % builder.name
+            raise ValueError(msg)
+        return ret
 
     @docval({'name': 'builder', 'type': (DatasetBuilder, GroupBuilder, LinkBuilder),
              'doc': 'the builder to get the data_type for'})
@@ -268,7 +449,27 @@ class BuildManager(object):
         Get the data_type of a builder
         '''
         builder = getargs('builder', kwargs)
-        return self.__type_map.get_builder_dt(builder)
+        ret = self.get_builder_ns_dt(builder)[1]
+        if ret is None:
+            msg = "builder '%s' does not have a data_type" % builder.name
+            raise ValueError(msg)
+        return ret
+
+    def get_builder_ns_dt(self, builder):
+        '''
+        Get the namespace and data_type of a builder, or None for each if the builder does not have one.
+
+        Results for typed builders are cached, so repeated lookups for the same builder are cheap.
+        '''
+        if isinstance(builder, LinkBuilder):
+            builder = builder.builder
+        cached = self.__builder_types.get(builder)
+        if cached is not None:
+            return cached
+        ns, dt = self.__type_map.get_builder_ns_dt(builder)
+        if dt is not None:
+            self.__builder_types[builder] = (ns, dt)
+        return ns, dt
 
 
 _const_arg = '__constructor_arg'
@@ -390,6 +591,37 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
             else:
                 return g.type
 
+    @classmethod
+    def __convert_sequence(cls, spec_dtype, value):
+        """
+        Convert a homogeneous list or tuple in a single step rather than element by element.
+
+        Numeric sequences (including nested, rectangular sequences) are converted to a NumPy array.
+        Flat sequences of strings are converted with one pass over the elements.
+
+        :return: a tuple consisting of the converted value and its data type, or (None, None) if
+                 the sequence is not homogeneous and must be converted element by element
+        """
+        if len(value) == 0:
+            return None, None
+        if spec_dtype in (_unicode, _ascii):
+            if not all(isinstance(v, (text_type, binary_type)) for v in value):
+                return None, None
+            ret = type(value)([spec_dtype(v) for v in value])
+            return ret, 'utf8' if spec_dtype is _unicode else 'ascii'
+        with warnings.catch_warnings():
+            # ragged sequences are handled element by element below
+            warnings.simplefilter('ignore')
+            try:
+                arr = np.asarray(value)
+            except ValueError:
+                return None, None
+        if arr.dtype.kind not in 'biuf':
+            return None, None
+        dtype_func = cls.__resolve_dtype(arr.dtype, spec_dtype)
+        ret = arr.astype(dtype_func, copy=False)
+        return ret, ret.dtype.type
+
     @classmethod
     def convert_dtype(cls, spec, value):
         """
@@ -406,12 +638,18 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
             if isinstance(dt, RefSpec):
                 dt = dt.reftype
             return None, dt
+        if isinstance(value, ArrayBuffer):
+            # hand the array or list backing the buffer to the I/O backend, without copying it
+            value = value.data
         if isinstance(value, DataIO):
             return value, cls.convert_dtype(spec, value.data)[1]
         if spec.dtype is None:
             return value, None
         if spec.dtype == 'numeric':
             return value, None
+        if isinstance(spec.dtype, RefSpec):
+            # references are resolved by the I/O backend, so pass them through untouched
+            return value, spec.dtype.reftype
         if spec.dtype is not None and spec.dtype not in cls.__dtypes:
             msg = "unrecognized dtype: %s -- cannot convert value" % spec.dtype
             raise ValueError(msg)
@@ -427,15 +665,17 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                 ret_dtype = "ascii"
             else:
                 dtype_func = cls.__resolve_dtype(value.dtype, spec_dtype)
-                ret = value.astype(dtype_func)
+                ret = value.astype(dtype_func, copy=False)
                 ret_dtype = ret.dtype.type
         elif isinstance(value, (tuple, list)):
-            ret = list()
-            for elem in value:
-                tmp, tmp_dtype = cls.convert_dtype(spec, elem)
-                ret.append(tmp)
-            ret = type(value)(ret)
-            ret_dtype = tmp_dtype
+            ret, ret_dtype = cls.__convert_sequence(spec_dtype, value)
+            if ret is None:
+                ret = list()
+                for elem in value:
+                    tmp, tmp_dtype = cls.convert_dtype(spec, elem)
+                    ret.append(tmp)
+                ret = type(value)(ret)
+                ret_dtype = tmp_dtype
         else:
             if spec_dtype in (_unicode, _ascii):
                 ret_dtype = 'ascii'
@@ -758,7 +998,7 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
             if isinstance(self.spec.dtype, RefSpec):
                 bldr_data = self.__get_ref_builder(self.spec.dtype, self.spec.shape, container, manager)
                 try:
-                    bldr_data, dtype = self.convert_dtype(self.spec, bldr_data)
+                    bldr_data, dtype = self.__convert_data(self.spec, bldr_data, manager)
                 except Exception as ex:
                     msg = 'could not resolve dtype for %s \'%s\'' % (type(container).__name__, container.name)
                     raise_from(Exception(msg), ex)
@@ -773,7 +1013,7 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                         tmp[j] = self.__get_ref_builder(subt.dtype, None, row[j], manager)
                     bldr_data.append(tuple(tmp))
                 try:
-                    bldr_data, dtype = self.convert_dtype(self.spec, bldr_data)
+                    bldr_data, dtype = self.__convert_data(self.spec, bldr_data, manager)
                 except Exception as ex:
                     msg = 'could not resolve dtype for %s \'%s\'' % (type(container).__name__, container.name)
                     raise_from(Exception(msg), ex)
@@ -787,7 +1027,7 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                                              dtype='object')
                 else:
                     try:
-                        bldr_data, dtype = self.convert_dtype(self.spec, container.data)
+                        bldr_data, dtype = self.__convert_data(self.spec, container.data, manager)
                     except Exception as ex:
                         msg = 'could not resolve dtype for %s \'%s\'' % (type(container).__name__, container.name)
                         raise_from(Exception(msg), ex)
@@ -795,6 +1035,20 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
         self.__add_attributes(builder, self.__spec.attributes, container, manager, source)
         return builder
 
+    def __convert_data(self, spec, value, manager):
+        ''' Convert the data of a dataset, recording the conversion if the manager has a Profiler '''
+        profiler = manager.profiler
+        if profiler is None:
+            return self.convert_dtype(spec, value)
+        event = profiler.start('convert_dtype', self.__spec.data_type_def)
+        nbytes = 0
+        try:
+            ret = self.convert_dtype(spec, value)
+            nbytes = getattr(ret[0], 'nbytes', 0)
+        finally:
+            profiler.stop(event, nbytes)
+        return ret
+
     def __is_reftype(self, data):
         tmp = data
         while hasattr(tmp, '__len__') and not isinstance(tmp, (Container, text_type, binary_type)):
@@ -919,7 +1173,7 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                     sub_builder = builder.datasets[spec.name]
                 else:
                     try:
-                        data, dtype = self.convert_dtype(spec, attr_value)
+                        data, dtype = self.__convert_data(spec, attr_value, build_manager)
                     except Exception as ex:
                         msg = 'could not convert \'%s\' for %s \'%s\''
                         msg = msg % (spec.name, type(container).__name__, container.name)
@@ -930,6 +1184,10 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                 self.__add_containers(builder, spec, attr_value, build_manager, source, container)
 
     def __add_groups(self, builder, groups, container, build_manager, source):
+        walk_generators(self.__iter_add_groups(builder, groups, container, build_manager, source))
+
+    def __iter_add_groups(self, builder, groups, container, build_manager, source):
+        ''' Add groups to a builder, yielding a generator for each untyped subgroup that needs filling in '''
         for spec in groups:
             if spec.data_type_def is None and spec.data_type_inc is None:
                 # we don't need to get attr_name since any named
@@ -952,7 +1210,7 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                         for item in it:
                             if isinstance(item, Container):
                                 self.__add_containers(sub_builder, spec, item, build_manager, source, container)
-                self.__add_groups(sub_builder, spec.groups, container, build_manager, source)
+                yield self.__iter_add_groups(sub_builder, spec.groups, container, build_manager, source)
                 empty = sub_builder.is_empty()
                 if not empty or (empty and isinstance(spec.quantity, int)):
                     if sub_builder.name not in builder.groups:
@@ -971,50 +1229,63 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                         self.__add_containers(builder, spec, attr_value, build_manager, source, container)
 
     def __add_containers(self, builder, spec, value, build_manager, source, parent_container):
-        if isinstance(value, Container):
-            if value.parent is None:
-                msg = "'%s' (%s) for '%s' (%s)"\
-                              % (value.name, getattr(value, self.spec.type_key()),
-                                 builder.name, self.spec.data_type_def)
-                warnings.warn(msg, OrphanContainerWarning)
-            if value.modified:                   # writing a new container
-                rendered_obj = build_manager.build(value, source=source)
-                # use spec to determine what kind of HDF5
-                # object this Container corresponds to
-                if isinstance(spec, LinkSpec) or value.parent is not parent_container:
-                    name = spec.name
-                    builder.set_link(LinkBuilder(rendered_obj, name, builder))
-                elif isinstance(spec, DatasetSpec):
-                    if rendered_obj.dtype is None and spec.dtype is not None:
-                        val, dtype = self.convert_dtype(spec, None)
-                        rendered_obj.dtype = dtype
-                    builder.set_dataset(rendered_obj)
+        # use a stack rather than recursion to walk nested lists/tuples/dicts of Containers
+        stack = [value]
+        while len(stack) > 0:
+            value = stack.pop()
+            if isinstance(value, Container):
+                self.__add_container(builder, spec, value, build_manager, source, parent_container)
+            else:
+                if any(isinstance(value, t) for t in (list, tuple)):
+                    values = value
+                elif isinstance(value, dict):
+                    values = value.values()
                 else:
-                    builder.set_group(rendered_obj)
-            elif value.container_source:        # make a link to an existing container
-                if value.container_source != parent_container.container_source or\
-                   value.parent is not parent_container:
-                    rendered_obj = build_manager.build(value, source=source)
-                    builder.set_link(LinkBuilder(rendered_obj, name=spec.name, parent=builder))
+                    msg = ("received %s, expected Container - 'value' "
+                           "must be an Container a list/tuple/dict of "
+                           "Containers if 'spec' is a GroupSpec")
+                    raise ValueError(msg % value.__class__.__name__)
+                stack.extend(reversed([container for container in values if container]))
+
+    def __add_container(self, builder, spec, value, build_manager, source, parent_container):
+        if value.parent is None:
+            msg = "'%s' (%s) for '%s' (%s)"\
+                          % (value.name, getattr(value, self.spec.type_key()),
+                             builder.name, self.spec.data_type_def)
+            warnings.warn(msg, OrphanContainerWarning)
+        if value.modified:                   # writing a new container
+            rendered_obj = build_manager.build(value, source=source)
+            # use spec to determine what kind of HDF5
+            # object this Container corresponds to
+            if isinstance(spec, LinkSpec) or value.parent is not parent_container:
+                name = spec.name
+                builder.set_link(LinkBuilder(rendered_obj, name, builder))
+            elif isinstance(spec, DatasetSpec):
+                if rendered_obj.dtype is None and spec.dtype is not None:
+                    val, dtype = self.convert_dtype(spec, None)
+                    rendered_obj.dtype = dtype
+                builder.set_dataset(rendered_obj)
             else:
-                raise ValueError("Found unmodified Container with no source - '%s' with parent '%s'" %
-                                 (value.name, parent_container.name))
+                builder.set_group(rendered_obj)
+        elif value.container_source:        # make a link to an existing container
+            if value.container_source != parent_container.container_source or\
+               value.parent is not parent_container:
+                rendered_obj = build_manager.build(value, source=source)
+                builder.set_link(LinkBuilder(rendered_obj, name=spec.name, parent=builder))
         else:
-            if any(isinstance(value, t) for t in (list, tuple)):
-                values = value
-            elif isinstance(value, dict):
-                values = value.values()
-            else:
-                msg = ("received %s, expected Container - 'value' "
-                       "must be an Container a list/tuple/dict of "
-                       "Containers if 'spec' is a GroupSpec")
-                raise ValueError(msg % value.__class__.__name__)
-            for container in values:
-                if container:
-                    self.__add_containers(builder, spec, container, build_manager, source, parent_container)
+            raise ValueError("Found unmodified Container with no source - '%s' with parent '%s'" %
+                             (value.name, parent_container.name))
 
     def __get_subspec_values(self, builder, spec, manager):
         ret = dict()
+        walk_generators(self.__iter_subspec_values(builder, spec, manager, ret))
+        return ret
+
+    def __iter_subspec_values(self, builder, spec, manager, ret):
+        '''
+        Add the values for the subspecs of spec found in builder to ret, yielding a generator
+        for each untyped subgroup or dataset that needs to be searched as well
+        '''
         # First get attributes
         attributes = builder.attributes
         for attr_spec in spec.attributes:
@@ -1044,7 +1315,7 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                     datasets[link_builder.name] = target
                 else:
                     groups[link_builder.name] = target
-                dt = manager.get_builder_dt(target)
+                dt = manager.get_builder_ns_dt(target)[1]
                 if dt is not None:
                     link_dt.setdefault(dt, list()).append(target)
             # now assign links to their respective specification
@@ -1056,25 +1327,26 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                     if sub_builder is not None:
                         ret[subspec] = self.__flatten(sub_builder, subspec, manager)
             # now process groups and datasets
-            self.__get_sub_builders(groups, spec.groups, manager, ret)
-            self.__get_sub_builders(datasets, spec.datasets, manager, ret)
+            for sub_values in chain(self.__iter_sub_builders(groups, spec.groups, manager, ret),
+                                    self.__iter_sub_builders(datasets, spec.datasets, manager, ret)):
+                yield sub_values
         elif isinstance(spec, DatasetSpec):
             if not isinstance(builder, DatasetBuilder):
                 raise ValueError("__get_subspec_values - must pass DatasetBuilder with DatasetSpec")
             ret[spec] = builder.data
-        return ret
 
-    def __get_sub_builders(self, sub_builders, subspecs, manager, ret):
-        # index builders by data_type
+    def __iter_sub_builders(self, sub_builders, subspecs, manager, ret):
+        # index builders by data_type, and by the data_types they extend
         builder_dt = dict()
+        hierarchies = dict()
         for g in sub_builders.values():
-            try:
-                dt = manager.get_builder_dt(g)
-                ns = manager.get_builder_ns(g)
-            except ValueError:
-                continue
-            if dt is not None:
-                for parent_dt in manager.namespace_catalog.get_hierarchy(ns, dt):
+            ns_dt = manager.get_builder_ns_dt(g)
+            if ns_dt[1] is not None and ns_dt[0] is not None:
+                hierarchy = hierarchies.get(ns_dt)
+                if hierarchy is None:
+                    hierarchy = manager.namespace_catalog.get_hierarchy(*ns_dt)
+                    hierarchies[ns_dt] = hierarchy
+                for parent_dt in hierarchy:
                     builder_dt.setdefault(parent_dt, list()).append(g)
         for subspec in subspecs:
             # first get data type for the spec
@@ -1095,8 +1367,8 @@ class ObjectMapper(with_metaclass(ExtenderMeta, object)):
                 if sub_builder is None:
                     continue
                 if dt is None:
-                    # recurse
-                    ret.update(self.__get_subspec_values(sub_builder, subspec, manager))
+                    # search the untyped sub-builder next
+                    yield self.__iter_subspec_values(sub_builder, subspec, manager, ret)
                 else:
                     ret[subspec] = manager.construct(sub_builder)
 
@@ -1199,16 +1471,39 @@ class TypeMap(object):
         self.__container_types = OrderedDict()
         self.__data_types = dict()
         self.__default_mapper_cls = getargs('mapper_cls', kwargs)
+        self.__builder_maps = dict()  # the (container class, ObjectMapper) resolved for each (namespace, data_type)
+        self.__shared = False  # whether the dicts above are shared with a copy of this TypeMap
 
     @property
     def namespace_catalog(self):
         return self.__ns_catalog
 
     def __copy__(self):
+        '''
+        Copy this TypeMap.
+
+        The copy shares its registered types and mappers with this TypeMap until either of them
+        gets modified, so copying does not depend on the number of registered types.
+        '''
         ret = TypeMap(copy(self.__ns_catalog), self.__default_mapper_cls)
-        ret.merge(self)
+        ret.__mappers = self.__mappers
+        ret.__mapper_cls = self.__mapper_cls
+        ret.__container_types = self.__container_types
+        ret.__data_types = self.__data_types
+        ret.__builder_maps = self.__builder_maps
+        ret.__shared = self.__shared = True
         return ret
 
+    def __detach(self):
+        ''' Stop sharing state with copies of this TypeMap. Call this before registering types or mappers '''
+        if self.__shared:
+            self.__mappers = copy(self.__mappers)
+            self.__mapper_cls = copy(self.__mapper_cls)
+            self.__container_types = OrderedDict((k, copy(v)) for k, v in self.__container_types.items())
+            self.__data_types = copy(self.__data_types)
+            self.__builder_maps = dict()
+            self.__shared = False
+
     def __deepcopy__(self, memo):
         # XXX: From @nicain: All of a sudden legacy tests started
         #      needing this argument in deepcopy. Doesn't hurt anything, though.
@@ -1242,6 +1537,8 @@ class TypeMap(object):
             {'name': 'reader',
              'type': SpecReader,
              'doc': 'the class to user for reading specifications', 'default': None},
+            {'name': 'cache_dir', 'type': str,
+             'doc': 'a directory for caching the loaded specifications between sessions', 'default': None},
             returns="the namespaces loaded from the given file", rtype=tuple)
     def load_namespaces(self, **kwargs):
         '''Load namespaces from a namespace file.
@@ -1254,10 +1551,13 @@ class TypeMap(object):
         for new_ns, ns_deps in deps.items():
             for src_ns, types in ns_deps.items():
                 for dt in types:
-                    container_cls = self.get_container_cls(src_ns, dt)
+                    container_cls = self.__get_container_cls(src_ns, dt)
+                    if container_cls is None:
+                        container_cls = self.get_container_cls(src_ns, dt)
                     if container_cls is None:
                         container_cls = TypeSource(src_ns, dt)
-                    self.register_container_type(new_ns, dt, container_cls)
+                    # the spec was just loaded, so there is no need to check it exists
+                    self.__register_container_type(new_ns, dt, container_cls)
         return tuple(deps.keys())
 
     _type_map = {
@@ -1413,6 +1713,23 @@ class TypeMap(object):
             raise ValueError(msg)
         return ret
 
+    def get_builder_ns_dt(self, builder):
+        '''
+        Get the namespace and data_type of a builder, or None for each if the builder does not have one.
+
+        Unlike get_builder_ns and get_builder_dt, this does not raise an error for untyped builders.
+        '''
+        if isinstance(builder, LinkBuilder):
+            builder = builder.builder
+        attributes = builder.attributes
+        data_type = attributes.get(self.__ns_catalog.group_spec_cls.type_key())
+        if isinstance(data_type, bytes):
+            data_type = data_type.decode('UTF-8')
+        namespace = attributes.get('namespace')
+        if isinstance(namespace, bytes):
+            namespace = namespace.decode('UTF-8')
+        return namespace, data_type
+
     @docval({'name': 'builder', 'type': Builder,
              'doc': 'the Builder object to get the corresponding Container class for'})
     def get_cls(self, **kwargs):
@@ -1420,7 +1737,36 @@ class TypeMap(object):
         builder = getargs('builder', kwargs)
         data_type = self.get_builder_dt(builder)
         namespace = self.get_builder_ns(builder)
-        return self.get_container_cls(namespace, data_type)
+        return self.__get_builder_map(namespace, data_type)[0]
+
+    def __get_builder_map(self, namespace, data_type):
+        '''
+        Get the container class and ObjectMapper for a namespace and data_type.
+
+        The result is cached until another container class or ObjectMapper class gets registered.
+        '''
+        key = (namespace, data_type)
+        ret = self.__builder_maps.get(key)
+        if ret is None:
+            container_cls = self.get_container_cls(namespace, data_type)
+            ret = (container_cls, self.__get_mapper(container_cls, namespace, data_type))
+            self.__builder_maps[key] = ret
+        return ret
+
+    def __get_mapper(self, container_cls, namespace, data_type):
+        mapper = self.__mappers.get(container_cls)
+        if mapper is None:
+            spec = self.__ns_catalog.get_spec(namespace, data_type)
+            mapper_cls = self.__default_mapper_cls
+            for cls in container_cls.__mro__:
+                tmp_mapper_cls = self.__mapper_cls.get(cls)
+                if tmp_mapper_cls is not None:
+                    mapper_cls = tmp_mapper_cls
+                    break
+
+            mapper = mapper_cls(spec)
+            self.__mappers[container_cls] = mapper
+        return mapper
 
     @docval({'name': 'spec', 'type': (DatasetSpec, GroupSpec), 'doc': 'the parent spec to search'},
             {'name': 'builder', 'type': (DatasetBuilder, GroupBuilder, LinkBuilder),
@@ -1482,24 +1828,11 @@ class TypeMap(object):
             namespace, data_type = self.get_container_ns_dt(obj)
             if namespace is None:
                 raise ValueError("class %s is not mapped to a data_type" % container_cls)
+            return self.__get_mapper(container_cls, namespace, data_type)
         else:
             data_type = self.get_builder_dt(obj)
             namespace = self.get_builder_ns(obj)
-            container_cls = self.get_cls(obj)
-        # now build the ObjectMapper class
-        spec = self.__ns_catalog.get_spec(namespace, data_type)
-        mapper = self.__mappers.get(container_cls)
-        if mapper is None:
-            mapper_cls = self.__default_mapper_cls
-            for cls in container_cls.__mro__:
-                tmp_mapper_cls = self.__mapper_cls.get(cls)
-                if tmp_mapper_cls is not None:
-                    mapper_cls = tmp_mapper_cls
-                    break
-
-            mapper = mapper_cls(spec)
-            self.__mappers[container_cls] = mapper
-        return mapper
+            return self.__get_builder_map(namespace, data_type)[1]
 
     @docval({"name": "namespace", "type": str, "doc": "the namespace containing the data_type to map the class to"},
             {"name": "data_type", "type": str, "doc": "the data_type to map the class to"},
@@ -1508,10 +1841,17 @@ class TypeMap(object):
         ''' Map a container class to a data_type '''
         namespace, data_type, container_cls = getargs('namespace', 'data_type', 'container_cls', kwargs)
         spec = self.__ns_catalog.get_spec(namespace, data_type)    # make sure the spec exists
+        self.__register_container_type(namespace, data_type, container_cls, spec.type_key())
+
+    def __register_container_type(self, namespace, data_type, container_cls, type_key=None):
+        if type_key is None:
+            type_key = self.__ns_catalog.group_spec_cls.type_key()
+        self.__detach()
         self.__container_types.setdefault(namespace, dict())
         self.__container_types[namespace][data_type] = container_cls
         self.__data_types.setdefault(container_cls, (namespace, data_type))
-        setattr(container_cls, spec.type_key(), data_type)
+        self.__builder_maps.clear()
+        setattr(container_cls, type_key, data_type)
         setattr(container_cls, 'namespace', namespace)
 
     @docval({"name": "container_cls", "type": type,
@@ -1522,7 +1862,9 @@ class TypeMap(object):
         container_cls, mapper_cls = getargs('container_cls', 'mapper_cls', kwargs)
         if self.get_container_cls_dt(container_cls) == (None, None):
             raise ValueError('cannot register map for type %s - no data_type found' % container_cls)
+        self.__detach()
         self.__mapper_cls[container_cls] = mapper_cls
+        self.__builder_maps.clear()
 
     @docval({"name": "container", "type": Container, "doc": "the container to convert to a Builder"},
             {"name": "manager", "type": BuildManager,
@@ -0,0 +1,118 @@
+import json
+import threading
+from copy import deepcopy
+from timeit import default_timer
+
+from ..utils import docval, getargs
+
+
+class Profiler(object):
+    '''
+    Collect counts, timings, bytes and HDF5 calls for the phases of reading and writing data.
+
+    To profile I/O, set the profiler on the BuildManager, e.g. ``io.manager.profiler = Profiler()``.
+    The BuildManager, ObjectMappers and HDF5IO objects using that manager then record each Builder or
+    Container they process, keyed by phase and data_type (None for objects without a data_type).
+
+    The phases recorded are:
+
+    - *build*: converting a Container into a Builder (BuildManager.build)
+    - *convert_dtype*: converting dataset values while building (ObjectMapper.convert_dtype)
+    - *construct*: converting a Builder into a Container (BuildManager.construct)
+    - *write*: writing a Builder to HDF5 (HDF5IO.write_group, write_dataset and write_link)
+    - *write_references*: resolving references queued during the write
+    - *read*: reading a Builder from HDF5
+
+    Nested calls are included in the *time* of the caller. *self_time* excludes time spent in nested calls.
+    '''
+
+    STAT_KEYS = ('count', 'time', 'self_time', 'bytes', 'hdf5_calls')
+
+    def __init__(self):
+        self.__stats = dict()
+        self.__hooks = list()
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+
+    @docval({'name': 'hook', 'type': None,
+             'doc': 'a function to call with (phase, data_type, time, bytes, hdf5_calls) for each event recorded'})
+    def add_hook(self, **kwargs):
+        ''' Add a function to call every time an event gets recorded '''
+        hook = getargs('hook', kwargs)
+        if not callable(hook):
+            raise ValueError("'hook' must be callable - got %s" % type(hook))
+        self.__hooks.append(hook)
+
+    def __get_stack(self):
+        stack = getattr(self.__local, 'stack', None)
+        if stack is None:
+            stack = list()
+            self.__local.stack = stack
+        return stack
+
+    def start(self, phase, data_type):
+        '''
+        Start timing an event. Returns a handle to pass to stop.
+
+        Events started while this one is running are treated as nested in it.
+        '''
+        frame = [phase, data_type, default_timer(), 0.0, 0]
+        self.__get_stack().append(frame)
+        return frame
+
+    def stop(self, frame, nbytes=0):
+        ''' Stop timing an event started with start, and record it '''
+        elapsed = default_timer() - frame[2]
+        stack = self.__get_stack()
+        if any(f is frame for f in stack):
+            while stack.pop() is not frame:
+                # an exception was raised in a nested event before it was stopped
+                pass
+        if len(stack) > 0:
+            stack[-1][3] += elapsed
+        phase, data_type = frame[0], frame[1]
+        hdf5_calls = frame[4]
+        with self.__lock:
+            stats = self.__stats.setdefault(phase, dict()).get(data_type)
+            if stats is None:
+                stats = dict.fromkeys(self.STAT_KEYS, 0)
+                self.__stats[phase][data_type] = stats
+            stats['count'] += 1
+            stats['time'] += elapsed
+            stats['self_time'] += elapsed - frame[3]
+            stats['bytes'] += nbytes
+            stats['hdf5_calls'] += hdf5_calls
+        for hook in self.__hooks:
+            hook(phase, data_type, elapsed, nbytes, hdf5_calls)
+
+    def add_hdf5_calls(self, count=1):
+        ''' Add to the number of HDF5 calls made by the innermost running event '''
+        stack = self.__get_stack()
+        if len(stack) > 0:
+            stack[-1][4] += count
+
+    @docval(returns='the statistics for each phase and data_type', rtype=dict)
+    def report(self, **kwargs):
+        '''
+        Get the statistics collected so far.
+
+        The result is a dict of phase -> data_type -> statistics, where the statistics
+        are a dict with the keys 'count', 'time', 'self_time', 'bytes' and 'hdf5_calls'.
+        '''
+        with self.__lock:
+            return deepcopy(self.__stats)
+
+    @docval({'name': 'indent', 'type': int, 'doc': 'the indent to use when formatting the JSON', 'default': None},
+            returns='the statistics for each phase and data_type as JSON', rtype=str)
+    def to_json(self, **kwargs):
+        ''' Get the statistics collected so far as a JSON string. Objects without a data_type are reported as "null" '''
+        indent = getargs('indent', kwargs)
+        ret = dict()
+        for phase, stats in self.report().items():
+            ret[phase] = {('null' if dt is None else dt): val for dt, val in stats.items()}
+        return json.dumps(ret, indent=indent, sort_keys=True)
+
+    def reset(self):
+        ''' Discard the statistics collected so far '''
+        with self.__lock:
+            self.__stats = dict()
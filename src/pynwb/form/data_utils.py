@@ -3,7 +3,7 @@ from collections import Iterable
 from operator import itemgetter
 
 import numpy as np
-from six import with_metaclass, text_type, binary_type
+from six import with_metaclass, text_type, binary_type, integer_types
 
 from .container import Data, DataRegion
 from .utils import docval, getargs, popargs, docval_macro, get_data_shape
@@ -27,6 +27,133 @@ def get_shape(data):
         return None
 
 
+@docval_macro('array_data')
+class ArrayBuffer(object):
+    '''
+    A one-dimensional sequence of values that can be appended to in amortised constant time.
+
+    Numbers are stored in a NumPy array whose capacity doubles whenever it is full. The dtype of the
+    array is taken from the first value, and widened if a later value does not fit it. If a value that
+    is not a number is added, e.g. a string or a list, all values are kept in a list from then on.
+
+    :py:attr:`data` and indexing return views of the array, so they do not copy the values.
+    '''
+
+    __min_capacity = 16
+    __numbers = (bool, float, np.bool_, np.number) + integer_types
+    __number_kinds = 'biufc'
+
+    @docval({'name': 'data', 'type': 'array_data', 'doc': 'the values to start with', 'default': None})
+    def __init__(self, **kwargs):
+        data = getargs('data', kwargs)
+        self.__array = None     # the storage for numbers, of which the first __len elements are used
+        self.__len = 0
+        self.__list = None      # the storage for values once a value that is not a number was added
+        if data is not None:
+            self.extend(data)
+
+    @property
+    def data(self):
+        ''' The values in this buffer, as a view of the NumPy array or as a list '''
+        if self.__list is not None:
+            return self.__list
+        if self.__array is None:
+            return list()
+        return self.__array[:self.__len]
+
+    @property
+    def dtype(self):
+        ''' The dtype of the values, or None if they are kept in a list '''
+        if self.__array is None:
+            return None
+        return self.__array.dtype
+
+    def __to_list(self):
+        if self.__list is None:
+            self.__list = self.data.tolist() if self.__array is not None else list()
+            self.__array = None
+            self.__len = 0
+        return self.__list
+
+    def __reserve(self, n, dtype):
+        ''' Make room for n more values that fit the given dtype '''
+        array = self.__array
+        if array is None:
+            self.__array = np.empty(max(n, self.__min_capacity), dtype=dtype)
+            return
+        if not np.can_cast(dtype, array.dtype):
+            dtype = np.promote_types(array.dtype, dtype)
+        else:
+            dtype = array.dtype
+        needed = self.__len + n
+        if needed > len(array) or dtype != array.dtype:
+            capacity = len(array)
+            while capacity < needed:
+                capacity *= 2
+            array = np.empty(capacity, dtype=dtype)
+            array[:self.__len] = self.__array[:self.__len]
+            self.__array = array
+
+    def append(self, value):
+        ''' Add a value to the end of this buffer '''
+        if self.__list is None and isinstance(value, self.__numbers):
+            self.__reserve(1, np.asarray(value).dtype)
+            self.__array[self.__len] = value
+            self.__len += 1
+        else:
+            self.__to_list().append(value)
+
+    def extend(self, values):
+        ''' Add the given values to the end of this buffer '''
+        if self.__list is None:
+            if isinstance(values, np.ndarray):
+                array = values if values.ndim == 1 and values.dtype.kind in self.__number_kinds else None
+            else:
+                values = list(values)
+                array = None
+                if all(isinstance(v, self.__numbers) for v in values):
+                    array = np.asarray(values)
+            if array is not None:
+                if len(array) > 0:
+                    self.__reserve(len(array), array.dtype)
+                    self.__array[self.__len:self.__len + len(array)] = array
+                    self.__len += len(array)
+                return
+        self.__to_list().extend(values)
+
+    def __len__(self):
+        if self.__list is not None:
+            return len(self.__list)
+        return self.__len
+
+    def __getitem__(self, key):
+        data = self.data
+        if isinstance(data, list) and isinstance(key, (list, tuple, np.ndarray)):
+            return [data[i] for i in key]
+        return data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.data, dtype=dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, ArrayBuffer):
+            other = other.data
+        if not hasattr(other, '__len__') or len(other) != len(self):
+            return False
+        return all(np.array_equal(a, b) for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.data)
+
+
 @docval_macro('array_data')
 class AbstractDataChunkIterator(with_metaclass(ABCMeta, object)):
     """
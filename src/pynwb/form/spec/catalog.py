@@ -15,14 +15,14 @@ class SpecCatalog(object):
         :ivar __specs: Dict with the specification of each registered type
         :ivar __parent_types: Dict with parent types for each registered type
         :ivar __spec_source_files: Dict with the path to the source files (if available) for each registered type
-        :ivar __hierarchy: Dict describing the hierarchy for each registered type.
-                    NOTE: Always use SpecCatalog.get_hierarchy(...) to retrieve the hierarchy
-                    as this dictionary is used like a cache, i.e., to avoid repeated calcuation
-                    of the hierarchy but the contents are computed on first request by SpecCatalog.get_hierarchy(...)
+        :ivar __index: Tuple with a dict of the hierarchy and a dict of the subtypes of each registered type.
+                    NOTE: Always use SpecCatalog.get_hierarchy(...) and SpecCatalog.get_subtypes(...) to
+                    query the index, since it is computed on first request and discarded when a spec
+                    gets registered
         '''
         self.__specs = OrderedDict()
         self.__parent_types = dict()
-        self.__hierarchy = dict()
+        self.__index = None
         self.__spec_source_files = dict()
 
     @docval({'name': 'spec', 'type': BaseStorageSpec, 'doc': 'a Spec object'},
@@ -44,6 +44,7 @@ class SpecCatalog(object):
             raise ValueError("'%s' - cannot overwrite existing specification" % type_name)
         self.__specs[type_name] = spec
         self.__spec_source_files[type_name] = source_file
+        self.__index = None
 
     @docval({'name': 'data_type', 'type': str, 'doc': 'the data_type to get the Spec for'},
             returns="the specification for writing the given object type to HDF5 ", rtype='Spec')
@@ -99,27 +100,48 @@ class SpecCatalog(object):
                 ret.extend(self.auto_register(group_spec, source_file))
         return tuple(ret)
 
+    def __get_index(self):
+        ''' Compute the hierarchy and the subtypes of all registered types '''
+        index = self.__index
+        if index is None:
+            hierarchy = dict()
+            subtypes = OrderedDict((data_type, list()) for data_type in self.__specs)
+            for data_type in self.__specs:
+                ancestors = list()
+                parent = data_type
+                while parent is not None:
+                    ancestors.append(parent)
+                    parent = self.__parent_types.get(parent)
+                hierarchy[data_type] = tuple(ancestors)
+                for parent in ancestors[1:]:
+                    subtypes.setdefault(parent, list()).append(data_type)
+            index = (hierarchy, {k: tuple(v) for k, v in subtypes.items()})
+            self.__index = index
+        return index
+
     @docval({'name': 'data_type', 'type': (str, type),
              'doc': 'the data_type to get the hierarchy of'})
     def get_hierarchy(self, **kwargs):
-        ''' Get the extension hierarchy for the given data_type '''
+        ''' Get the extension hierarchy for the given data_type, starting with the data_type itself '''
         data_type = getargs('data_type', kwargs)
         if isinstance(data_type, type):
             data_type = data_type.__name__
-        ret = self.__hierarchy.get(data_type)
-        if ret is None:
-            hierarchy = list()
-            parent = data_type
-            while parent is not None:
-                hierarchy.append(parent)
-                parent = self.__parent_types.get(parent)
-            # store computed hierarchy for later
-            tmp_hier = tuple(hierarchy)
-            ret = tmp_hier
-            while len(tmp_hier) > 0:
-                self.__hierarchy[tmp_hier[0]] = tmp_hier
-                tmp_hier = tmp_hier[1:]
-        return tuple(ret)
+        return self.__get_index()[0].get(data_type, (data_type,))
+
+    @docval({'name': 'data_type', 'type': (str, type),
+             'doc': 'the data_type to get the subtypes of'},
+            {'name': 'recursive', 'type': bool,
+             'doc': 'whether or not to include the subtypes of subtypes', 'default': True},
+            returns='the registered types that extend the given data_type', rtype=tuple)
+    def get_subtypes(self, **kwargs):
+        ''' Get the registered types that extend the given data_type, not including the data_type itself '''
+        data_type, recursive = getargs('data_type', 'recursive', kwargs)
+        if isinstance(data_type, type):
+            data_type = data_type.__name__
+        ret = self.__get_index()[1].get(data_type, tuple())
+        if not recursive:
+            ret = tuple(t for t in ret if self.__parent_types.get(t) == data_type)
+        return ret
 
     def __copy__(self):
         ret = SpecCatalog()
@@ -0,0 +1,66 @@
+'''
+Convert YAML namespaces and their specification files to JSON, which is much faster to load.
+
+Usage::
+
+    python -m pynwb.form.spec.convert my_extension.namespace.yaml -o outdir
+
+The converted namespace can then be loaded with ``load_namespaces('outdir/my_extension.namespace.json')``.
+'''
+from __future__ import print_function
+
+import os.path
+
+from argparse import ArgumentParser
+
+from ..utils import docval, getargs
+from .namespace import YAMLSpecReader
+from .write import JSONSpecWriter
+
+
+@docval({'name': 'namespace_path', 'type': str, 'doc': 'the path to the YAML namespace file to convert'},
+        {'name': 'outdir', 'type': str,
+         'doc': 'the directory to write the JSON files to. Defaults to the directory of the namespace file',
+         'default': None},
+        returns='the path to the JSON namespace file', rtype=str, is_method=False)
+def convert_namespace_to_json(**kwargs):
+    '''
+    Convert a YAML namespace file, and the specification files it includes, to JSON.
+
+    Each file is written to *outdir* with its extension replaced with ".json", and the sources
+    in the converted namespace file refer to the converted specification files.
+    '''
+    namespace_path, outdir = getargs('namespace_path', 'outdir', kwargs)
+    indir = os.path.dirname(namespace_path)
+    if outdir is None:
+        outdir = indir
+    elif not os.path.exists(outdir):
+        os.makedirs(outdir)
+    reader = YAMLSpecReader(indir=indir)
+    writer = JSONSpecWriter(outdir=outdir)
+    namespaces = reader.read_namespace(namespace_path)
+    for ns in namespaces:
+        for schema in ns.get('schema', list()):
+            if 'source' in schema:
+                spec = reader.read_spec(schema['source'])
+                source = '%s.json' % os.path.splitext(os.path.basename(schema['source']))[0]
+                writer.write_spec(spec, source)
+                schema['source'] = source
+    ret = os.path.join(outdir, '%s.json' % os.path.splitext(os.path.basename(namespace_path))[0])
+    with open(ret, 'w') as stream:
+        stream.write(JSONSpecWriter.stringify({'namespaces': namespaces}))
+    return ret
+
+
+def main():
+    parser = ArgumentParser(description="Convert YAML namespace and specification files to JSON")
+    parser.add_argument('paths', type=str, nargs='+', help="the namespace files to convert")
+    parser.add_argument('-o', '--outdir', type=str, default=None,
+                        help="the directory to write the JSON files to. Defaults to the directory of each namespace")
+    args = parser.parse_args()
+    for path in args.paths:
+        print(convert_namespace_to_json(path, outdir=args.outdir))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
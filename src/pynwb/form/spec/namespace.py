@@ -2,18 +2,29 @@ from collections import OrderedDict
 from datetime import datetime
 from copy import deepcopy, copy
 import ruamel.yaml as yaml
+import json
 import os.path
+import sys
 import string
+import hashlib
+import tempfile
 from warnings import warn
 from itertools import chain
 from abc import ABCMeta, abstractmethod
 from six import with_metaclass, raise_from
+from six.moves import cPickle as pickle
 
 
 from ..utils import docval, getargs, popargs, get_docval, call_docval_func
 from .catalog import SpecCatalog
 from .spec import DatasetSpec, GroupSpec
 
+# use the LibYAML based loader when it is available, since it is much faster than the pure Python one
+if getattr(yaml, '__with_libyaml__', False):
+    _YAMLLoader = yaml.CSafeLoader
+else:
+    _YAMLLoader = yaml.SafeLoader
+
 
 _namespace_args = [
     {'name': 'doc', 'type': str, 'doc': 'a description about what this namespace represents'},
@@ -162,6 +173,14 @@ class SpecReader(with_metaclass(ABCMeta, object)):
     def read_namespace(self):
         pass
 
+    def content_key(self):
+        '''
+        Get a key identifying the content of all specifications this reader reads, or None if it is not known.
+
+        NamespaceCatalog reuses namespaces it has already loaded from readers with the same content key.
+        '''
+        return None
+
 
 class YAMLSpecReader(SpecReader):
 
@@ -170,10 +189,14 @@ class YAMLSpecReader(SpecReader):
         super_kwargs = {'source': kwargs['indir']}
         call_docval_func(super(YAMLSpecReader, self).__init__, super_kwargs)
 
+    def _load(self, stream):
+        ''' Parse the contents of a specification file '''
+        return yaml.load(stream, Loader=_YAMLLoader)
+
     def read_namespace(self, namespace_path):
         namespaces = None
         with open(namespace_path, 'r') as stream:
-            d = yaml.safe_load(stream)
+            d = self._load(stream)
             namespaces = d.get('namespaces')
             if namespaces is None:
                 raise ValueError("no 'namespaces' found in %s" % namespace_path)
@@ -182,7 +205,7 @@ class YAMLSpecReader(SpecReader):
     def read_spec(self, spec_path):
         specs = None
         with open(self.__get_spec_path(spec_path), 'r') as stream:
-            specs = yaml.safe_load(stream)
+            specs = self._load(stream)
             if not ('datasets' in specs or 'groups' in specs):
                 raise ValueError("no 'groups' or 'datasets' found in %s" % spec_path)
         return specs
@@ -193,6 +216,21 @@ class YAMLSpecReader(SpecReader):
         return os.path.join(self.source, spec_path)
 
 
+class JSONSpecReader(YAMLSpecReader):
+    '''
+    Read namespaces and specifications from JSON files, e.g. those written by JSONSpecWriter.
+
+    JSON files are parsed much faster than YAML files.
+    '''
+
+    def _load(self, stream):
+        return json.load(stream)
+
+
+# the number of namespaces loaded from files that are kept for reuse by other catalogs
+_NAMESPACE_MEMO_SIZE = 8
+
+
 class NamespaceCatalog(object):
 
     @docval({'name': 'group_spec_cls', 'type': type,
@@ -212,17 +250,30 @@ class NamespaceCatalog(object):
         self.__loaded_specs = dict()
         self.__included_specs = dict()
         self.__included_sources = dict()
+        # whether the dicts above are shared with a copy of this catalog
+        self.__shared = False
 
     def __copy__(self):
         ret = NamespaceCatalog(self.__group_spec_cls,
                                self.__dataset_spec_cls,
                                self.__spec_namespace_cls)
-        ret.__namespaces = copy(self.__namespaces)
-        ret.__loaded_specs = copy(self.__loaded_specs)
-        ret.__included_specs = copy(self.__included_specs)
-        ret.__included_sources = copy(self.__included_sources)
+        # share state with the copy until either catalog gets modified
+        ret.__namespaces = self.__namespaces
+        ret.__loaded_specs = self.__loaded_specs
+        ret.__included_specs = self.__included_specs
+        ret.__included_sources = self.__included_sources
+        ret.__shared = self.__shared = True
         return ret
 
+    def __detach(self):
+        ''' Stop sharing state with copies of this catalog. Call this before modifying this catalog '''
+        if self.__shared:
+            self.__namespaces = copy(self.__namespaces)
+            self.__loaded_specs = copy(self.__loaded_specs)
+            self.__included_specs = copy(self.__included_specs)
+            self.__included_sources = {k: list(v) for k, v in self.__included_sources.items()}
+            self.__shared = False
+
     @property
     @docval(returns='a tuple of the available namespaces', rtype=tuple)
     def namespaces(self):
@@ -251,6 +302,7 @@ class NamespaceCatalog(object):
         name, namespace = getargs('name', 'namespace', kwargs)
         if name in self.__namespaces:
             raise KeyError("namespace '%s' already exists" % name)
+        self.__detach()
         self.__namespaces[name] = namespace
 
     @docval({'name': 'name', 'type': str, 'doc': 'the name of this namespace'},
@@ -286,7 +338,7 @@ class NamespaceCatalog(object):
         spec_ns = self.__namespaces.get(namespace)
         if spec_ns is None:
             raise KeyError("'%s' not a namespace" % namespace)
-        return spec_ns.get_hierarchy(data_type)
+        return spec_ns.catalog.get_hierarchy(data_type)
 
     @docval(rtype=tuple)
     def get_sources(self, **kwargs):
@@ -360,10 +412,47 @@ class NamespaceCatalog(object):
         for subspec_dict in it:
             self.__resolve_includes(subspec_dict, catalog)
 
+    # namespaces loaded from readers with a content key, shared by all catalogs in this process. Only the most
+    # recently used ones are kept, so that the specs of files that are no longer read do not stay in memory
+    __namespace_memo = OrderedDict()
+
+    @classmethod
+    def clear_namespace_memo(cls):
+        ''' Forget the namespaces loaded from files, e.g. to free their specs '''
+        cls.__namespace_memo.clear()
+
     def __load_namespace(self, namespace, reader, types_key, resolve=True):
         ns_name = namespace['name']
         if ns_name in self.__namespaces:
             raise KeyError("namespace '%s' already exists" % ns_name)
+        content_key = reader.content_key()
+        if content_key is None:
+            return self.__build_namespace(namespace, reader, types_key, resolve)
+        memo_key = (ns_name, namespace.get('version'), content_key, resolve,
+                    self.__group_spec_cls, self.__dataset_spec_cls, self.__spec_namespace_cls)
+        memo = self.__namespace_memo.pop(memo_key, None)
+        if memo is not None:
+            self.__namespace_memo[memo_key] = memo  # now the most recently used
+            spec_ns, included_types, sources, loaded_specs, included_ns = memo
+            # the memoised namespace can only be reused if it was resolved against the same included namespaces
+            if (all(self.__namespaces.get(name) is inc_ns for name, inc_ns in included_ns) and
+                    not any(source in self.__loaded_specs for source in loaded_specs)):
+                self.__loaded_specs.update(loaded_specs)
+                self.__included_sources.setdefault(ns_name, list()).extend(sources)
+                self.add_namespace(ns_name, spec_ns)
+                return dict(included_types)
+        before = set(self.__loaded_specs)
+        included_types = self.__build_namespace(namespace, reader, types_key, resolve)
+        loaded_specs = {k: v for k, v in self.__loaded_specs.items() if k not in before}
+        included_ns = tuple((name, self.__namespaces[name]) for name in included_types)
+        self.__namespace_memo[memo_key] = (self.__namespaces[ns_name], dict(included_types),
+                                           tuple(self.__included_sources.get(ns_name, ())), loaded_specs, included_ns)
+        while len(self.__namespace_memo) > _NAMESPACE_MEMO_SIZE:
+            self.__namespace_memo.popitem(last=False)
+        return included_types
+
+    def __build_namespace(self, namespace, reader, types_key, resolve):
+        ns_name = namespace['name']
         catalog = SpecCatalog()
         included_types = dict()
         for s in namespace['schema']:
@@ -401,23 +490,41 @@ class NamespaceCatalog(object):
             {'name': 'reader',
              'type': SpecReader,
              'doc': 'the class to user for reading specifications', 'default': None},
+            {'name': 'cache_dir', 'type': str,
+             'doc': 'a directory for caching the loaded specifications between sessions', 'default': None},
             returns='a dictionary describing the dependencies of loaded namespaces', rtype=dict)
     def load_namespaces(self, **kwargs):
-        """Load the namespaces in the given file"""
-        namespace_path, resolve, reader = getargs('namespace_path', 'resolve', 'reader', kwargs)
+        """Load the namespaces in the given file
+
+        If *cache_dir* is given and this catalog is empty, the resolved specifications are pickled into
+        *cache_dir* after loading them from YAML or JSON, and later loads of the same, unchanged files are
+        read from that cache instead. Cache files are keyed by a hash of the namespace file, the
+        specification files it includes, and the source code of the specification classes.
+        """
+        namespace_path, resolve, reader, cache_dir = getargs('namespace_path', 'resolve', 'reader', 'cache_dir',
+                                                             kwargs)
         if reader is None:
             # load namespace definition from file
             if not os.path.exists(namespace_path):
                 msg = "namespace file '%s' not found" % namespace_path
                 raise IOError(msg)
-            reader = YAMLSpecReader(indir=os.path.dirname(namespace_path))
+            if os.path.splitext(namespace_path)[1] == '.json':
+                reader = JSONSpecReader(indir=os.path.dirname(namespace_path))
+            else:
+                reader = YAMLSpecReader(indir=os.path.dirname(namespace_path))
         ns_path_key = os.path.join(reader.source, os.path.basename(namespace_path))
         ret = self.__included_specs.get(ns_path_key)
         if ret is None:
             ret = dict()
         else:
             return ret
+        self.__detach()
         namespaces = reader.read_namespace(namespace_path)
+        cache_path = None
+        if cache_dir is not None and len(self.__namespaces) == 0 and isinstance(reader, YAMLSpecReader):
+            cache_path = self.__get_cache_path(cache_dir, namespace_path, namespaces, reader, resolve)
+            if cache_path is not None and self.__load_cache(cache_path, ns_path_key):
+                return self.__included_specs[ns_path_key]
         types_key = self.__spec_namespace_cls.types_key()
         to_load = list()
         for ns in namespaces:
@@ -429,4 +536,93 @@ class NamespaceCatalog(object):
         for ns in to_load:
             ret[ns['name']] = self.__load_namespace(ns, reader, types_key, resolve=resolve)
         self.__included_specs[ns_path_key] = ret
+        if cache_path is not None:
+            self.__save_cache(cache_path, ret)
         return ret
+
+    # bump this when the layout of the cached state changes
+    __cache_format = 1
+
+    def __get_cache_path(self, cache_dir, namespace_path, namespaces, reader, resolve):
+        h = hashlib.sha1()
+        h.update(repr((self.__cache_format, sys.version_info[:2], pickle.HIGHEST_PROTOCOL, resolve)).encode('utf-8'))
+        classes = (self.__group_spec_cls, self.__dataset_spec_cls, self.__spec_namespace_cls)
+        # the SpecCatalogs of the namespaces are pickled too
+        modules = {SpecCatalog.__module__}
+        for cls in classes:
+            h.update(('%s.%s' % (cls.__module__, cls.__name__)).encode('utf-8'))
+            modules.update(base.__module__ for base in cls.__mro__)
+        paths = [getattr(sys.modules.get(mod), '__file__', None) for mod in sorted(modules)]
+        paths.append(namespace_path)
+        for ns in namespaces:
+            for schema in ns.get('schema', list()):
+                if 'source' in schema:
+                    source = schema['source']
+                    paths.append(source if os.path.isabs(source) else os.path.join(reader.source, source))
+        try:
+            for path in paths:
+                if path is None:
+                    continue
+                if path.endswith('.pyc'):
+                    path = path[:-1]
+                with open(path, 'rb') as f:
+                    h.update(f.read())
+        except (IOError, OSError):
+            return None
+        # the prefix identifies the interpreter and the installation, so that environments sharing a cache
+        # directory keep separate cache files, and only the digest changes when a file is edited in place
+        env = hashlib.sha1(repr([os.path.abspath(path) for path in paths if path is not None]).encode('utf-8'))
+        prefix = '%s-py%d%d-p%d-%s' % (os.path.splitext(os.path.basename(namespace_path))[0],
+                                       sys.version_info[0], sys.version_info[1], pickle.HIGHEST_PROTOCOL,
+                                       env.hexdigest()[:12])
+        return os.path.join(cache_dir, '%s-%s.pkl' % (prefix, h.hexdigest()))
+
+    def __load_cache(self, cache_path, ns_path_key):
+        ''' Load the state of this catalog from the given cache file. Returns False if the cache cannot be used '''
+        if not os.path.exists(cache_path):
+            return False
+        try:
+            with open(cache_path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception:
+            # an unreadable cache is just a cache miss
+            return False
+        self.__namespaces, self.__loaded_specs, included, self.__included_sources = state
+        self.__included_specs = {ns_path_key: included}
+        return True
+
+    def __save_cache(self, cache_path, included):
+        state = (self.__namespaces, self.__loaded_specs, included, self.__included_sources)
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            # write to a temporary file first so that concurrent readers never see a partial cache
+            with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+            if os.path.exists(cache_path):
+                os.remove(tmp_path)
+            else:
+                os.rename(tmp_path, cache_path)
+        except (IOError, OSError, pickle.PicklingError):
+            # caching is only an optimization, so carry on without it
+            return
+        self.__prune_cache(cache_path)
+
+    @staticmethod
+    def __prune_cache(cache_path):
+        ''' Remove the cache files that *cache_path* replaces, i.e. those for older versions of the same files '''
+        cache_dir, cache_name = os.path.split(cache_path)
+        prefix = cache_name[:cache_name.rindex('-') + 1]
+        digest_len = len(cache_name) - len(prefix) - len('.pkl')
+        for name in os.listdir(cache_dir):
+            if name == cache_name or not (name.startswith(prefix) and name.endswith('.pkl')):
+                continue
+            digest = name[len(prefix):-len('.pkl')]
+            if len(digest) != digest_len or not all(c in string.hexdigits for c in digest):
+                continue
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
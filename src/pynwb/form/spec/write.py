@@ -82,6 +82,38 @@ class YAMLSpecWriter(SpecWriter):
             return obj
 
 
+class JSONSpecWriter(SpecWriter):
+    '''
+    Write namespaces and specifications to JSON files.
+
+    Use JSONSpecReader, or pass the path of a namespace file with a .json extension to load_namespaces,
+    to read them back. JSON files are parsed much faster than YAML files.
+    '''
+
+    @docval({'name': 'outdir',
+             'type': str,
+             'doc': 'the path to write the directory to output the namespace and specs too', 'default': '.'})
+    def __init__(self, **kwargs):
+        self.__outdir = getargs('outdir', kwargs)
+
+    @staticmethod
+    def stringify(spec):
+        '''
+        Converts a spec into a JSON string to write to a file
+        '''
+        return json.dumps(spec, indent=2, separators=(',', ': '))
+
+    def __write(self, d, path):
+        with open(os.path.join(self.__outdir, path), 'w') as stream:
+            stream.write(self.stringify(d))
+
+    def write_spec(self, spec_file_dict, path):
+        self.__write(spec_file_dict, path)
+
+    def write_namespace(self, namespace, path):
+        self.__write({'namespaces': [namespace]}, path)
+
+
 class NamespaceBuilder(object):
     ''' A class for building namespace and spec files '''
 
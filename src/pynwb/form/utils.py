@@ -1,5 +1,6 @@
 import copy as _copy
 import itertools as _itertools
+import weakref
 from abc import ABCMeta
 
 import h5py
@@ -581,3 +582,78 @@ def pystr(s):
         return s.decode('utf-8')
     else:
         return s
+
+
+def walk_generators(root):
+    """
+    Run a tree traversal written as nested generators using an explicit stack rather than recursion.
+
+    A generator in the traversal may yield another generator, which is run to completion before the
+    yielding generator is resumed. This keeps deep hierarchies from hitting the Python recursion limit.
+
+    :param root: the generator for the root of the tree
+    """
+    stack = [root]
+    try:
+        while len(stack) > 0:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+            else:
+                stack.append(child)
+    except BaseException:
+        # close the generators that were running, innermost first, so that their cleanup runs now and in order
+        for gen in reversed(stack):
+            gen.close()
+        raise
+
+
+_missing = object()
+
+
+class WeakIdentityMap(object):
+    '''
+    A map from objects to values that compares objects by identity and does not keep them alive.
+
+    Entries are dropped when their object gets garbage collected, so a new object that reuses
+    the id of a collected one never finds the entry of the collected object. If *weak_values* is True,
+    the values are not kept alive either, and entries are also dropped when their value gets collected.
+    '''
+
+    def __init__(self, weak_values=False):
+        self.__data = dict()
+        self.__weak_values = weak_values
+
+        def remove(ref, self_ref=weakref.ref(self)):
+            self = self_ref()
+            if self is not None:
+                entry = self.__data.get(ref.key)
+                if entry is not None and (entry[0] is ref or entry[1] is ref):
+                    self.__data.pop(ref.key, None)
+
+        self.__remove = remove
+
+    def get(self, obj, default=None):
+        entry = self.__data.get(id(obj))
+        if entry is not None and entry[0]() is obj:
+            if not self.__weak_values:
+                return entry[1]
+            value = entry[1]()
+            if value is not None:
+                return value
+        return default
+
+    def __setitem__(self, obj, value):
+        key = id(obj)
+        if self.__weak_values:
+            value = weakref.KeyedRef(value, self.__remove, key)
+        self.__data[key] = (weakref.KeyedRef(obj, self.__remove, key), value)
+
+    def __contains__(self, obj):
+        return self.get(obj, _missing) is not _missing
+
+    def __len__(self):
+        return len(self.__data)
+
+    def clear(self):
+        self.__data.clear()
@@ -146,41 +146,20 @@ class ValidatorMap(object):
     def __init__(self, **kwargs):
         ns = getargs('namespace', kwargs)
         self.__ns = ns
-        tree = dict()
         types = ns.get_registered_types()
         self.__type_key = ns.get_spec(types[0]).type_key()
+        self.__validators = dict()
         for dt in types:
             spec = ns.get_spec(dt)
-            parent = spec.data_type_inc
-            child = spec.data_type_def
-            tree.setdefault(child, list())
-            if parent is not None:
-                tree.setdefault(parent, list()).append(child)
-        for t in tree:
-            self.__rec(tree, t)
+            if isinstance(spec, GroupSpec):
+                self.__validators[dt] = GroupValidator(spec, self)
+            else:
+                self.__validators[dt] = DatasetValidator(spec, self)
+        # a data type can be validated as any of its subtypes
         self.__valid_types = dict()
-        self.__validators = dict()
-        for dt, children in tree.items():
-            _list = list()
-            for t in children:
-                spec = self.__ns.get_spec(t)
-                if isinstance(spec, GroupSpec):
-                    val = GroupValidator(spec, self)
-                else:
-                    val = DatasetValidator(spec, self)
-                if t == dt:
-                    self.__validators[t] = val
-                _list.append(val)
-            self.__valid_types[dt] = tuple(_list)
-
-    def __rec(self, tree, node):
-        if isinstance(tree[node], tuple):
-            return tree[node]
-        sub_types = {node}
-        for child in tree[node]:
-            sub_types.update(self.__rec(tree, child))
-        tree[node] = tuple(sub_types)
-        return tree[node]
+        for dt in types:
+            children = (dt,) + ns.catalog.get_subtypes(dt)
+            self.__valid_types[dt] = tuple(self.__validators[t] for t in children)
 
     @property
     def namespace(self):
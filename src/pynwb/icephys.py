@@ -8,6 +8,7 @@ from . import register_class, CORE_NAMESPACE
 from .base import TimeSeries, _default_resolution, _default_conversion
 from .core import NWBContainer, DynamicTable, ElementIdentifiers
 from .device import Device
+from .query import Column
 
 
 @register_class('IntracellularElectrode', CORE_NAMESPACE)
@@ -477,4 +478,4 @@ class SweepTable(DynamicTable):
         Return the row ids for the given sweep number.
         """
 
-        return [index for index, elem in enumerate(self['sweep_number'].data) if elem == sweep_number]
+        return self.query(Column('sweep_number') == sweep_number).tolist()
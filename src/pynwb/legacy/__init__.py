@@ -2,28 +2,36 @@
 from ..form.spec import NamespaceCatalog
 from ..form.utils import docval, getargs
 from ..spec import NWBDatasetSpec, NWBGroupSpec, NWBNamespace
-from .. import _get_resources, get_type_map, NWBContainer
+from .. import _get_resources, _get_cache_dir, get_type_map as __get_core_type_map, NWBContainer
 
 from .map import ObjectMapperLegacy as ObjectMapper
 from .map import TypeMapLegacy as TypeMap
 
 
-__NS_CATALOG = NamespaceCatalog(NWBGroupSpec, NWBDatasetSpec, NWBNamespace)
-__TYPE_MAP = TypeMap(__NS_CATALOG)
-
-# load the core namespace i.e. base NWB specification
-__resources = _get_resources()
-__TYPE_MAP.load_namespaces(__resources['namespace_path'])
-__TYPE_MAP.merge(get_type_map())
-
-# Register new ObjectMapper with the new TypeMap:
-__TYPE_MAP.register_map(NWBContainer, ObjectMapper)
+# the legacy TypeMap is only created when it is first needed, so that
+# importing pynwb does not pay for loading the specification a second time
+global __TYPE_MAP
+__TYPE_MAP = None
 
 
 def get_type_map(**kwargs):
     """
     Get a TypeMap to use for I/O for Allen Institute Brain Observatory files (NWB v1.0.6)
+
+    The TypeMap is created the first time this function is called.
     """
+    global __TYPE_MAP
+    if __TYPE_MAP is None:
+        type_map = TypeMap(NamespaceCatalog(NWBGroupSpec, NWBDatasetSpec, NWBNamespace))
+        # load the core namespace i.e. base NWB specification
+        type_map.load_namespaces(_get_resources()['namespace_path'], cache_dir=_get_cache_dir())
+        # only copy the core types, since extensions may have been registered with the core TypeMap by now
+        type_map.copy_mappers(__get_core_type_map())
+        # Register new ObjectMapper with the new TypeMap:
+        type_map.register_map(NWBContainer, ObjectMapper)
+        __TYPE_MAP = type_map
+        # the legacy ObjectMappers register themselves with the legacy TypeMap on import
+        from . import io  # noqa: F401
     return __TYPE_MAP
 
 
@@ -41,12 +49,9 @@ def register_map(**kwargs):
     container_cls, mapper_cls = getargs('container_cls', 'mapper_cls', kwargs)
 
     def _dec(cls):
-        __TYPE_MAP.register_map(container_cls, cls)
+        get_type_map().register_map(container_cls, cls)
         return cls
     if mapper_cls is None:
         return _dec
     else:
         _dec(mapper_cls)
-
-
-from . import io  # noqa: F401
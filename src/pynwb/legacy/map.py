@@ -129,3 +129,6 @@ class TypeMapLegacy(TypeMap):
 
     def get_builder_ns(self, builder):
         return 'core'
+
+    def get_builder_ns_dt(self, builder):
+        return self.get_builder_ns(builder), self.get_builder_dt(builder)
@@ -226,6 +226,20 @@ class Units(DynamicTable):
         Add a unit to this table
         """
         super(Units, self).add_row(**kwargs)
+        self.__set_electrode_table()
+
+    @docval({'name': 'data', 'type': (dict, 'DataFrame', np.ndarray),
+             'doc': 'the units to add, as a dict with the values of each column, a DataFrame or a structured array'},
+            {'name': 'id', 'type': 'array_data', 'doc': 'the IDs for the units', 'default': None})
+    def add_units(self, **kwargs):
+        """
+        Add multiple units to this table at once.
+        See :py:meth:`~pynwb.core.DynamicTable.add_rows` for more details
+        """
+        call_docval_func(super(Units, self).add_rows, kwargs)
+        self.__set_electrode_table()
+
+    def __set_electrode_table(self):
         if 'electrodes' in self:
             elec_col = self['electrodes'].target
             if elec_col.table is None:
@@ -235,11 +249,14 @@ class Units(DynamicTable):
                 else:
                     elec_col.table = self.__electrode_table
 
-    @docval({'name': 'index', 'type': int,
-             'doc': 'the index of the unit in unit_ids to retrieve spike times for'})
+    @docval({'name': 'index', 'type': (int, slice, list, tuple, np.ndarray),
+             'doc': 'the index of the unit in unit_ids to retrieve spike times for, or a slice, list of indices or '
+                    'boolean mask to retrieve the spike times of multiple units'})
     def get_unit_spike_times(self, **kwargs):
         index = getargs('index', kwargs)
-        return np.asarray(self['spike_times'][index])
+        if isinstance(index, int):
+            return np.asarray(self['spike_times'][index])
+        return [np.asarray(v) for v in self['spike_times'][index]]
 
     @docval({'name': 'index', 'type': int,
              'doc': 'the index of the unit in unit_ids to retrieve observation intervals for'})
@@ -274,6 +274,20 @@ class PlaneSegmentation(DynamicTable):
             rkwargs['voxel_mask'] = voxel_mask
         return super(PlaneSegmentation, self).add_row(**rkwargs)
 
+    @docval({'name': 'data', 'type': (dict, 'DataFrame', np.ndarray),
+             'doc': 'the ROIs to add, as a dict with the values of each column, a DataFrame or a structured array'},
+            {'name': 'id', 'type': 'array_data', 'doc': 'the IDs for the ROIs', 'default': None})
+    def add_rois(self, **kwargs):
+        """
+        Add multiple ROIs to this at once. Each ROI must have an *image_mask*, *pixel_mask* or *voxel_mask*.
+        See :py:meth:`~pynwb.core.DynamicTable.add_rows` for more details
+        """
+        data, ids = getargs('data', 'id', kwargs)
+        data = self._get_columns(data)
+        if all(data.get(mask) is None for mask in ('image_mask', 'pixel_mask', 'voxel_mask')):
+            raise ValueError("Must provide 'image_mask' and/or 'pixel_mask'")
+        return super(PlaneSegmentation, self).add_rows(data, id=ids)
+
     @docval({'name': 'description', 'type': str, 'doc': 'a brief description of what the region is'},
             {'name': 'region', 'type': (slice, list, tuple), 'doc': 'the indices of the table', 'default': slice(None)},
             {'name': 'name', 'type': str, 'doc': 'the name of the ROITableRegion', 'default': 'rois'})
@@ -0,0 +1,483 @@
+'''
+Predicates for selecting the rows of a :py:class:`~pynwb.core.DynamicTable`.
+
+A predicate can be built from :py:class:`Column` objects, e.g.
+
+    (Column('sweep_number') == 3) & (Column('start_time') > 10)
+
+or parsed from a string with the same meaning, e.g.
+
+    parse("sweep_number == 3 and start_time > 10")
+
+Strings may use comparisons (including chained comparisons such as ``0 < x <= 1``), ``in`` and ``not in``
+with a list of values, and ``and``, ``or`` and ``not`` (or ``&``, ``|`` and ``~``). The values compared
+to must be literals.
+
+Predicates are evaluated over a range of rows at a time, with a function that reads the values of a column for
+that range. Only the columns a predicate refers to are read, and the right side of ``&`` (``|``) is only read if
+the left side matches some (does not match all) of the rows.
+
+If the columns a predicate refers to have a :py:class:`HashIndex` or a :py:class:`SortedIndex`, it is looked up
+in them instead, without reading the columns.
+'''
+import ast
+import operator
+from abc import ABCMeta, abstractmethod, abstractproperty
+
+import numpy as np
+import six
+from six import raise_from
+
+
+@six.add_metaclass(ABCMeta)
+class Predicate(object):
+    ''' A condition on the values of the columns of a table '''
+
+    @abstractproperty
+    def columns(self):
+        ''' The names of the columns this predicate refers to '''
+        pass
+
+    @abstractmethod
+    def evaluate(self, read):
+        '''
+        Evaluate this predicate for a range of rows, given a function that returns the values of a column
+        for those rows. Return a boolean array with the result for each row.
+        '''
+        pass
+
+    def lookup(self, indexes):
+        '''
+        Get the rows for which this predicate holds from the indexes of the columns, given as a dict with the
+        index of each indexed column. Return a sorted array of row numbers, or None if the indexes cannot be used.
+        '''
+        return None
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+
+def _is_bytes(values):
+    ''' Whether the values are bytes, as h5py reads fixed-length strings, and variable-length strings with h5py 3 '''
+    kind = values.dtype.kind
+    return kind == 'S' or (kind == 'O' and len(values) > 0 and isinstance(values.flat[0], bytes))
+
+
+def _match_value(values, value):
+    ''' Get the value to compare with the values, encoding or decoding it to match the kind of strings they are '''
+    if isinstance(value, str) and _is_bytes(values):
+        return value.encode('utf-8')
+    if isinstance(value, bytes) and not isinstance(value, str) and values.dtype.kind in 'UO' and not _is_bytes(values):
+        return value.decode('utf-8')
+    return value
+
+
+def _comparable(values, value):
+    ''' Whether the value can be compared with the values, i.e. both are numbers or both are strings '''
+    is_string = isinstance(value, (str, bytes))
+    return not ((values.dtype.kind in 'biuf' and is_string) or (values.dtype.kind in 'SU' and not is_string))
+
+
+def _compare(op, values, value, column):
+    ''' Compare each of the values of a column with the given value, making sure the result is a boolean array '''
+    values = np.asarray(values)
+    msg = "cannot compare column '%s' with %r" % (column, value)
+    if not _comparable(values, value):
+        raise ValueError(msg)
+    value = _match_value(values, value)
+    try:
+        mask = np.asarray(op(values, value), dtype=bool)
+    except TypeError:
+        raise_from(ValueError(msg), None)
+    if mask.shape != values.shape:
+        # NumPy returns a single value if the elements cannot be compared
+        raise ValueError(msg)
+    return mask
+
+
+class Comparison(Predicate):
+    ''' A comparison of the values of a column with a value '''
+
+    __ops = {
+        '==': operator.eq,
+        '!=': operator.ne,
+        '<': operator.lt,
+        '<=': operator.le,
+        '>': operator.gt,
+        '>=': operator.ge,
+    }
+
+    def __init__(self, column, op, value):
+        if op not in self.__ops:
+            raise ValueError("unsupported comparison '%s'" % op)
+        self.column = column
+        self.op = op
+        self.value = value
+
+    @property
+    def columns(self):
+        return frozenset((self.column,))
+
+    def evaluate(self, read):
+        return _compare(self.__ops[self.op], read(self.column), self.value, self.column)
+
+    def lookup(self, indexes):
+        index = indexes.get(self.column)
+        return None if index is None else index.lookup(self.op, self.value)
+
+    def __repr__(self):
+        return '(%s %s %r)' % (self.column, self.op, self.value)
+
+
+class IsIn(Predicate):
+    ''' Whether the values of a column are one of the given values '''
+
+    def __init__(self, column, values):
+        self.column = column
+        self.values = list(values)
+
+    @property
+    def columns(self):
+        return frozenset((self.column,))
+
+    def evaluate(self, read):
+        values = np.asarray(read(self.column))
+        mask = np.zeros(values.shape, dtype=bool)
+        for value in self.values:
+            mask |= _compare(operator.eq, values, value, self.column)
+        return mask
+
+    def lookup(self, indexes):
+        index = indexes.get(self.column)
+        if index is None:
+            return None
+        rows = list()
+        for value in self.values:
+            rows.append(index.lookup('==', value))
+            if rows[-1] is None:
+                return None
+        return np.unique(np.concatenate(rows)) if rows else np.zeros(0, dtype=np.int64)
+
+    def __repr__(self):
+        return '(%s in %r)' % (self.column, self.values)
+
+
+class And(Predicate):
+    ''' Whether both of two predicates hold '''
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+    @property
+    def columns(self):
+        return self.left.columns | self.right.columns
+
+    def evaluate(self, read):
+        mask = self.left.evaluate(read)
+        if not mask.any():
+            return mask
+        return mask & self.right.evaluate(read)
+
+    def lookup(self, indexes):
+        left = self.left.lookup(indexes)
+        right = self.right.lookup(indexes) if left is not None else None
+        return None if right is None else np.intersect1d(left, right, assume_unique=True)
+
+    def __repr__(self):
+        return '(%r & %r)' % (self.left, self.right)
+
+
+class Or(Predicate):
+    ''' Whether at least one of two predicates holds '''
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+    @property
+    def columns(self):
+        return self.left.columns | self.right.columns
+
+    def evaluate(self, read):
+        mask = self.left.evaluate(read)
+        if mask.all():
+            return mask
+        return mask | self.right.evaluate(read)
+
+    def lookup(self, indexes):
+        left = self.left.lookup(indexes)
+        right = self.right.lookup(indexes) if left is not None else None
+        return None if right is None else np.union1d(left, right)
+
+    def __repr__(self):
+        return '(%r | %r)' % (self.left, self.right)
+
+
+class Not(Predicate):
+    ''' Whether a predicate does not hold '''
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+    @property
+    def columns(self):
+        return self.predicate.columns
+
+    def evaluate(self, read):
+        return ~self.predicate.evaluate(read)
+
+    def __repr__(self):
+        return '~%r' % (self.predicate,)
+
+
+class Column(object):
+    ''' A column of a table, to build predicates with, e.g. ``Column('start_time') > 10`` '''
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, value):
+        return Comparison(self.name, '==', value)
+
+    def __ne__(self, value):
+        return Comparison(self.name, '!=', value)
+
+    def __lt__(self, value):
+        return Comparison(self.name, '<', value)
+
+    def __le__(self, value):
+        return Comparison(self.name, '<=', value)
+
+    def __gt__(self, value):
+        return Comparison(self.name, '>', value)
+
+    def __ge__(self, value):
+        return Comparison(self.name, '>=', value)
+
+    __hash__ = None
+
+    def isin(self, values):
+        ''' Whether the values of this column are one of the given values '''
+        return IsIn(self.name, values)
+
+    def __repr__(self):
+        return 'Column(%r)' % self.name
+
+
+class HashIndex(object):
+    '''
+    An index of the rows of a column by their value, for looking up the rows equal to a value.
+    Rows are added to the index as they are added to the table.
+    '''
+
+    kind = 'hash'
+
+    def __init__(self, values=None):
+        self.__rows = dict()    # the rows with each value, as a list of arrays of rows
+        self.__len = 0
+        self.__sample = None    # the first value, as an array of the kind of values of the column
+        if values is not None:
+            self.add(values)
+
+    def add(self, values):
+        ''' Add the values of the next rows of the column '''
+        rows = self.__rows
+        start = self.__len
+        sample = values[:1] if isinstance(values, np.ndarray) else np.asarray(list(values[:1]))
+        if self.__sample is None or len(self.__sample) == 0:
+            self.__sample = sample
+        elif len(sample) > 0 and sample.dtype.kind != self.__sample.dtype.kind:
+            self.__sample = self.__sample.astype(object)
+        if isinstance(values, np.ndarray) and values.ndim == 1 and values.dtype.kind in 'biufSU':
+            # group the rows by value with NumPy, rather than one row at a time
+            order = np.argsort(values, kind='mergesort')
+            values = values[order]
+            first = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+            for key, group in zip(values[first].tolist(), np.split(order + start, first[1:])):
+                rows.setdefault(key, list()).append(group)
+        else:
+            groups = dict()
+            for i, value in enumerate(values, start):
+                groups.setdefault(value, list()).append(i)
+            for key, group in groups.items():
+                rows.setdefault(key, list()).append(np.array(group, dtype=np.int64))
+        self.__len += len(values)
+
+    def lookup(self, op, value):
+        ''' Get the rows whose value compares to the given value, or None if the comparison is not supported '''
+        if op != '==':
+            return None
+        if self.__sample is not None:
+            if not _comparable(self.__sample, value):
+                return None     # let the column be scanned, to raise the same error
+            value = _match_value(self.__sample, value)
+        try:
+            groups = self.__rows.get(value)
+        except TypeError:   # unhashable value
+            return None
+        if groups is None:
+            return np.zeros(0, dtype=np.int64)
+        if len(groups) > 1:
+            groups[:] = [np.concatenate(groups)]
+        return groups[0].copy()
+
+    def __len__(self):
+        return self.__len
+
+
+class SortedIndex(object):
+    '''
+    An index of the rows of a column sorted by their value, for looking up the rows equal to a value or in a range.
+    Rows are added to the index as they are added to the table, and sorted into it when it is next looked up in.
+    '''
+
+    kind = 'sorted'
+
+    def __init__(self, values=None):
+        self.__keys = np.zeros(0)                   # the sorted values
+        self.__rows = np.zeros(0, dtype=np.int64)   # the row of each of the sorted values
+        self.__pending = list()                     # the values added since the index was last sorted
+        self.__len = 0
+        if values is not None:
+            self.add(values)
+            self.__sort()
+
+    def add(self, values):
+        ''' Add the values of the next rows of the column '''
+        values = np.asarray(values)
+        if len(values) > 0:
+            self.__pending.append(values)
+            self.__len += len(values)
+
+    def __sort(self):
+        if not self.__pending:
+            return
+        start = len(self.__rows)
+        values = np.concatenate(self.__pending)
+        order = np.argsort(values, kind='mergesort')
+        if start == 0:
+            keys, rows = values[order], order
+        else:
+            # merge the new values into the sorted ones, keeping rows with equal values in order
+            keys = np.concatenate((self.__keys, values[order]))
+            rows = np.concatenate((self.__rows, order + start))
+            merged = np.argsort(keys, kind='mergesort')
+            keys, rows = keys[merged], rows[merged]
+        self.__keys, self.__rows = keys, rows.astype(np.int64, copy=False)
+        self.__pending = list()
+
+    def lookup(self, op, value):
+        ''' Get the rows whose value compares to the given value, or None if the comparison is not supported '''
+        self.__sort()
+        keys = self.__keys
+        if op not in ('==', '<', '<=', '>', '>='):
+            return None
+        if isinstance(value, (float, np.floating)) and np.isnan(value):
+            return np.zeros(0, dtype=np.int64)  # nothing compares to NaN
+        if not _comparable(keys, value):
+            return None     # let the column be scanned, to raise the same error
+        value = _match_value(keys, value)
+        try:
+            if op == '==':
+                lo, hi = np.searchsorted(keys, value, 'left'), np.searchsorted(keys, value, 'right')
+            elif op == '<':
+                lo, hi = 0, np.searchsorted(keys, value, 'left')
+            elif op == '<=':
+                lo, hi = 0, np.searchsorted(keys, value, 'right')
+            elif op == '>':
+                lo, hi = np.searchsorted(keys, value, 'right'), len(keys)
+            else:
+                lo, hi = np.searchsorted(keys, value, 'left'), len(keys)
+        except TypeError:   # the value cannot be compared with the values of the column
+            return None
+        if keys.dtype.kind == 'f':
+            # NaN sorts last, and does not compare to any value
+            end = np.searchsorted(keys, np.nan, 'left')
+            lo, hi = min(lo, end), min(hi, end)
+        return np.sort(self.__rows[lo:hi])
+
+    def __len__(self):
+        return self.__len
+
+
+_comparisons = {
+    ast.Eq: '==',
+    ast.NotEq: '!=',
+    ast.Lt: '<',
+    ast.LtE: '<=',
+    ast.Gt: '>',
+    ast.GtE: '>=',
+}
+
+# the comparison to use if the column is on the right side
+_flipped = {'==': '==', '!=': '!=', '<': '>', '<=': '>=', '>': '<', '>=': '<='}
+
+
+def _column_name(node):
+    if isinstance(node, ast.Name) and node.id not in ('True', 'False', 'None'):
+        return node.id
+    return None
+
+
+def _literal(node, expr):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise ValueError("'%s' - only columns can be compared to literal values" % expr)
+
+
+def _compare_nodes(left, op, right, expr):
+    name = _column_name(left)
+    if isinstance(op, (ast.In, ast.NotIn)):
+        if name is None:
+            raise ValueError("'%s' - the left side of 'in' must be a column" % expr)
+        ret = IsIn(name, _literal(right, expr))
+        return Not(ret) if isinstance(op, ast.NotIn) else ret
+    if type(op) not in _comparisons:
+        raise ValueError("'%s' - unsupported comparison" % expr)
+    op = _comparisons[type(op)]
+    if name is not None:
+        return Comparison(name, op, _literal(right, expr))
+    name = _column_name(right)
+    if name is None:
+        raise ValueError("'%s' - a comparison must have a column on one side" % expr)
+    return Comparison(name, _flipped[op], _literal(left, expr))
+
+
+def _convert(node, expr):
+    if isinstance(node, ast.BoolOp):
+        cls = And if isinstance(node.op, ast.And) else Or
+        ret = _convert(node.values[0], expr)
+        for value in node.values[1:]:
+            ret = cls(ret, _convert(value, expr))
+        return ret
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+        cls = And if isinstance(node.op, ast.BitAnd) else Or
+        return cls(_convert(node.left, expr), _convert(node.right, expr))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+        return Not(_convert(node.operand, expr))
+    if isinstance(node, ast.Compare):
+        ret = None
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            pred = _compare_nodes(left, op, right, expr)
+            ret = pred if ret is None else And(ret, pred)
+            left = right
+        return ret
+    raise ValueError("'%s' - unsupported expression" % expr)
+
+
+def parse(expr):
+    ''' Parse a string such as ``"sweep_number == 3 and start_time > 10"`` into a :py:class:`Predicate` '''
+    try:
+        tree = ast.parse(expr.strip(), mode='eval')
+    except SyntaxError:
+        raise ValueError("'%s' - invalid expression" % expr)
+    return _convert(tree.body, expr)
@@ -10,7 +10,9 @@ import inspect
 import logging
 import os.path
 import os
+import shutil
 import sys
+import tempfile
 import traceback
 import unittest2 as unittest
 
@@ -203,22 +205,32 @@ def main():
     ch.setFormatter(formatter)
     root.addHandler(ch)
 
-    # Run unit tests for form package
-    if flags['form'] in args.suites:
-        run_test_suite("tests/unit/form_tests", "form unit tests", verbose=args.verbosity)
-
-    # Run unit tests for pynwb package
-    if flags['pynwb'] in args.suites:
-        run_test_suite("tests/unit/pynwb_tests", "pynwb unit tests", verbose=args.verbosity)
-
-    # Run example tests
-    if flags['example'] in args.suites:
-        run_example_tests()
-        validate_example_nwbs()
-
-    # Run integration tests
-    if flags['integration'] in args.suites:
-        run_integration_tests(verbose=args.verbosity)
+    # cache the core namespace in a temporary directory instead of the user's cache directory
+    cache_dir = None
+    if 'PYNWB_CACHE_DIR' not in os.environ:
+        cache_dir = tempfile.mkdtemp()
+        os.environ['PYNWB_CACHE_DIR'] = cache_dir
+
+    try:
+        # Run unit tests for form package
+        if flags['form'] in args.suites:
+            run_test_suite("tests/unit/form_tests", "form unit tests", verbose=args.verbosity)
+
+        # Run unit tests for pynwb package
+        if flags['pynwb'] in args.suites:
+            run_test_suite("tests/unit/pynwb_tests", "pynwb unit tests", verbose=args.verbosity)
+
+        # Run example tests
+        if flags['example'] in args.suites:
+            run_example_tests()
+            validate_example_nwbs()
+
+        # Run integration tests
+        if flags['integration'] in args.suites:
+            run_integration_tests(verbose=args.verbosity)
+    finally:
+        if cache_dir is not None:
+            shutil.rmtree(cache_dir, ignore_errors=True)
 
     final_message = 'Ran %s tests' % TOTAL
     exitcode = 0
@@ -3,15 +3,17 @@ import six
 from datetime import datetime
 from dateutil.tz import tzlocal, tzutc
 import os
+import threading
 from h5py import File
 
-from pynwb import NWBFile, TimeSeries, get_manager, NWBHDF5IO
+from pynwb import NWBFile, TimeSeries, get_manager, NWBHDF5IO, BuildManagerPool
 
 from pynwb.form.backends.hdf5 import HDF5IO, H5DataIO
 from pynwb.form.data_utils import DataChunkIterator
 from pynwb.form.build import GroupBuilder, DatasetBuilder
 from pynwb.form.spec import NamespaceCatalog
 from pynwb.spec import NWBGroupSpec, NWBDatasetSpec, NWBNamespace
+from pynwb.core import DynamicTable
 from pynwb.ecephys import ElectricalSeries, LFP
 
 import numpy as np
@@ -278,6 +280,126 @@ class TestAppend(unittest.TestCase):
             np.testing.assert_equal(nwb.acquisition['timeseries2'].data[:], ts2.data)
 
 
+class TestBuildManagerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.path = 'test_pynwb_manager_pool.nwb'
+        self.pool = BuildManagerPool(size=1)
+        nwbfile = NWBFile('a test NWB File', 'TEST123', datetime(1970, 1, 1, 12, tzinfo=tzutc()))
+        nwbfile.add_acquisition(TimeSeries('test_timeseries', list(range(10)), 'SIunit', rate=1.0))
+        with NWBHDF5IO(self.path, mode='w') as io:
+            io.write(nwbfile)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_reuse(self):
+        manager = self.pool.get_manager()
+        with NWBHDF5IO(self.path, mode='r', manager=manager) as io:
+            nwbfile1 = io.read()
+        self.pool.release(manager)
+        self.assertIs(self.pool.get_manager(), manager)
+        with NWBHDF5IO(self.path, mode='r', manager=manager) as io:
+            nwbfile2 = io.read()
+            self.assertEqual(nwbfile2.acquisition['test_timeseries'].data[:].tolist(), list(range(10)))
+        # the cleared manager does not return the containers read before
+        self.assertIsNot(nwbfile1, nwbfile2)
+
+    def test_new_manager(self):
+        manager1 = self.pool.get_manager()
+        manager2 = self.pool.get_manager()
+        self.assertIsNot(manager1, manager2)
+        self.assertIsNot(manager1.type_map, manager2.type_map)
+
+    def test_size(self):
+        manager1 = self.pool.get_manager()
+        manager2 = self.pool.get_manager()
+        self.pool.release(manager1)
+        self.pool.release(manager2)
+        self.assertIs(self.pool.get_manager(), manager1)
+        self.assertIsNot(self.pool.get_manager(), manager2)
+
+    def test_release_other_manager(self):
+        with self.assertRaises(ValueError):
+            self.pool.release(get_manager())
+
+
+class TestReadMaxWorkers(unittest.TestCase):
+
+    def setUp(self):
+        self.path = 'test_pynwb_read_max_workers.nwb'
+        self.n_modules = 6
+        nwbfile = NWBFile('a test NWB File', 'TEST123', datetime(1970, 1, 1, 12, tzinfo=tzutc()))
+        device = nwbfile.create_device(name='test_device')
+        e_group = nwbfile.create_electrode_group(name='test_electrode_group', description='', location='',
+                                                 device=device)
+        for i in range(4):
+            nwbfile.add_electrode(x=float(i), y=0.0, z=0.0, imp=np.nan, location='', filtering='', group=e_group)
+        # each module holds a table referring to the table of the next module, and a series of the electrodes
+        target = None
+        for i in reversed(range(self.n_modules)):
+            table = DynamicTable('table', 'a table of module %d' % i)
+            table.add_column('value', 'the values')
+            if target is not None:
+                table.add_column('next', 'rows of the next table', table=target)
+            for j in range(3):
+                row = {'value': i * 10 + j}
+                if target is not None:
+                    row['next'] = 2 - j
+                table.add_row(**row)
+            electrodes = nwbfile.create_electrode_table_region(region=[i % 4, (i + 1) % 4], description='')
+            series = ElectricalSeries(name='series', electrodes=electrodes, data=np.ones((10, 2)) * i, rate=10.0)
+            module = nwbfile.create_processing_module(name='module%d' % i, description='module %d' % i)
+            module.add_data_interface(table)
+            module.add_data_interface(series)
+            target = table
+        with NWBHDF5IO(self.path, mode='w') as io:
+            io.write(nwbfile)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def read(self, **kwargs):
+        result = dict()
+
+        def run():
+            with NWBHDF5IO(self.path, mode='r') as io:
+                nwbfile = io.read(**kwargs)
+                result['nwbfile'] = nwbfile
+                result['values'] = self.get_values(nwbfile)
+
+        # construct in another thread so that a deadlock fails the test instead of hanging it
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        thread.join(60)
+        self.assertFalse(thread.is_alive(), 'reading with max_workers=%s did not finish' % kwargs.get('max_workers'))
+        return result['nwbfile'], result['values']
+
+    def get_values(self, nwbfile):
+        ret = list()
+        for i in range(self.n_modules):
+            module = nwbfile.modules['module%d' % i]
+            table = module['table']
+            series = module['series']
+            self.assertIs(module.parent, nwbfile)
+            self.assertIs(table.parent, module)
+            self.assertIs(series.electrodes.table, nwbfile.electrodes)
+            if i < self.n_modules - 1:
+                self.assertIs(table['next'].table, nwbfile.modules['module%d' % (i + 1)]['table'])
+                ret.append(table['next'].data[:].tolist())
+            ret.append(table['value'].data[:].tolist())
+            ret.append(series.electrodes.data[:].tolist())
+            ret.append(series.data[:].tolist())
+        return ret
+
+    def test_max_workers(self):
+        expected = self.read()[1]
+        for max_workers in (2, 4, 8):
+            with self.subTest(max_workers=max_workers):
+                self.assertListEqual(self.read(max_workers=max_workers)[1], expected)
+
+
 class TestH5DataIO(unittest.TestCase):
     """
     Test that H5DataIO functions correctly on round trip with the HDF5IO backend
@@ -1,11 +1,15 @@
+import gc
+import weakref
+
 import unittest2 as unittest
+import numpy as np
 
 from pynwb.form import Container
 from pynwb.form.spec import GroupSpec, AttributeSpec, DatasetSpec, SpecCatalog, SpecNamespace, NamespaceCatalog
 from pynwb.form.spec.spec import ZERO_OR_MANY
 from pynwb.form.build import GroupBuilder, DatasetBuilder
 from pynwb.form.utils import docval, getargs
-from pynwb.form.build import ObjectMapper, BuildManager, TypeMap
+from pynwb.form.build import ObjectMapper, BuildManager, TypeMap, Profiler
 
 from abc import ABCMeta
 from six import with_metaclass
@@ -108,6 +112,20 @@ class TestBase(unittest.TestCase):
         self.type_map.register_map(Foo, ObjectMapper)
         self.manager = BuildManager(self.type_map)
 
+    def assertBuilderEqual(self, builder1, builder2):
+        ''' Compare two Builders, allowing dataset data to be backed by arrays or lists '''
+        self.assertIs(type(builder1), type(builder2))
+        self.assertEqual(builder1.name, builder2.name)
+        self.assertDictEqual(builder1.attributes, builder2.attributes)
+        if isinstance(builder1, DatasetBuilder):
+            np.testing.assert_array_equal(builder1.data, builder2.data)
+        else:
+            for key in ('groups', 'datasets', 'links'):
+                sub1, sub2 = getattr(builder1, key), getattr(builder2, key)
+                self.assertSetEqual(set(sub1.keys()), set(sub2.keys()))
+                for name in sub1:
+                    self.assertBuilderEqual(sub1[name], sub2[name])
+
 
 class TestBuildManager(TestBase):
 
@@ -123,7 +141,7 @@ class TestBuildManager(TestBase):
                     attributes={'attr2': 10})},
             attributes={'attr1': 'value1', 'namespace': CORE_NAMESPACE, 'data_type': 'Foo'})
         builder1 = self.manager.build(container_inst)
-        self.assertDictEqual(builder1, expected)
+        self.assertBuilderEqual(builder1, expected)
 
     def test_build_memoization(self):
         container_inst = Foo('my_foo', list(range(10)), 'value1', 10)
@@ -137,7 +155,7 @@ class TestBuildManager(TestBase):
             attributes={'attr1': 'value1', 'namespace': CORE_NAMESPACE, 'data_type': 'Foo'})
         builder1 = self.manager.build(container_inst)
         builder2 = self.manager.build(container_inst)
-        self.assertDictEqual(builder1, expected)
+        self.assertBuilderEqual(builder1, expected)
         self.assertIs(builder1, builder2)
 
     def test_construct(self):
@@ -155,6 +173,25 @@ class TestBuildManager(TestBase):
         self.assertEqual(container.attr1, 'value1')
         self.assertEqual(container.attr2, 10)
 
+    def test_profiler(self):
+        container_inst = Foo('my_foo', list(range(10)), 'value1', 10)
+        self.manager.profiler = Profiler()
+        self.manager.build(container_inst)
+        report = self.manager.profiler.report()
+        self.assertEqual(report['build']['Foo']['count'], 1)
+        self.assertEqual(report['convert_dtype']['Foo']['count'], 1)
+        self.assertNotIn('construct', report)
+        builder = GroupBuilder(
+            'my_foo', datasets={'my_data': DatasetBuilder(
+                'my_data',
+                list(range(10)),
+                attributes={'attr2': 10})},
+            attributes={'attr1': 'value1', 'namespace': CORE_NAMESPACE, 'data_type': 'Foo'})
+        manager = BuildManager(self.type_map)
+        manager.profiler = self.manager.profiler
+        manager.construct(builder)
+        self.assertEqual(manager.profiler.report()['construct']['Foo']['count'], 1)
+
     def test_construct_memoization(self):
         builder = GroupBuilder(
             'my_foo', datasets={'my_data': DatasetBuilder(
@@ -167,6 +204,108 @@ class TestBuildManager(TestBase):
         container2 = self.manager.construct(builder)
         self.assertIs(container1, container2)
 
+    def test_clear(self):
+        container_inst = Foo('my_foo', list(range(10)), 'value1', 10)
+        builder1 = self.manager.build(container_inst)
+        self.manager.clear()
+        builder2 = self.manager.build(container_inst)
+        self.assertIsNot(builder1, builder2)
+        self.assertIs(self.manager.construct(builder2), container_inst)
+
+    def test_build_not_kept_alive(self):
+        container_inst = Foo('my_foo', list(range(10)), 'value1', 10)
+        ref = weakref.ref(self.manager.build(container_inst))
+        gc.collect()
+        self.assertIsNotNone(ref())
+        del container_inst
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_construct_not_kept_alive(self):
+        builder = GroupBuilder(
+            'my_foo', datasets={'my_data': DatasetBuilder(
+                'my_data',
+                list(range(10)),
+                attributes={'attr2': 10})},
+            attributes={'attr1': 'value1', 'namespace': CORE_NAMESPACE, 'data_type': 'Foo'})
+        ref = weakref.ref(self.manager.construct(builder))
+        gc.collect()
+        self.assertIsNone(ref())
+        container = self.manager.construct(builder)
+        self.assertIs(self.manager.construct(builder), container)
+
+    def test_pin(self):
+        self.manager.pin()
+        ref = weakref.ref(self.manager.build(Foo('my_foo', list(range(10)), 'value1', 10)))
+        gc.collect()
+        self.assertIsNotNone(ref())
+        self.manager.unpin()
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_unpin_not_pinned(self):
+        with self.assertRaises(ValueError):
+            self.manager.unpin()
+
+
+class TestBuilderTypes(TestBase):
+
+    def setUp(self):
+        super(TestBuilderTypes, self).setUp()
+        self.builder = GroupBuilder(
+            'my_foo', datasets={'my_data': DatasetBuilder(
+                'my_data',
+                list(range(10)),
+                attributes={'attr2': 10})},
+            attributes={'attr1': 'value1', 'namespace': CORE_NAMESPACE, 'data_type': 'Foo'})
+
+    def test_get_builder_ns_dt(self):
+        self.assertTupleEqual(self.manager.get_builder_ns_dt(self.builder), (CORE_NAMESPACE, 'Foo'))
+        self.assertEqual(self.manager.get_builder_ns(self.builder), CORE_NAMESPACE)
+        self.assertEqual(self.manager.get_builder_dt(self.builder), 'Foo')
+
+    def test_get_builder_ns_dt_bytes(self):
+        builder = GroupBuilder('my_foo', attributes={'namespace': CORE_NAMESPACE.encode('UTF-8'),
+                                                     'data_type': b'Foo'})
+        self.assertTupleEqual(self.manager.get_builder_ns_dt(builder), (CORE_NAMESPACE, 'Foo'))
+
+    def test_get_builder_ns_dt_untyped(self):
+        dset = self.builder.datasets['my_data']
+        self.assertTupleEqual(self.manager.get_builder_ns_dt(dset), (None, None))
+        with self.assertRaises(ValueError):
+            self.manager.get_builder_dt(dset)
+        with self.assertRaises(ValueError):
+            self.manager.get_builder_ns(dset)
+
+    def test_get_builder_ns_dt_not_kept_alive(self):
+        self.manager.get_builder_ns_dt(self.builder)
+        ref = weakref.ref(self.builder)
+        del self.builder
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_get_map_cached(self):
+        mapper = self.type_map.get_map(self.builder)
+        self.assertIs(self.type_map.get_map(self.builder), mapper)
+        self.assertIs(self.type_map.get_cls(self.builder), Foo)
+
+    def test_get_map_register_map(self):
+        class FooMapper(ObjectMapper):
+            pass
+
+        self.type_map.get_map(self.builder)
+        self.type_map.register_map(Foo, FooMapper)
+        # ObjectMappers already constructed for a class are kept
+        self.assertIs(type(self.type_map.get_map(self.builder)), ObjectMapper)
+
+        class Bar(Foo):
+            pass
+
+        self.type_map.register_container_type(CORE_NAMESPACE, 'Foo', Bar)
+        self.type_map.register_map(Bar, FooMapper)
+        self.assertIs(self.type_map.get_cls(self.builder), Bar)
+        self.assertIs(type(self.type_map.get_map(self.builder)), FooMapper)
+
 
 class TestNestedBase(with_metaclass(ABCMeta, TestBase)):
 
@@ -206,12 +345,19 @@ class TestNestedBase(with_metaclass(ABCMeta, TestBase)):
     def test_build(self):
         ''' Test default mapping for an Container that has an Container as an attribute value '''
         builder = self.manager.build(self.foo_bucket)
-        self.assertDictEqual(builder, self.bucket_builder)
+        self.assertBuilderEqual(builder, self.bucket_builder)
 
     def test_construct(self):
         container = self.manager.construct(self.bucket_builder)
         self.assertEqual(container, self.foo_bucket)
 
+    def test_construct_max_workers(self):
+        container = self.manager.construct(self.bucket_builder, max_workers=2)
+        self.assertEqual(container, self.foo_bucket)
+        for foo in container.foos:
+            self.assertIs(foo.parent, container)
+        self.assertIs(self.manager.construct(self.bucket_builder), container)
+
 
 class TestNestedContainersNoSubgroups(TestNestedBase):
     '''
@@ -1,6 +1,9 @@
 import unittest2 as unittest
+import numpy as np
+from copy import copy
 
-from pynwb.form.spec import GroupSpec, AttributeSpec, DatasetSpec, SpecCatalog, SpecNamespace, NamespaceCatalog
+from pynwb.form.spec import GroupSpec, AttributeSpec, DatasetSpec, SpecCatalog, SpecNamespace, NamespaceCatalog, \
+    RefSpec
 from pynwb.form.build import GroupBuilder, DatasetBuilder, ObjectMapper, BuildManager, TypeMap
 from pynwb.form import Container
 from pynwb.form.utils import docval, getargs, get_docval
@@ -132,6 +135,38 @@ class TestTypeMap(unittest.TestCase):
         self.assertIs(mapper.spec, self.bar_spec)
         self.assertIsInstance(mapper, MyMap)
 
+    def test_copy(self):
+        self.type_map.register_map(Bar, ObjectMapper)
+        container_inst = Bar('my_bar', list(range(10)), 'value1', 10)
+        mapper = self.type_map.get_map(container_inst)
+        type_map = copy(self.type_map)
+        self.assertIs(type_map.get_map(container_inst), mapper)
+        self.assertEqual(type_map.get_container_cls(CORE_NAMESPACE, 'Foo'), Foo)
+        self.assertEqual(type_map.namespace_catalog.namespaces, (CORE_NAMESPACE,))
+
+    def test_copy_on_write(self):
+        class MyMap(ObjectMapper):
+            pass
+        type_map = copy(self.type_map)
+        type_map.register_map(Bar, MyMap)
+        container_inst = Bar('my_bar', list(range(10)), 'value1', 10)
+        self.assertIsInstance(type_map.get_map(container_inst), MyMap)
+        self.assertNotIsInstance(self.type_map.get_map(container_inst), MyMap)
+
+        # changes to the original are not seen by the copy either
+        self.type_map.register_map(Foo, MyMap)
+        foo_inst = Foo(name='my_foo')
+        self.assertIsInstance(self.type_map.get_map(foo_inst), MyMap)
+        self.assertNotIsInstance(type_map.get_map(foo_inst), MyMap)
+
+    def test_copy_on_write_namespaces(self):
+        type_map = copy(self.type_map)
+        namespace = SpecNamespace('another test namespace', 'test_ext', [{'source': 'test_ext.yaml'}],
+                                  catalog=SpecCatalog())
+        type_map.namespace_catalog.add_namespace('test_ext', namespace)
+        self.assertEqual(type_map.namespace_catalog.namespaces, (CORE_NAMESPACE, 'test_ext'))
+        self.assertEqual(self.namespace_catalog.namespaces, (CORE_NAMESPACE,))
+
 
 class TestDynamicContainer(unittest.TestCase):
 
@@ -247,6 +282,9 @@ class TestObjectMapperNested(TestObjectMapper):
             'data', list(range(10)), attributes={'attr2': 10})},
                                 attributes={'attr1': 'value1'})
         builder = self.mapper.build(container_inst, self.manager)
+        self.assertIsInstance(builder.datasets['data'].data, np.ndarray)
+        self.assertListEqual(builder.datasets['data'].data.tolist(), list(range(10)))
+        expected.datasets['data']['data'] = builder.datasets['data'].data
         self.assertDictEqual(builder, expected)
 
     def test_construct(self):
@@ -281,6 +319,9 @@ class TestObjectMapperNoNesting(TestObjectMapper):
         builder = self.mapper.build(container, self.manager)
         expected = GroupBuilder('my_bar', datasets={'data': DatasetBuilder('data', list(range(10)))},
                                 attributes={'attr1': 'value1', 'attr2': 10})
+        self.assertIsInstance(builder.datasets['data'].data, np.ndarray)
+        self.assertListEqual(builder.datasets['data'].data.tolist(), list(range(10)))
+        expected.datasets['data']['data'] = builder.datasets['data'].data
         self.assertDictEqual(builder, expected)
 
     def test_construct(self):
@@ -314,5 +355,52 @@ class TestObjectMapperContainer(TestObjectMapper):
         self.assertSetEqual(keys, expected)
 
 
+class TestConvertDtype(unittest.TestCase):
+
+    def test_list_to_array(self):
+        spec = DatasetSpec('an example dataset', 'int', name='data')
+        ret, ret_dtype = ObjectMapper.convert_dtype(spec, list(range(10)))
+        self.assertIsInstance(ret, np.ndarray)
+        self.assertListEqual(ret.tolist(), list(range(10)))
+        self.assertIs(ret_dtype, ret.dtype.type)
+
+    def test_nested_list_to_array(self):
+        spec = DatasetSpec('an example dataset', 'float', name='data')
+        ret, ret_dtype = ObjectMapper.convert_dtype(spec, [[1., 2.], [3., 4.]])
+        self.assertIsInstance(ret, np.ndarray)
+        self.assertTupleEqual(ret.shape, (2, 2))
+        self.assertIs(ret_dtype, np.float64)
+
+    def test_list_precision_check(self):
+        spec = DatasetSpec('an example dataset', 'uint32', name='data')
+        with self.assertRaises(ValueError):
+            ObjectMapper.convert_dtype(spec, [-1, 2, 3])
+
+    def test_ragged_list(self):
+        spec = DatasetSpec('an example dataset', 'int', name='data')
+        ret, ret_dtype = ObjectMapper.convert_dtype(spec, [[1, 2], [3]])
+        self.assertIsInstance(ret, list)
+        self.assertListEqual([r.tolist() for r in ret], [[1, 2], [3]])
+
+    def test_text_list(self):
+        spec = DatasetSpec('an example dataset', 'text', name='data')
+        ret, ret_dtype = ObjectMapper.convert_dtype(spec, ['a', b'b'])
+        self.assertListEqual(ret, ['a', 'b'])
+        self.assertEqual(ret_dtype, 'utf8')
+
+    def test_ascii_tuple(self):
+        spec = DatasetSpec('an example dataset', 'ascii', name='data')
+        ret, ret_dtype = ObjectMapper.convert_dtype(spec, ('a', 'b'))
+        self.assertTupleEqual(ret, (b'a', b'b'))
+        self.assertEqual(ret_dtype, 'ascii')
+
+    def test_reference(self):
+        spec = DatasetSpec('an example dataset', RefSpec('Bar', 'object'), name='data')
+        value = [object(), object()]
+        ret, ret_dtype = ObjectMapper.convert_dtype(spec, value)
+        self.assertIs(ret, value)
+        self.assertEqual(ret_dtype, 'object')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest2 as unittest
+import numpy as np
 
 from pynwb.form.spec import AttributeSpec, DatasetSpec, SpecCatalog, SpecNamespace, NamespaceCatalog
 from pynwb.form.build import DatasetBuilder, ObjectMapper, BuildManager, TypeMap
@@ -52,5 +53,7 @@ class TestDataMap(unittest.TestCase):
         ''' Test default mapping functionality when no attributes are nested '''
         container = Baz('my_baz', list(range(10)), 'abcdefghijklmnopqrstuvwxyz')
         builder = self.mapper.build(container, self.manager)
-        expected = DatasetBuilder('my_baz', list(range(10)), attributes={'baz_attr': 'abcdefghijklmnopqrstuvwxyz'})
+        self.assertIsInstance(builder.data, np.ndarray)
+        self.assertListEqual(builder.data.tolist(), list(range(10)))
+        expected = DatasetBuilder('my_baz', builder.data, attributes={'baz_attr': 'abcdefghijklmnopqrstuvwxyz'})
         self.assertDictEqual(builder, expected)
@@ -0,0 +1,68 @@
+import json
+
+import unittest2 as unittest
+
+from pynwb.form.build import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler()
+
+    def test_record(self):
+        event = self.profiler.start('build', 'Foo')
+        self.profiler.add_hdf5_calls(2)
+        self.profiler.stop(event, 10)
+        stats = self.profiler.report()['build']['Foo']
+        self.assertEqual(stats['count'], 1)
+        self.assertEqual(stats['bytes'], 10)
+        self.assertEqual(stats['hdf5_calls'], 2)
+        self.assertGreaterEqual(stats['time'], 0)
+
+    def test_nested(self):
+        outer = self.profiler.start('build', 'Foo')
+        inner = self.profiler.start('build', 'Bar')
+        self.profiler.add_hdf5_calls()
+        self.profiler.stop(inner)
+        self.profiler.stop(outer)
+        report = self.profiler.report()['build']
+        self.assertEqual(report['Bar']['hdf5_calls'], 1)
+        self.assertEqual(report['Foo']['hdf5_calls'], 0)
+        self.assertGreaterEqual(report['Foo']['time'], report['Bar']['time'])
+        self.assertAlmostEqual(report['Foo']['self_time'], report['Foo']['time'] - report['Bar']['time'])
+
+    def test_unstopped_nested(self):
+        outer = self.profiler.start('construct', 'Foo')
+        self.profiler.start('construct', 'Bar')
+        self.profiler.stop(outer)
+        report = self.profiler.report()['construct']
+        self.assertNotIn('Bar', report)
+        self.assertEqual(report['Foo']['count'], 1)
+
+    def test_hook(self):
+        events = list()
+        self.profiler.add_hook(lambda *args: events.append(args))
+        self.profiler.stop(self.profiler.start('write', None), 5)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0][:2], ('write', None))
+        self.assertEqual(events[0][3:], (5, 0))
+
+    def test_hook_not_callable(self):
+        with self.assertRaises(ValueError):
+            self.profiler.add_hook(1)
+
+    def test_to_json(self):
+        self.profiler.stop(self.profiler.start('write', None))
+        self.profiler.stop(self.profiler.start('write', 'Foo'))
+        report = json.loads(self.profiler.to_json())
+        self.assertSetEqual(set(report['write'].keys()), {'null', 'Foo'})
+
+    def test_reset(self):
+        self.profiler.stop(self.profiler.start('read', 'Foo'))
+        self.profiler.reset()
+        self.assertDictEqual(self.profiler.report(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,12 @@ import unittest2 as unittest
 import ruamel.yaml as yaml
 import json
 import os
+import shutil
+import tempfile
 
-from pynwb.form.spec import AttributeSpec, DatasetSpec, GroupSpec, SpecNamespace, NamespaceCatalog
+from pynwb.form.spec import AttributeSpec, DatasetSpec, GroupSpec, SpecNamespace, NamespaceCatalog, NamespaceBuilder
+from pynwb.form.spec.write import JSONSpecWriter
+from pynwb.form.spec.convert import convert_namespace_to_json
 
 
 class TestSpecLoad(unittest.TestCase):
@@ -112,3 +116,92 @@ class TestSpecLoad(unittest.TestCase):
         src_dsets = {s.name for s in self.ext_datasets}
         ext_dsets = {s.name for s in es_spec.datasets}
         self.assertSetEqual(src_dsets, ext_dsets)
+
+    def test_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            self.ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+            cache_files = os.listdir(cache_dir)
+            self.assertEqual(len(cache_files), 1)
+            catalog = NamespaceCatalog()
+            deps = catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+            self.assertDictEqual(deps, {self.NS_NAME: {}})
+            self.assertTupleEqual(catalog.namespaces, (self.NS_NAME,))
+            self.assertTupleEqual(catalog.get_hierarchy(self.NS_NAME, 'SpikeData'), ('SpikeData', 'EphysData'))
+            self.assertEqual(catalog.get_spec(self.NS_NAME, 'SpikeData'),
+                             self.ns_catalog.get_spec(self.NS_NAME, 'SpikeData'))
+            self.assertListEqual(os.listdir(cache_dir), cache_files)
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_cache_invalidated(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            self.ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+            old_files = os.listdir(cache_dir)
+            with open(self.specs_path, 'a') as tmp:
+                tmp.write('# a change to the specification\n')
+            catalog = NamespaceCatalog()
+            catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+            self.assertTupleEqual(catalog.namespaces, (self.NS_NAME,))
+            cache_files = os.listdir(cache_dir)
+            self.assertEqual(len(cache_files), 1)
+            self.assertNotEqual(cache_files, old_files)
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_cache_pruned(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            self.ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+            old_files = os.listdir(cache_dir)
+            name = os.path.splitext(os.path.basename(self.namespace_path))[0]
+            # cache files of other namespace files and of other environments are kept
+            others = ['other-%s.pkl' % ('0' * 40), '%s-py27-p2-%s-%s.pkl' % (name, 'a' * 12, '0' * 40)]
+            for other in others:
+                open(os.path.join(cache_dir, other), 'w').close()
+            with open(self.specs_path, 'a') as tmp:
+                tmp.write('# a change to the specification\n')
+            NamespaceCatalog().load_namespaces(self.namespace_path, cache_dir=cache_dir)
+            cache_files = os.listdir(cache_dir)
+            self.assertEqual(len(cache_files), 3)
+            for other in others:
+                self.assertIn(other, cache_files)
+            self.assertNotIn(old_files[0], cache_files)
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_cache_not_used_for_nonempty_catalog(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            self.ns_catalog.add_namespace('other', SpecNamespace('another namespace', 'other', list()))
+            self.ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+            self.assertListEqual(os.listdir(cache_dir), list())
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_convert_to_json(self):
+        outdir = tempfile.mkdtemp()
+        try:
+            json_path = convert_namespace_to_json(self.namespace_path, outdir=outdir)
+            self.assertEqual(json_path, os.path.join(outdir, 'test_load_namespace.namespace.json'))
+            self.assertTrue(os.path.exists(os.path.join(outdir, 'test_load_namespace.specs.json')))
+            catalog = NamespaceCatalog()
+            catalog.load_namespaces(json_path)
+            self.ns_catalog.load_namespaces(self.namespace_path)
+            for dt in ('EphysData', 'SpikeData', 'VoltageArray'):
+                with self.subTest(dt=dt):
+                    self.assertEqual(catalog.get_spec(self.NS_NAME, dt), self.ns_catalog.get_spec(self.NS_NAME, dt))
+        finally:
+            shutil.rmtree(outdir)
+
+    def test_json_writer(self):
+        outdir = tempfile.mkdtemp()
+        try:
+            ns_builder = NamespaceBuilder('a test namespace', 'json_ns')
+            ns_builder.add_spec('json_ns.specs.json', GroupSpec('A test group', data_type_def='JSONData'))
+            ns_builder.export('json_ns.namespace.json', writer=JSONSpecWriter(outdir=outdir))
+            self.ns_catalog.load_namespaces(os.path.join(outdir, 'json_ns.namespace.json'))
+            self.assertEqual(self.ns_catalog.get_spec('json_ns', 'JSONData').doc, 'A test group')
+        finally:
+            shutil.rmtree(outdir)
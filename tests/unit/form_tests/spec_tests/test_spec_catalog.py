@@ -44,6 +44,30 @@ class SpecCatalogTest(unittest.TestCase):
         self.assertTupleEqual(lfp_hierarchy, ('LFPData', 'EphysData'))
         self.assertTupleEqual(ephys_hierarchy, ('EphysData',))
 
+    def test_subtypes(self):
+        spikes_spec = DatasetSpec('my extending dataset', 'int',
+                                  data_type_inc='EphysData',
+                                  data_type_def='SpikeData')
+        sorted_spec = DatasetSpec('my extending extended dataset', 'int',
+                                  data_type_inc='SpikeData',
+                                  data_type_def='SortedSpikeData')
+
+        self.catalog.register_spec(self.spec, 'test.yaml')
+        self.catalog.register_spec(spikes_spec, 'test.yaml')
+        self.assertTupleEqual(self.catalog.get_subtypes('EphysData'), ('SpikeData',))
+
+        # registering a spec updates the index
+        self.catalog.register_spec(sorted_spec, 'test.yaml')
+        self.assertTupleEqual(self.catalog.get_subtypes('EphysData'), ('SpikeData', 'SortedSpikeData'))
+        self.assertTupleEqual(self.catalog.get_subtypes('EphysData', recursive=False), ('SpikeData',))
+        self.assertTupleEqual(self.catalog.get_subtypes('SortedSpikeData'), tuple())
+        self.assertTupleEqual(self.catalog.get_hierarchy('SortedSpikeData'),
+                              ('SortedSpikeData', 'SpikeData', 'EphysData'))
+
+    def test_unregistered_type(self):
+        self.assertTupleEqual(self.catalog.get_hierarchy('EphysData'), ('EphysData',))
+        self.assertTupleEqual(self.catalog.get_subtypes('EphysData'), tuple())
+
     def test_get_spec_source_file(self):
         spikes_spec = GroupSpec('test group',
                                 data_type_def='SpikeData')
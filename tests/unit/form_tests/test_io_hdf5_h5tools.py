@@ -1,10 +1,12 @@
 import os
+import sys
 import unittest2 as unittest
 
 from pynwb.form.data_utils import DataChunkIterator
 from pynwb.form.backends.hdf5.h5tools import HDF5IO
 from pynwb.form.backends.hdf5 import H5DataIO
-from pynwb.form.build import DatasetBuilder
+from pynwb.form.build import GroupBuilder, DatasetBuilder, LinkBuilder, Profiler
+from pynwb.form.spec import namespace
 from pynwb.form.spec.namespace import NamespaceCatalog
 from h5py import SoftLink, HardLink, ExternalLink, File
 from pynwb.file import NWBFile
@@ -354,6 +356,39 @@ class H5IOTest(unittest.TestCase):
         self.assertListEqual(self.f['test_dataset'][:].tolist(),
                              self.f['test_copy'][:].tolist())
 
+    def test_profile_write_read(self):
+        profiler = Profiler()
+        self.io.manager.profiler = profiler
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', np.arange(10, dtype='int64'), attributes={}))
+        stats = profiler.report()['write'][None]
+        self.assertEqual(stats['count'], 1)
+        self.assertEqual(stats['bytes'], 80)
+        self.io.read_builder()
+        self.assertEqual(profiler.report()['read'][None]['bytes'], 80)
+
+    def test_profile_write_error(self):
+        profiler = Profiler()
+        self.io.manager.profiler = profiler
+        link = LinkBuilder(DatasetBuilder('target', [1]), 'link')
+        with self.assertRaises(ValueError):
+            self.io.write_group(self.f, GroupBuilder('test_group', links={'link': link}))
+        self.assertEqual(profiler.report()['write'][None]['count'], 2)
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', np.arange(10, dtype='int64'), attributes={}))
+        stats = profiler.report()['write'][None]
+        self.assertEqual(stats['count'], 3)
+        self.assertEqual(stats['bytes'], 80)
+
+    def test_read_builder_deep_nesting(self):
+        depth = sys.getrecursionlimit() + 100
+        group = self.f
+        for i in range(depth):
+            group = group.create_group('level')
+        group.create_dataset('data', data=np.arange(10))
+        builder = self.io.read_builder()
+        for i in range(depth):
+            builder = builder.groups['level']
+        self.assertListEqual(builder.datasets['data'].data[:].tolist(), list(range(10)))
+
     def test_list_fill_empty(self):
         dset = self.io.__list_fill__(self.f, 'empty_dataset', [], options={'dtype': int, 'io_settings': {}})
         self.assertTupleEqual(dset.shape, (0,))
@@ -365,7 +400,7 @@ class H5IOTest(unittest.TestCase):
 
 class TestCacheSpec(unittest.TestCase):
 
-    def test_cache_spec(self):
+    def setUp(self):
         self.test_temp_file = tempfile.NamedTemporaryFile()
         # On Windows h5py cannot truncate an open file in write mode.
         # The temp file will be closed before h5py truncates it
@@ -391,15 +426,58 @@ class TestCacheSpec(unittest.TestCase):
         # Write the first file
         self.io.write(nwbfile1, cache_spec=True)
         self.io.close()
-        ns_catalog = NamespaceCatalog(group_spec_cls=NWBGroupSpec,
-                                      dataset_spec_cls=NWBDatasetSpec,
-                                      spec_namespace_cls=NWBNamespace)
+
+    def tearDown(self):
+        if os.path.exists(self.test_temp_file.name):
+            os.remove(self.test_temp_file.name)
+
+    def __get_catalog(self):
+        return NamespaceCatalog(group_spec_cls=NWBGroupSpec,
+                                dataset_spec_cls=NWBDatasetSpec,
+                                spec_namespace_cls=NWBNamespace)
+
+    def test_cache_spec(self):
+        ns_catalog = self.__get_catalog()
         NWBHDF5IO.load_namespaces(ns_catalog, self.test_temp_file.name)
         self.assertEqual(ns_catalog.namespaces, ('core',))
         source_types = self.__get_types(self.io.manager.namespace_catalog)
         read_types = self.__get_types(ns_catalog)
         self.assertSetEqual(source_types, read_types)
 
+    def test_cache_spec_reused(self):
+        ns_catalog1 = self.__get_catalog()
+        NWBHDF5IO.load_namespaces(ns_catalog1, self.test_temp_file.name)
+        ns_catalog2 = self.__get_catalog()
+        with File(self.test_temp_file.name, 'r') as f:
+            NWBHDF5IO.load_namespaces(ns_catalog2, self.test_temp_file.name, file=f)
+            # the file passed in is left open
+            self.assertTrue(bool(f))
+        self.assertIs(ns_catalog2.get_namespace('core'), ns_catalog1.get_namespace('core'))
+        self.assertSetEqual(self.__get_types(ns_catalog2), self.__get_types(ns_catalog1))
+        self.assertTupleEqual(ns_catalog2.get_namespace_sources('core'), ns_catalog1.get_namespace_sources('core'))
+
+    def test_cache_spec_memo_cleared(self):
+        ns_catalog1 = self.__get_catalog()
+        NWBHDF5IO.load_namespaces(ns_catalog1, self.test_temp_file.name)
+        NamespaceCatalog.clear_namespace_memo()
+        ns_catalog2 = self.__get_catalog()
+        NWBHDF5IO.load_namespaces(ns_catalog2, self.test_temp_file.name)
+        self.assertIsNot(ns_catalog2.get_namespace('core'), ns_catalog1.get_namespace('core'))
+        self.assertSetEqual(self.__get_types(ns_catalog2), self.__get_types(ns_catalog1))
+
+    def test_cache_spec_memo_bounded(self):
+        NamespaceCatalog.clear_namespace_memo()
+        size = namespace._NAMESPACE_MEMO_SIZE
+        namespace._NAMESPACE_MEMO_SIZE = 0
+        try:
+            ns_catalog1 = self.__get_catalog()
+            NWBHDF5IO.load_namespaces(ns_catalog1, self.test_temp_file.name)
+            ns_catalog2 = self.__get_catalog()
+            NWBHDF5IO.load_namespaces(ns_catalog2, self.test_temp_file.name)
+        finally:
+            namespace._NAMESPACE_MEMO_SIZE = size
+        self.assertIsNot(ns_catalog2.get_namespace('core'), ns_catalog1.get_namespace('core'))
+
     def __get_types(self, catalog):
         types = set()
         for ns_name in catalog.namespaces:
@@ -1,7 +1,9 @@
+import gc
+import sys
 import unittest2 as unittest
 from six import text_type
 
-from pynwb.form.utils import docval, fmt_docval_args
+from pynwb.form.utils import docval, fmt_docval_args, walk_generators, WeakIdentityMap
 
 
 class MyTestClass(object):
@@ -318,5 +320,81 @@ class TestDocValidator(unittest.TestCase):
             method(self, arg1=[[1, 1]])
 
 
+class TestWalkGenerators(unittest.TestCase):
+
+    def test_order(self):
+        visited = list()
+
+        def visit(name, children):
+            visited.append(name)
+            for child_name, grandchildren in children:
+                yield visit(child_name, grandchildren)
+            visited.append('/' + name)
+
+        walk_generators(visit('a', [('b', [('c', [])]), ('d', [])]))
+        self.assertListEqual(visited, ['a', 'b', 'c', '/c', '/b', 'd', '/d', '/a'])
+
+    def test_deep(self):
+        depth = sys.getrecursionlimit() + 100
+        visited = list()
+
+        def visit(level):
+            if level < depth:
+                yield visit(level + 1)
+            visited.append(level)
+
+        walk_generators(visit(0))
+        self.assertListEqual(visited, list(range(depth, -1, -1)))
+
+    def test_error_closes_generators(self):
+        closed = list()
+
+        def visit(name, children):
+            try:
+                for child_name, grandchildren in children:
+                    yield visit(child_name, grandchildren)
+                if name == 'c':
+                    raise ValueError(name)
+            finally:
+                closed.append(name)
+
+        with self.assertRaises(ValueError):
+            walk_generators(visit('a', [('b', [('c', [])])]))
+        self.assertListEqual(closed, ['c', 'b', 'a'])
+
+
+class TestWeakIdentityMap(unittest.TestCase):
+
+    class Obj(object):
+        pass
+
+    def test_identity(self):
+        a, b = self.Obj(), self.Obj()
+        wmap = WeakIdentityMap()
+        wmap[a] = 1
+        self.assertIn(a, wmap)
+        self.assertNotIn(b, wmap)
+        self.assertEqual(wmap.get(a), 1)
+        self.assertIsNone(wmap.get(b))
+
+    def test_weak_keys(self):
+        a = self.Obj()
+        wmap = WeakIdentityMap()
+        wmap[a] = 1
+        del a
+        gc.collect()
+        self.assertEqual(len(wmap), 0)
+
+    def test_weak_values(self):
+        a, value = self.Obj(), self.Obj()
+        wmap = WeakIdentityMap(weak_values=True)
+        wmap[a] = value
+        self.assertIs(wmap.get(a), value)
+        del value
+        gc.collect()
+        self.assertNotIn(a, wmap)
+        self.assertEqual(len(wmap), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+import unittest2 as unittest
+import numpy as np
+
+from pynwb.form.data_utils import ArrayBuffer
+
+
+class ArrayBufferTests(unittest.TestCase):
+
+    def test_empty(self):
+        buf = ArrayBuffer()
+        self.assertEqual(len(buf), 0)
+        self.assertIsNone(buf.dtype)
+        self.assertListEqual(buf.data, list())
+
+    def test_append(self):
+        buf = ArrayBuffer()
+        for i in range(100):
+            buf.append(i)
+        self.assertEqual(len(buf), 100)
+        self.assertEqual(buf.dtype, np.asarray(0).dtype)
+        np.testing.assert_array_equal(buf.data, np.arange(100))
+
+    def test_extend(self):
+        buf = ArrayBuffer([0, 1])
+        buf.extend(np.arange(2, 50))
+        buf.extend(range(50, 60))
+        np.testing.assert_array_equal(buf.data, np.arange(60))
+
+    def test_widen_dtype(self):
+        buf = ArrayBuffer([1, 2])
+        buf.append(2.5)
+        self.assertEqual(buf.dtype, np.float64)
+        np.testing.assert_array_equal(buf.data, [1.0, 2.0, 2.5])
+
+    def test_not_numbers(self):
+        buf = ArrayBuffer([1, 2])
+        buf.append('a')
+        self.assertIsNone(buf.dtype)
+        self.assertListEqual(buf.data, [1, 2, 'a'])
+        self.assertListEqual(buf[[0, 2]], [1, 'a'])
+
+    def test_getitem_view(self):
+        buf = ArrayBuffer([1.0, 2.0, 3.0])
+        view = buf[1:]
+        view[0] = 5.0
+        self.assertEqual(buf[1], 5.0)
+        self.assertIs(np.asarray(buf).base, buf.data.base)
+
+    def test_eq(self):
+        self.assertEqual(ArrayBuffer([1, 2, 3]), [1, 2, 3])
+        self.assertEqual(ArrayBuffer(['a', 'b']), ['a', 'b'])
+        self.assertNotEqual(ArrayBuffer([1, 2, 3]), [1, 2])
+        self.assertNotEqual(ArrayBuffer([1, 2, 3]), [1, 2, 4])
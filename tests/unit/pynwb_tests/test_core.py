@@ -1,6 +1,9 @@
 import unittest2 as unittest
+import numpy as np
 
-from pynwb.core import DynamicTable, VectorData, ElementIdentifiers, NWBTable
+from pynwb.core import DynamicTable, DynamicTableRegion, VectorData, VectorIndex, ElementIdentifiers, NWBTable, \
+    _get_rows
+from pynwb.form.data_utils import ArrayBuffer
 from pynwb import NWBFile, TimeSeries, available_namespaces
 
 import pandas as pd
@@ -98,6 +101,68 @@ class TestDynamicTable(unittest.TestCase):
         self.add_rows(table)
         self.check_table(table)
 
+    def test_add_row_buffered(self):
+        table = self.with_spec()
+        self.add_rows(table)
+        self.assertIsInstance(table.id.data, ArrayBuffer)
+        self.assertIsInstance(table['foo'].data, ArrayBuffer)
+        self.assertEqual(table['foo'].data.dtype, np.asarray(1).dtype)
+        self.assertEqual(table['bar'].data.dtype, np.float64)
+        # strings are kept in a list
+        self.assertIsNone(table['baz'].data.dtype)
+
+    def test_add_rows_dict(self):
+        table = self.with_spec()
+        table.add_rows({'foo': [1, 2, 3, 4, 5], 'bar': [10.0, 20.0, 30.0, 40.0, 50.0],
+                        'baz': ['cat', 'dog', 'bird', 'fish', 'lizard']})
+        self.check_table(table)
+
+    def test_add_rows_dataframe(self):
+        table = self.with_spec()
+        df = pd.DataFrame({'foo': self.data[0], 'bar': self.data[1], 'baz': self.data[2]},
+                          index=pd.Index([0, 1, 2, 3, 4], name='id'))
+        table.add_rows(df)
+        self.check_table(table)
+
+    def test_add_rows_structured_array(self):
+        table = self.with_spec()
+        arr = np.array(list(zip(*self.data)), dtype=[('foo', int), ('bar', float), ('baz', 'U6')])
+        table.add_rows(arr)
+        self.check_table(table)
+
+    def test_add_rows_ids(self):
+        table = self.with_spec()
+        self.add_rows(table)
+        table.add_rows({'foo': [6, 7], 'bar': [60.0, 70.0], 'baz': ['cow', 'pig']})
+        table.add_rows({'foo': [8], 'bar': [80.0], 'baz': ['hen']}, id=[10])
+        self.assertEqual(table.id.data, [0, 1, 2, 3, 4, 5, 6, 10])
+        self.assertEqual(table['foo'].data, [1, 2, 3, 4, 5, 6, 7, 8])
+
+    def test_add_rows_ragged(self):
+        table = self.with_spec()
+        table.add_column('qux', 'qux column', index=True)
+        table.add_row({'foo': 1, 'bar': 10.0, 'baz': 'cat', 'qux': [1, 2]})
+        table.add_rows({'foo': [2, 3], 'bar': [20.0, 30.0], 'baz': ['dog', 'bird'], 'qux': [[3], [4, 5, 6]]})
+        self.assertEqual(table['qux'].target.data, [1, 2, 3, 4, 5, 6])
+        self.assertEqual(table['qux'].data, [2, 3, 6])
+        np.testing.assert_array_equal(table['qux'][2], [4, 5, 6])
+
+    def test_add_rows_length_mismatch(self):
+        table = self.with_spec()
+        with self.assertRaisesRegex(ValueError, "all columns must have the same number of rows"):
+            table.add_rows({'foo': [1, 2], 'bar': [10.0], 'baz': ['cat', 'dog']})
+
+    def test_add_rows_missing_column(self):
+        table = self.with_spec()
+        with self.assertRaises(ValueError):
+            table.add_rows({'foo': [1, 2], 'bar': [10.0, 20.0]})
+
+    def test_append_array(self):
+        col = VectorData('foo', 'foo column', data=np.arange(3))
+        col.append(3)
+        col.extend([4, 5])
+        np.testing.assert_array_equal(col[:], np.arange(6))
+
     def test_get_item(self):
         table = self.with_spec()
         self.add_rows(table)
@@ -130,11 +195,42 @@ class TestDynamicTable(unittest.TestCase):
     def test_getitem_list_idx(self):
         table = self.with_spec()
         self.add_rows(table)
-        row = table[[0, 2, 4]]
-        self.assertEqual(len(row), 3)
-        self.assertEqual(row[0], (0, 1, 10.0, 'cat'))
-        self.assertEqual(row[1], (2, 3, 30.0, 'bird'))
-        self.assertEqual(row[2], (4, 5, 50.0, 'lizard'))
+        df = table[[0, 2, 4]]
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(list(df.index), [0, 2, 4])
+        self.assertEqual(list(df['foo']), [1, 3, 5])
+        self.assertEqual(list(df['bar']), [10.0, 30.0, 50.0])
+        self.assertEqual(list(df['baz']), ['cat', 'bird', 'lizard'])
+
+    def test_getitem_slice(self):
+        table = self.with_spec()
+        self.add_rows(table)
+        df = table[1:4]
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(list(df.index), [1, 2, 3])
+        self.assertEqual(list(df['baz']), ['dog', 'bird', 'fish'])
+
+    def test_getitem_array_idx(self):
+        table = self.with_spec()
+        self.add_rows(table)
+        df = table[np.array([4, 0])]
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(list(df.index), [4, 0])
+        self.assertEqual(list(df['foo']), [5, 1])
+        df = table[np.array([False, True, False, True, False])]
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(list(df.index), [1, 3])
+        self.assertEqual(list(df['baz']), ['dog', 'fish'])
+
+    def test_getitem_list_idx_ragged(self):
+        table = self.with_spec()
+        table.add_column('qux', 'qux column', index=True)
+        table.add_rows({'foo': [1, 2, 3], 'bar': [10.0, 20.0, 30.0], 'baz': ['cat', 'dog', 'bird'],
+                        'qux': [[1, 2], [], [3, 4, 5]]})
+        df = table[[2, 0]]
+        self.assertEqual(list(df['baz']), ['bird', 'cat'])
+        np.testing.assert_array_equal(df['qux'][2], [3, 4, 5])
+        np.testing.assert_array_equal(df['qux'][0], [1, 2])
 
     def test_getitem_point_idx_colname(self):
         table = self.with_spec()
@@ -180,6 +276,58 @@ class TestDynamicTable(unittest.TestCase):
         obtained_df = table.to_dataframe()
         assert expected_df.equals(obtained_df)
 
+    def test_from_dataframe_dtypes(self):
+        df = pd.DataFrame({
+            'foo': np.arange(5, dtype=np.int16),
+            'bar': np.arange(5, dtype=np.float32),
+            'baz': ['cat', 'dog', 'bird', 'fish', 'lizard']
+        }, columns=['foo', 'bar', 'baz'])
+        table = DynamicTable.from_dataframe(df, 'test')
+        self.assertEqual(table['foo'].data.dtype, np.int16)
+        self.assertEqual(table['bar'].data.dtype, np.float32)
+        self.assertEqual(table['baz'].data, ['cat', 'dog', 'bird', 'fish', 'lizard'])
+        self.assertEqual(table.id.data.dtype, df.index.values.dtype)
+
+    def test_from_dataframe_ragged(self):
+        df = pd.DataFrame({'qux': [np.array([1, 2]), np.array([], dtype=int), np.array([3, 4, 5])]})
+        table = DynamicTable.from_dataframe(df, 'test', columns=[{'name': 'qux', 'index': True}])
+        self.assertEqual(table['qux'].target.data, [1, 2, 3, 4, 5])
+        self.assertEqual(table['qux'].data, [2, 2, 5])
+        np.testing.assert_array_equal(table['qux'][2], [3, 4, 5])
+        self.assertEqual(table.id.data, [0, 1, 2])
+
+    def test_to_dataframe_columns_rows(self):
+        table = self.with_columns_and_data()
+        obtained_df = table.to_dataframe(columns=['baz', 'foo'], rows=[4, 0])
+        expected_df = pd.DataFrame({'baz': ['lizard', 'cat'], 'foo': [5, 1]},
+                                   index=pd.Index(name='id', data=[4, 0]), columns=['baz', 'foo'])
+        self.assertTrue(expected_df.equals(obtained_df))
+        obtained_df = table.to_dataframe(rows=slice(1, 3))
+        self.assertEqual(list(obtained_df.index), [1, 2])
+        self.assertEqual(list(obtained_df['bar']), [20.0, 30.0])
+        obtained_df = table.to_dataframe(rows=np.array([True, False, False, False, True]))
+        self.assertEqual(list(obtained_df['baz']), ['cat', 'lizard'])
+
+    def test_to_dataframe_bad_column(self):
+        table = self.with_columns_and_data()
+        with self.assertRaises(KeyError):
+            table.to_dataframe(columns=['qux'])
+
+    def test_to_dataframe_ragged(self):
+        table = self.with_spec()
+        table.add_column('qux', 'qux column', index=True)
+        table.add_rows({'foo': [1, 2, 3], 'bar': [10.0, 20.0, 30.0], 'baz': ['cat', 'dog', 'bird'],
+                        'qux': [[1, 2], [], [3, 4, 5]]})
+        obtained_df = table.to_dataframe(columns=['qux'], rows=[2, 0])
+        np.testing.assert_array_equal(obtained_df['qux'][2], [3, 4, 5])
+        np.testing.assert_array_equal(obtained_df['qux'][0], [1, 2])
+        obtained_df = table.to_dataframe(columns=['foo', 'qux'], ragged='bounds')
+        self.assertEqual(list(obtained_df.columns), ['foo', 'qux_start', 'qux_stop'])
+        self.assertEqual(list(obtained_df['qux_start']), [0, 2, 2])
+        self.assertEqual(list(obtained_df['qux_stop']), [2, 2, 5])
+        with self.assertRaises(ValueError):
+            table.to_dataframe(ragged='arrow')
+
     def test_from_dataframe(self):
         df = pd.DataFrame({
             'foo': [1, 2, 3, 4, 5],
@@ -203,6 +351,173 @@ class TestDynamicTable(unittest.TestCase):
             table.add_row({'bar': 60.0, 'foo': 6, 'baz': 'oryx', 'qax': -1}, None)
 
 
+class TestVectorIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.target = VectorData('foo', 'foo column', data=np.arange(10))
+        self.index = VectorIndex('foo_index', [2, 2, 5, 10], target=self.target)
+
+    def check_vectors(self, vectors, expected):
+        self.assertEqual(len(vectors), len(expected))
+        for v, e in zip(vectors, expected):
+            np.testing.assert_array_equal(v, e)
+
+    def test_getitem_slice(self):
+        self.check_vectors(self.index[:], [[0, 1], [], [2, 3, 4], [5, 6, 7, 8, 9]])
+        self.check_vectors(self.index[1:3], [[], [2, 3, 4]])
+        self.check_vectors(self.index[::-2], [[5, 6, 7, 8, 9], []])
+        self.assertEqual(self.index[2:2], [])
+
+    def test_getitem_views(self):
+        vectors = self.index[2:4]
+        self.assertIs(vectors[0].base, vectors[1].base)
+
+    def test_getitem_list(self):
+        self.check_vectors(self.index[[3, 0, -2]], [[5, 6, 7, 8, 9], [0, 1], [2, 3, 4]])
+        self.check_vectors(self.index[np.array([False, True, True, False])], [[], [2, 3, 4]])
+
+    def test_getitem_list_target(self):
+        index = VectorIndex('bar_index', [1, 3], target=VectorData('bar', 'bar column', data=['a', 'b', 'c']))
+        self.assertEqual(index[:], [['a'], ['b', 'c']])
+
+    def test_getitem_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.index[[4]]
+
+    def test_get_ragged(self):
+        offsets, values = self.index.get_ragged(slice(1, 4))
+        np.testing.assert_array_equal(offsets, [0, 0, 3, 8])
+        np.testing.assert_array_equal(values, np.arange(2, 10))
+        offsets, values = self.index.get_ragged([3, 0])
+        np.testing.assert_array_equal(offsets, [0, 5, 7])
+        np.testing.assert_array_equal(values, [5, 6, 7, 8, 9, 0, 1])
+        offsets, values = self.index.get_ragged([])
+        np.testing.assert_array_equal(offsets, [0])
+        self.assertEqual(len(values), 0)
+
+
+class TestGetRows(unittest.TestCase):
+
+    class Dataset(object):
+        ''' An array that records the slices it is read with, like an h5py.Dataset '''
+
+        def __init__(self, data):
+            self.data = data
+            self.reads = list()
+
+        def __len__(self):
+            return len(self.data)
+
+        def __getitem__(self, arg):
+            self.reads.append(arg)
+            return self.data[arg]
+
+    def test_coalesced(self):
+        dset = self.Dataset(np.arange(100000))
+        rows = np.array([50000, 10, 12, 10, 99999, 11])
+        np.testing.assert_array_equal(_get_rows(dset, rows), rows)
+        self.assertEqual(dset.reads, [slice(10, 13), slice(50000, 50001), slice(99999, 100000)])
+
+    def test_list(self):
+        self.assertEqual(_get_rows(['a', 'b', 'c'], np.array([2, 0])), ['c', 'a'])
+        self.assertEqual(_get_rows(['a', 'b', 'c'], slice(1, None)), ['b', 'c'])
+
+
+class TestDynamicTableRegion(unittest.TestCase):
+
+    def setUp(self):
+        columns = [VectorData('foo', 'foo column', data=[1, 2, 3, 4, 5]),
+                   VectorData('bar', 'bar column', data=['cat', 'dog', 'bird', 'fish', 'lizard'])]
+        self.table = DynamicTable('table', 'a test table', columns=columns)
+        self.region = DynamicTableRegion('region', [4, 0, 2], 'a test region', self.table)
+
+    def test_getitem_int(self):
+        self.assertEqual(self.region[0], (4, 5, 'lizard'))
+
+    def test_getitem_slice(self):
+        df = self.region[1:]
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(df.index.tolist(), [0, 2])
+        self.assertEqual(df['bar'].tolist(), ['cat', 'bird'])
+
+    def test_getitem_list(self):
+        self.assertEqual(self.region[[2, 0]]['foo'].tolist(), [3, 5])
+        self.assertEqual(self.region[np.array([True, False, True])]['foo'].tolist(), [5, 3])
+
+    def test_getitem_column(self):
+        self.assertEqual(self.region[0, 'bar'], 'lizard')
+        self.assertEqual(list(self.region[:2, 'bar']), ['lizard', 'cat'])
+
+    def test_join(self):
+        region = DynamicTableRegion('region', [4, 0, 4], 'a test region', self.table)
+        table = DynamicTable('other', 'another test table', columns=[region])
+        df = table.join('region', other_columns=['bar'])
+        self.assertEqual(df.columns.tolist(), ['region', 'region_bar'])
+        self.assertEqual(df['region'].tolist(), [4, 0, 4])
+        self.assertEqual(df['region_bar'].tolist(), ['lizard', 'cat', 'lizard'])
+        self.assertEqual(table.join('region', rows=slice(1, 2))['region_foo'].tolist(), [1])
+
+    def test_getitem_region_column(self):
+        region = DynamicTableRegion('region', [4, 0, 4], 'a test region', self.table)
+        table = DynamicTable('other', 'another test table', columns=[region])
+        df = table[[2, 1], 'region']
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(df.index.tolist(), [4, 0])
+        self.assertEqual(df['bar'].tolist(), ['lizard', 'cat'])
+
+    def test_out_of_range(self):
+        with self.assertRaises(IndexError):
+            DynamicTableRegion('region', [0, 5], 'a test region', self.table)
+        with self.assertRaises(IndexError):
+            DynamicTableRegion('region', [-1], 'a test region', self.table)
+
+
+class TestGroupBy(unittest.TestCase):
+
+    def setUp(self):
+        columns = [VectorData('cond', 'cond column', data=['a', 'b', 'a', 'c', 'b', 'a']),
+                   VectorData('n', 'n column', data=[1, 2, 1, 1, 2, 2]),
+                   VectorData('x', 'x column', data=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0])]
+        self.table = DynamicTable('table', 'a test table', columns=columns)
+
+    def test_groupby(self):
+        groups = self.table.groupby('cond', chunk_size=4)
+        self.assertEqual(list(groups.keys()), ['a', 'b', 'c'])
+        np.testing.assert_array_equal(groups['a'], [0, 2, 5])
+        np.testing.assert_array_equal(groups['b'], [1, 4])
+        np.testing.assert_array_equal(groups['c'], [3])
+
+    def test_groupby_columns(self):
+        groups = self.table.groupby(['cond', 'n'], chunk_size=4)
+        self.assertEqual(list(groups.keys()), [('a', 1), ('a', 2), ('b', 2), ('c', 1)])
+        np.testing.assert_array_equal(groups[('a', 1)], [0, 2])
+
+    def test_aggregate(self):
+        df = self.table.aggregate('cond', {'count': ('x', 'count'), 'sum': ('x', 'sum'), 'mean': ('x', 'mean'),
+                                           'min': ('x', 'min'), 'max': ('n', 'max')}, chunk_size=4)
+        self.assertEqual(df.index.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(df.columns.tolist(), ['count', 'sum', 'mean', 'min', 'max'])
+        self.assertEqual(df['count'].tolist(), [3, 2, 1])
+        self.assertEqual(df['sum'].tolist(), [10.0, 7.0, 4.0])
+        self.assertEqual(df['mean'].tolist(), [10.0 / 3, 3.5, 4.0])
+        self.assertEqual(df['min'].tolist(), [1.0, 2.0, 4.0])
+        self.assertEqual(df['max'].tolist(), [2, 2, 1])
+
+    def test_aggregate_columns(self):
+        df = self.table.aggregate(['cond', 'n'], {'sum': ('x', 'sum')}, chunk_size=2)
+        expected = self.table.to_dataframe().groupby(['cond', 'n'])['x'].sum()
+        self.assertEqual(df.index.tolist(), expected.index.tolist())
+        self.assertEqual(df['sum'].tolist(), expected.tolist())
+
+    def test_aggregate_bad_column(self):
+        with self.assertRaises(ValueError):
+            self.table.aggregate('n', {'sum': ('cond', 'sum')})
+        with self.assertRaises(ValueError):
+            self.table.aggregate('n', {'sum': ('x', 'median')})
+        with self.assertRaises(KeyError):
+            self.table.aggregate('m', {'sum': ('x', 'sum')})
+
+
 class TestNWBTable(unittest.TestCase):
 
     def setUp(self):
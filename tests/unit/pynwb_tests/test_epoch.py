@@ -49,6 +49,20 @@ class TimeIntervalsTest(unittest.TestCase):
         self.assertIs(obtained.loc[3, 'timeseries'][1], df.loc[3, 'timeseries'][1])
         self.assertEqual(obtained.loc[2, 'foo'], df.loc[2, 'foo'])
 
+    def test_add_intervals(self):
+        tstamps = np.arange(1.0, 100.0, 0.1, dtype=np.float)
+        ts = TimeSeries("test_ts", list(range(len(tstamps))), 'unit', timestamps=tstamps)
+        ept = TimeIntervals('epochs', "TimeIntervals unittest")
+        ept.add_interval(10.0, 20.0, ["test", "unittest", "pynwb"], ts)
+        ept.add_intervals({'start_time': [30.0, 40.0], 'stop_time': [35.0, 45.0],
+                           'tags': ["a, b", ["c"]], 'timeseries': [ts, [ts, ts]]})
+        self.assertEqual(ept.id.data, [0, 1, 2])
+        self.assertEqual(ept['start_time'].data, [10.0, 30.0, 40.0])
+        self.assertEqual(list(ept['tags'][1]), ["a", "b"])
+        self.assertEqual(list(ept['tags'][2]), ["c"])
+        self.assertEqual(list(ept['timeseries'][1]), [(290, 50, ts)])
+        self.assertEqual(list(ept['timeseries'][2]), [(390, 50, ts), (390, 50, ts)])
+
     def test_no_tags(self):
         nwbfile = NWBFile("a file with header data", "NB123A", datetime(1970, 1, 1, tzinfo=tz.tzutc()))
         df = self.get_dataframe()
@@ -237,6 +237,57 @@ class NWBFileTest(unittest.TestCase):
         self.assertEqual(self.nwbfile.ec_electrodes[0][6], 'none')
         self.assertEqual(self.nwbfile.ec_electrodes[0][7], group)
 
+    def test_add_electrodes(self):
+        dev1 = self.nwbfile.create_device('dev1')
+        group = self.nwbfile.create_electrode_group('tetrode1',
+                                                    'tetrode description', 'tetrode location', dev1)
+        self.nwbfile.add_electrodes({'x': [1.0, 4.0], 'y': [2.0, 5.0], 'z': [3.0, 6.0], 'imp': [-1.0, -2.0],
+                                     'location': ['CA1', 'CA3'], 'filtering': ['none', 'none'],
+                                     'group': [group, group]}, id=[1, 2])
+        self.assertEqual(len(self.nwbfile.electrodes), 2)
+        self.assertEqual(self.nwbfile.ec_electrodes[1][0], 2)
+        self.assertEqual(self.nwbfile.ec_electrodes[1][1], 4.0)
+        self.assertEqual(self.nwbfile.ec_electrodes[1][5], 'CA3')
+        self.assertEqual(self.nwbfile.ec_electrodes[1][7], group)
+        self.assertEqual(self.nwbfile.ec_electrodes[1][8], 'tetrode1')
+
+    def test_join_units_electrodes(self):
+        dev1 = self.nwbfile.create_device('dev1')
+        group = self.nwbfile.create_electrode_group('tetrode1',
+                                                    'tetrode description', 'tetrode location', dev1)
+        self.nwbfile.add_electrodes({'x': [1.0, 4.0, 7.0], 'y': [2.0, 5.0, 8.0], 'z': [3.0, 6.0, 9.0],
+                                     'imp': [-1.0, -2.0, -3.0], 'location': ['CA1', 'CA3', 'CA1'],
+                                     'filtering': ['none', 'none', 'none'], 'group': [group, group, group]})
+        self.nwbfile.add_unit(id=10, spike_times=[1.0, 2.0], electrodes=[0, 2])
+        self.nwbfile.add_unit(id=11, spike_times=[3.0], electrodes=[1])
+        df = self.nwbfile.units.join('electrodes', columns=['spike_times'], other_columns=['location', 'group'])
+        self.assertEqual(df.index.tolist(), [10, 10, 11])
+        self.assertEqual(df.columns.tolist(), ['spike_times', 'electrodes', 'electrodes_location',
+                                               'electrodes_group'])
+        self.assertEqual(df['electrodes'].tolist(), [0, 2, 1])
+        self.assertEqual(df['electrodes_location'].tolist(), ['CA1', 'CA1', 'CA3'])
+        self.assertIs(df['electrodes_group'].iloc[2], group)
+        self.assertEqual(self.nwbfile.units.join('electrodes', rows=[1])['electrodes_imp'].tolist(), [-2.0])
+
+    def test_units_electrodes_ragged(self):
+        dev1 = self.nwbfile.create_device('dev1')
+        group = self.nwbfile.create_electrode_group('tetrode1',
+                                                    'tetrode description', 'tetrode location', dev1)
+        self.nwbfile.add_electrodes({'x': [1.0, 4.0, 7.0], 'y': [2.0, 5.0, 8.0], 'z': [3.0, 6.0, 9.0],
+                                     'imp': [-1.0, -2.0, -3.0], 'location': ['CA1', 'CA3', 'CA1'],
+                                     'filtering': ['none', 'none', 'none'], 'group': [group, group, group]})
+        self.nwbfile.add_unit(spike_times=[1.0, 2.0], electrodes=[0, 2])
+        self.nwbfile.add_unit(spike_times=[3.0], electrodes=[1])
+        self.nwbfile.add_unit(spike_times=[4.0], electrodes=[2, 1])
+        offsets, values = self.nwbfile.units['electrodes'].get_ragged([0, 2])
+        np.testing.assert_array_equal(offsets, [0, 2, 4])
+        np.testing.assert_array_equal(values, [0, 2, 2, 1])
+        offsets, values = self.nwbfile.units['electrodes'].get_ragged(slice(0, 2))
+        np.testing.assert_array_equal(values, [0, 2, 1])
+        df = self.nwbfile.units.to_dataframe(columns=['electrodes'], ragged='bounds')
+        self.assertEqual(df['electrodes_start'].tolist(), [0, 2, 3])
+        self.assertEqual(df['electrodes_stop'].tolist(), [2, 3, 5])
+
     def test_all_children(self):
         ts1 = TimeSeries('test_ts1', [0, 1, 2, 3, 4, 5],
                          'grams', timestamps=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5])
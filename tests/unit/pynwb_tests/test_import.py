@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import unittest2 as unittest
+
+
+class TestImport(unittest.TestCase):
+
+    def __get_imported(self, modules):
+        code = "import sys, pynwb; print(' '.join(m for m in %r if m in sys.modules))" % (modules,)
+        out = subprocess.check_output([sys.executable, '-c', code])
+        return out.decode('utf-8').split()
+
+    def test_pandas_not_imported(self):
+        self.assertListEqual(self.__get_imported(('pandas',)), list())
+
+    def test_pkg_resources_not_imported(self):
+        self.assertListEqual(self.__get_imported(('pkg_resources',)), list())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import unittest2 as unittest
+
+import pynwb
+from pynwb.base import ProcessingModule
+from pynwb.legacy.map import TypeMapLegacy
+
+
+class TestLegacyTypeMap(unittest.TestCase):
+
+    def test_not_loaded_on_import(self):
+        code = "import sys, pynwb; print('pynwb.legacy.io' in sys.modules)"
+        out = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(out.decode('utf-8').strip(), 'False')
+
+    def test_get_type_map(self):
+        type_map = pynwb.legacy.get_type_map()
+        self.assertIsInstance(type_map, TypeMapLegacy)
+        self.assertIs(pynwb.legacy.get_type_map(), type_map)
+        self.assertIn('core', type_map.namespace_catalog.namespaces)
+
+    def test_legacy_mappers_registered(self):
+        from pynwb.legacy.io.base import ModuleMap
+        mapper = pynwb.legacy.get_type_map().get_map(ProcessingModule('test_module', 'a test module'))
+        self.assertIsInstance(mapper, ModuleMap)
+
+
+if __name__ == '__main__':
+    unittest.main()
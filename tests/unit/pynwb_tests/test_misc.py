@@ -109,8 +109,18 @@ class UnitsTests(unittest.TestCase):
         self.assertEqual(ut.id.data, [0, 1])
         self.assertEqual(ut['spike_times'].target.data, [0, 1, 2, 3, 4, 5])
         self.assertEqual(ut['spike_times'].data, [3, 6])
-        self.assertEqual(ut['spike_times'][0], [0, 1, 2])
-        self.assertEqual(ut['spike_times'][1], [3, 4, 5])
+        # rows of a ragged column are views of the column
+        np.testing.assert_array_equal(ut['spike_times'][0], [0, 1, 2])
+        np.testing.assert_array_equal(ut['spike_times'][1], [3, 4, 5])
+
+    def test_add_units(self):
+        ut = Units()
+        ut.add_unit(spike_times=[0, 1, 2])
+        ut.add_units({'spike_times': [[3, 4, 5], [6]]})
+        self.assertEqual(ut.id.data, [0, 1, 2])
+        self.assertEqual(ut['spike_times'].target.data, [0, 1, 2, 3, 4, 5, 6])
+        self.assertEqual(ut['spike_times'].data, [3, 6, 7])
+        np.testing.assert_array_equal(ut['spike_times'][2], [6])
 
     def test_get_spike_times(self):
         ut = Units()
@@ -119,6 +129,14 @@ class UnitsTests(unittest.TestCase):
         self.assertTrue(all(ut.get_unit_spike_times(0) == np.array([0, 1, 2])))
         self.assertTrue(all(ut.get_unit_spike_times(1) == np.array([3, 4, 5])))
 
+    def test_get_spike_times_multiple(self):
+        ut = Units()
+        ut.add_units({'spike_times': [[0, 1, 2], [3, 4, 5], [6]]})
+        spike_times = ut.get_unit_spike_times([2, 0])
+        self.assertEqual(len(spike_times), 2)
+        np.testing.assert_array_equal(spike_times[0], [6])
+        np.testing.assert_array_equal(spike_times[1], [0, 1, 2])
+
     def test_times(self):
         ut = Units()
         ut.add_unit(spike_times=[0, 1, 2])
@@ -217,6 +217,27 @@ class PlaneSegmentationConstructor(unittest.TestCase):
         self.assertEqual(pS['voxel_mask'][0], vox_mask[0:3])
         self.assertEqual(pS['voxel_mask'][1], vox_mask[3:5])
 
+    def test_add_rois(self):
+        pix_mask = [[1, 2, 1.0], [3, 4, 1.0], [5, 6, 1.0],
+                    [7, 8, 2.0], [9, 10, 2.0]]
+
+        iSS, ip = self.getBoilerPlateObjects()
+
+        pS = PlaneSegmentation('description', ip, 'test_name', iSS)
+        pS.add_rois({'pixel_mask': [pix_mask[0:3], pix_mask[3:5]]})
+
+        self.assertEqual(pS.id.data, [0, 1])
+        self.assertEqual(pS['pixel_mask'].target.data, pix_mask)
+        self.assertEqual(pS['pixel_mask'][0], pix_mask[0:3])
+        self.assertEqual(pS['pixel_mask'][1], pix_mask[3:5])
+
+    def test_add_rois_no_mask(self):
+        iSS, ip = self.getBoilerPlateObjects()
+
+        pS = PlaneSegmentation('description', ip, 'test_name', iSS)
+        with self.assertRaises(ValueError):
+            pS.add_rois({})
+
     def test_init_3d_image_mask(self):
         img_masks = np.random.randn(2, 20, 30, 4)
 
@@ -0,0 +1,223 @@
+import unittest2 as unittest
+import numpy as np
+
+from pynwb.core import DynamicTable, DynamicTableRegion, VectorData
+from pynwb.query import Predicate, Column, Comparison, And, Or, Not, IsIn, HashIndex, SortedIndex, parse
+
+
+class TestParse(unittest.TestCase):
+
+    def test_comparison(self):
+        pred = parse('foo == 3')
+        self.assertIsInstance(pred, Comparison)
+        self.assertEqual((pred.column, pred.op, pred.value), ('foo', '==', 3))
+
+    def test_flipped(self):
+        pred = parse('3 < foo')
+        self.assertEqual((pred.column, pred.op, pred.value), ('foo', '>', 3))
+
+    def test_chained(self):
+        pred = parse('0 < foo <= 1.5')
+        self.assertIsInstance(pred, And)
+        self.assertEqual((pred.left.column, pred.left.op, pred.left.value), ('foo', '>', 0))
+        self.assertEqual((pred.right.column, pred.right.op, pred.right.value), ('foo', '<=', 1.5))
+
+    def test_bool_ops(self):
+        self.assertIsInstance(parse('foo == 1 and bar > 2'), And)
+        self.assertIsInstance(parse('(foo == 1) | (bar > 2)'), Or)
+        self.assertIsInstance(parse('not foo == 1'), Not)
+        self.assertEqual(parse('foo == 1 and bar > 2 or baz == "cat"').columns, {'foo', 'bar', 'baz'})
+
+    def test_in(self):
+        pred = parse("baz in ['cat', 'dog']")
+        self.assertIsInstance(pred, IsIn)
+        self.assertEqual(pred.values, ['cat', 'dog'])
+        self.assertIsInstance(parse("baz not in ('cat',)"), Not)
+
+    def test_invalid(self):
+        for expr in ('foo', 'foo == bar', 'foo + 1 == 2', '__import__("os")', 'foo ==', 'foo is None'):
+            with self.assertRaises(ValueError):
+                parse(expr)
+
+
+class TestPredicate(unittest.TestCase):
+
+    def test_abstract(self):
+        class NoEvaluate(Predicate):
+
+            @property
+            def columns(self):
+                return ('x',)
+
+        with self.assertRaises(TypeError):
+            NoEvaluate()
+
+
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.table = DynamicTable('test', 'a test table', columns=[
+            {'name': 'foo', 'description': 'foo column'},
+            {'name': 'bar', 'description': 'bar column'},
+            {'name': 'baz', 'description': 'baz column'},
+        ])
+        self.table.add_rows({'foo': [1, 2, 3, 4, 5],
+                             'bar': [10.0, 20.0, 30.0, 40.0, 50.0],
+                             'baz': ['cat', 'dog', 'bird', 'fish', 'lizard']})
+
+    def test_query_string(self):
+        np.testing.assert_array_equal(self.table.query('foo >= 2 and bar < 50'), [1, 2, 3])
+        np.testing.assert_array_equal(self.table.query('foo == 1 or baz == "fish"'), [0, 3])
+        np.testing.assert_array_equal(self.table.query("baz not in ['cat', 'dog']"), [2, 3, 4])
+        np.testing.assert_array_equal(self.table.query('id > 3'), [4])
+
+    def test_query_predicate(self):
+        pred = (Column('foo') > 1) & ~Column('baz').isin(['bird'])
+        np.testing.assert_array_equal(self.table.query(pred), [1, 3, 4])
+
+    def test_query_chunks(self):
+        for chunk_size in (1, 2, 3, 100):
+            np.testing.assert_array_equal(self.table.query('foo != 3', chunk_size=chunk_size), [0, 1, 3, 4])
+
+    def test_query_no_match(self):
+        ret = self.table.query('foo > 10')
+        self.assertEqual(len(ret), 0)
+
+    def test_query_reads_needed_columns(self):
+        read = list()
+
+        class Pred(Comparison):
+            def evaluate(self, read_column):
+                read.append(self.column)
+                return super(Pred, self).evaluate(read_column)
+
+        self.table.query(Pred('foo', '>', 10) & Pred('bar', '>', 0))
+        self.assertEqual(read, ['foo'])
+
+    def test_query_region(self):
+        region = self.table.query('foo > 3', region='big')
+        self.assertIsInstance(region, DynamicTableRegion)
+        self.assertEqual(region.name, 'big')
+        self.assertEqual(region.data, [3, 4])
+        self.assertIs(region.table, self.table)
+
+    def test_query_bad_column(self):
+        with self.assertRaises(KeyError):
+            self.table.query('qux > 3')
+
+    def test_query_indexed_column(self):
+        self.table.add_column('qux', 'qux column', data=[1, 2, 3, 4, 5], index=[1, 2, 3, 4, 5])
+        with self.assertRaises(ValueError):
+            self.table.query('qux > 3')
+
+    def test_query_type_mismatch(self):
+        columns = [VectorData('foo', 'foo column', data=[1.0, 2.0]), VectorData('baz', 'baz column', data=['a', 'b'])]
+        table = DynamicTable('mismatch', 'a test table', columns=columns)
+        for expr in ('foo == "a"', 'foo < "a"', 'baz == 3', 'baz > 3'):
+            with self.assertRaises(ValueError):
+                table.query(expr)
+
+    def test_query_bytes(self):
+        # h5py reads fixed-length strings, and variable-length strings with h5py 3, as bytes
+        for data in (np.array([b'cat', b'dog', b'cat']), np.array([b'cat', b'dog', b'cat'], dtype=object)):
+            table = DynamicTable('bytes', 'a table of bytes', columns=[VectorData('name', 'name column', data=data)])
+            np.testing.assert_array_equal(table.query('name == "cat"'), [0, 2])
+            np.testing.assert_array_equal(table.query("name in ['dog']"), [1])
+
+
+class TestHashIndex(unittest.TestCase):
+
+    def test_lookup(self):
+        index = HashIndex(np.array([3, 1, 3, 2]))
+        index.add(['a', 3])
+        np.testing.assert_array_equal(index.lookup('==', 3), [0, 2, 5])
+        np.testing.assert_array_equal(index.lookup('==', 'a'), [4])
+        self.assertEqual(len(index.lookup('==', 7)), 0)
+        self.assertIsNone(index.lookup('<', 3))
+        self.assertIsNone(index.lookup('==', [3]))
+        self.assertEqual(len(index), 6)
+
+
+class TestSortedIndex(unittest.TestCase):
+
+    def test_lookup(self):
+        index = SortedIndex([3.0, 1.0, 3.0, 2.0])
+        index.add([0.5, 3.0])
+        np.testing.assert_array_equal(index.lookup('==', 3.0), [0, 2, 5])
+        np.testing.assert_array_equal(index.lookup('<', 2.0), [1, 4])
+        np.testing.assert_array_equal(index.lookup('<=', 2.0), [1, 3, 4])
+        np.testing.assert_array_equal(index.lookup('>', 2.0), [0, 2, 5])
+        np.testing.assert_array_equal(index.lookup('>=', 3.0), [0, 2, 5])
+        self.assertIsNone(index.lookup('!=', 3.0))
+        self.assertEqual(len(index), 6)
+
+    def test_lookup_nan(self):
+        index = SortedIndex([1.0, np.nan, 7.0, 3.0])
+        np.testing.assert_array_equal(index.lookup('>', 2.0), [2, 3])
+        np.testing.assert_array_equal(index.lookup('>=', 7.0), [2])
+        np.testing.assert_array_equal(index.lookup('<', 10.0), [0, 2, 3])
+        for op in ('==', '<', '<=', '>', '>='):
+            self.assertEqual(len(index.lookup(op, np.nan)), 0)
+
+
+class TestQueryIndex(TestQuery):
+
+    def setUp(self):
+        super(TestQueryIndex, self).setUp()
+        self.table.create_index('foo', kind='sorted')
+        self.table.create_index('baz')
+
+    def test_index_used(self):
+        def fail(read):
+            raise AssertionError('the column was read')
+
+        pred = (Column('foo') > 1) & Column('baz').isin(['cat', 'dog', 'fish'])
+        pred.evaluate = fail
+        np.testing.assert_array_equal(self.table.query(pred), [1, 3])
+
+    def test_index_updated(self):
+        self.table.add_row(foo=6, bar=60.0, baz='cat')
+        self.table.add_rows({'foo': [0, 7], 'bar': [0.0, 70.0], 'baz': ['cow', 'cat']})
+        np.testing.assert_array_equal(self.table.query('baz == "cat"'), [0, 5, 7])
+        np.testing.assert_array_equal(self.table.query('foo < 2 or foo >= 6'), [0, 5, 6, 7])
+
+    def test_query_nan(self):
+        self.table.add_row(foo=6, bar=np.nan, baz='cat')
+        self.table.create_index('bar', kind='sorted')
+        np.testing.assert_array_equal(self.table.query('bar > 25.0'), [2, 3, 4])
+        np.testing.assert_array_equal(self.table.query(Column('bar') < np.nan), [])
+
+    def test_query_index_type_mismatch(self):
+        for expr in ('foo == "a"', 'baz == 3', 'baz in [3]'):
+            with self.assertRaises(ValueError):
+                self.table.query(expr)
+
+    def test_query_index_bytes(self):
+        for data in (np.array([b'cat', b'dog', b'cat']), np.array([b'cat', b'dog', b'cat'], dtype=object)):
+            table = DynamicTable('bytes', 'a table of bytes', columns=[VectorData('name', 'name column', data=data)])
+            for kind in ('hash', 'sorted'):
+                table.create_index('name', kind=kind)
+                np.testing.assert_array_equal(table.query('name == "cat"'), [0, 2])
+                np.testing.assert_array_equal(table.query("name in ['dog']"), [1])
+
+    def test_create_index_id(self):
+        self.table.create_index('id')
+        np.testing.assert_array_equal(self.table.query('id == 3'), [3])
+
+    def test_create_index_bad_kind(self):
+        with self.assertRaises(ValueError):
+            self.table.create_index('bar', kind='btree')
+
+    def test_create_index_bad_column(self):
+        with self.assertRaises(KeyError):
+            self.table.create_index('qux')
+
+    def test_drop_index(self):
+        self.table.drop_index('baz')
+        with self.assertRaises(KeyError):
+            self.table.drop_index('baz')
+        np.testing.assert_array_equal(self.table.query('baz == "dog"'), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()